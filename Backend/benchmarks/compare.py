@@ -0,0 +1,39 @@
+"""Compare two ``benchmarks.run`` result files and flag regressions.
+
+Run from the ``Backend`` directory:
+    python -m benchmarks.compare baseline.json candidate.json --threshold 1.2
+"""
+import argparse
+import json
+import sys
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--metric", default="p95_ms", help="Latency metric to compare")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Fail when candidate/baseline exceeds this ratio")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = {result["scenario"]: result for result in json.load(f)["results"]}
+    with open(args.candidate) as f:
+        candidate = {result["scenario"]: result for result in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"{'scenario':34} {'baseline':>10} {'candidate':>10} {'ratio':>7}")
+    for name, result in candidate.items():
+        if name not in baseline:
+            print(f"{name:34} {'-':>10} {result[args.metric]:>10} {'new':>7}")
+            continue
+        before, after = baseline[name][args.metric], result[args.metric]
+        ratio = after / before if before else float("inf")
+        flag = "  REGRESSION" if ratio > args.threshold else ""
+        regressions += bool(flag)
+        print(f"{name:34} {before:>10} {after:>10} {ratio:>7.2f}{flag}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
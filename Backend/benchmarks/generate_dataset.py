@@ -0,0 +1,158 @@
+"""Synthetic dataset generator: users with realistic accounts, categories and transactions.
+
+Rows are bulk-loaded with multi-row INSERTs in chunks, so millions of
+transactions load in minutes. Every generated user shares the password
+``PASSWORD`` and is named ``<prefix>_user_<n>``.
+
+Run from the ``Backend`` directory:
+    python -m benchmarks.generate_dataset --users 100 --transactions-per-user 10000
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from typing import Dict, List
+
+PASSWORD = "benchmark-password"
+
+ACCOUNT_NAMES = ["Checking", "Savings", "Credit Card", "Cash", "Brokerage"]
+CATEGORY_NAMES = [
+    "Groceries", "Rent", "Utilities", "Restaurants", "Transport", "Subscriptions", "Health",
+    "Shopping", "Travel", "Entertainment", "Education", "Gifts", "Insurance", "Salary", "Freelance",
+]
+MERCHANTS = [
+    "Supermarket", "Landlord", "Power Co", "Water Co", "Uber", "Metro", "Netflix", "Spotify", "Pharmacy",
+    "Bookstore", "Airline", "Hotel", "Cinema", "Coffee Shop", "Bakery", "Gas Station", "Employer", "Client",
+]
+
+
+def _chunks(rows: List[dict], size: int):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def generate(engine, users: int, transactions_per_user: int, years: int = 5, seed: int = 42,
+             prefix: str = "bench", chunk_size: int = 10000, verbose: bool = True) -> Dict[str, int]:
+    from sqlalchemy import insert, select
+
+    from src.core.database import SessionLocal
+    from src.core.security import pwd_context
+    from src.models.account import Account
+    from src.models.category import Category
+    from src.models.transaction import Transaction
+    from src.models.user import User
+    from src.repositories.account_repository import AccountRepository
+    from src.repositories.budget_repository import BudgetRepository
+
+    rng = random.Random(seed)
+    hashed_password = pwd_context.hash(PASSWORD)
+    today = date.today()
+    history_days = 365 * years
+    started = time.perf_counter()
+
+    def log(message):
+        if verbose:
+            print(f"[{time.perf_counter() - started:7.1f}s] {message}", flush=True)
+
+    usernames = [f"{prefix}_user_{n}" for n in range(1, users + 1)]
+    with engine.begin() as conn:
+        for chunk in _chunks([
+            {"email": f"{name}@example.com", "username": name, "hashed_password": hashed_password, "is_active": True}
+            for name in usernames
+        ], chunk_size):
+            conn.execute(insert(User), chunk)
+        generated = User.username.startswith(f"{prefix}_user_", autoescape=True)
+        user_ids = dict(conn.execute(select(User.username, User.id).where(generated)).all())
+    log(f"{len(user_ids)} users")
+
+    account_rows, category_rows = [], []
+    for name, user_id in user_ids.items():
+        for account_name in rng.sample(ACCOUNT_NAMES, rng.randint(1, 4)):
+            account_rows.append({
+                "user_id": user_id, "name": account_name,
+                "initial_balance": round(rng.uniform(0, 5000), 2), "balance": 0.0,
+            })
+        for category_name in rng.sample(CATEGORY_NAMES, rng.randint(5, 12)):
+            # Category names are unique across all users
+            category_rows.append({"user_id": user_id, "name": f"{category_name} ({name})"})
+    with engine.begin() as conn:
+        for chunk in _chunks(account_rows, chunk_size):
+            conn.execute(insert(Account), chunk)
+        for chunk in _chunks(category_rows, chunk_size):
+            conn.execute(insert(Category), chunk)
+        accounts, categories = {}, {}
+        for user_id, account_id in conn.execute(select(Account.user_id, Account.id).join(User).where(generated)):
+            accounts.setdefault(user_id, []).append(account_id)
+        for user_id, category_id in conn.execute(select(Category.user_id, Category.id).join(User).where(generated)):
+            categories.setdefault(user_id, []).append(category_id)
+    log(f"{len(account_rows)} accounts, {len(category_rows)} categories")
+
+    total = 0
+    pending: List[dict] = []
+    for user_id in user_ids.values():
+        user_accounts = accounts[user_id]
+        user_categories = categories[user_id]
+        # A few categories and the main account carry most of the activity
+        category_weights = [1 / rank for rank in range(1, len(user_categories) + 1)]
+        account_weights = [1 / rank ** 2 for rank in range(1, len(user_accounts) + 1)]
+        count = max(1, int(rng.gauss(transactions_per_user, transactions_per_user * 0.25)))
+        for _ in range(count):
+            revenue = rng.random() < 0.12
+            pending.append({
+                "user_id": user_id,
+                "account_id": rng.choices(user_accounts, account_weights)[0] if rng.random() < 0.95 else None,
+                "category_id": rng.choices(user_categories, category_weights)[0] if rng.random() < 0.9 else None,
+                "amount": round(rng.lognormvariate(7, 0.6) if revenue else rng.lognormvariate(3, 1.1), 2),
+                "transaction_type": "revenue" if revenue else "expense",
+                "description": f"{rng.choice(MERCHANTS)} #{rng.randint(1, 9999)}",
+                "source": rng.choice(MERCHANTS),
+                "date": today - timedelta(days=rng.randrange(history_days)),
+            })
+            if len(pending) >= chunk_size:
+                with engine.begin() as conn:
+                    conn.execute(insert(Transaction), pending)
+                total += len(pending)
+                pending = []
+                if total % (chunk_size * 20) == 0:
+                    log(f"{total} transactions")
+    if pending:
+        with engine.begin() as conn:
+            conn.execute(insert(Transaction), pending)
+        total += len(pending)
+    log(f"{total} transactions")
+
+    db = SessionLocal()
+    try:
+        AccountRepository(db).rebuild_balances()
+        BudgetRepository(db).rebuild_spend()
+    finally:
+        db.close()
+    log("account balances and budget counters rebuilt")
+    return {"users": len(user_ids), "accounts": len(account_rows), "categories": len(category_rows), "transactions": total}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--transactions-per-user", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=5, help="Span of transaction history")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--prefix", default="bench", help="Username prefix, to load several datasets side by side")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per INSERT")
+    parser.add_argument("--database-url", default=None, help="Defaults to DATABASE_URL")
+    args = parser.parse_args(argv)
+
+    import os
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from src.core.database import engine
+    from src.core.migrations import upgrade_database
+    from src.models import account, budget, category, recurring_transaction, transaction, user  # noqa: F401 - register tables
+
+    upgrade_database()
+    print(generate(engine, args.users, args.transactions_per_user, args.years, args.seed, args.prefix, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Concurrency load test: request throughput as the number of parallel clients grows.
+
+Each SQL statement is delayed by ``--query-delay`` seconds to stand in for the
+network and disk latency of a real database. If database calls blocked the
+event loop, throughput would stay flat no matter how many clients were added;
+with the work offloaded to the thread pool it scales until the pool is full.
+
+Run from the ``Backend`` directory:
+    python -m benchmarks.load_concurrency --concurrency 1,2,4,8,16 --query-delay 0.02
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import latency_summary, request, start_server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,2,4,8,16", help="Comma separated client counts")
+    parser.add_argument("--requests", type=int, default=20, help="Requests per client at each level")
+    parser.add_argument("--query-delay", type=float, default=0.02, help="Seconds added to every SQL statement")
+    parser.add_argument("--path", default="/accounts/", help="Authenticated GET endpoint to load")
+    parser.add_argument("--database-url", default=None, help="Defaults to a throwaway SQLite file")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="flowfinance-load-")
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(workdir, 'load.db')}"
+
+    from sqlalchemy import event
+
+    from src.core.database import engine
+    from src.main import app
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _simulate_latency(*_):
+        time.sleep(args.query_delay)
+
+    server, base_url = start_server(app)
+
+    user = {"email": "load@example.com", "username": "load", "password": "load-password"}
+    request(base_url, "POST", "/register", body=user)
+    token = request(base_url, "POST", "/token", form={"username": user["username"], "password": user["password"]})["access_token"]
+    request(base_url, "POST", "/accounts/", token, body={"name": "Checking", "initial_balance": 100})
+
+    def client(_):
+        latencies = []
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            request(base_url, "GET", args.path, token)
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+    for concurrency in [int(value) for value in args.concurrency.split(",")]:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = [latency for result in pool.map(client, range(concurrency)) for latency in result]
+        elapsed = time.perf_counter() - started
+        print(json.dumps({"path": args.path, "concurrency": concurrency, **latency_summary(latencies, elapsed)}))
+
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
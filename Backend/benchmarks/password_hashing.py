@@ -0,0 +1,53 @@
+"""Micro-benchmark: password verifications (logins) per second through the bcrypt pool.
+
+Run from the ``Backend`` directory:
+    python -m benchmarks.password_hashing --rounds 12 --logins 64
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=None, help="bcrypt cost factor (defaults to BCRYPT_ROUNDS)")
+    parser.add_argument("--logins", type=int, default=64, help="Verifications per measurement")
+    parser.add_argument("--workers", default=None, help="Comma separated pool sizes (defaults to 1..CPU count)")
+    args = parser.parse_args(argv)
+
+    if args.rounds is not None:
+        os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+    from src.core import security
+    from src.core.config import settings
+
+    cores = os.cpu_count() or 1
+    sizes = [int(value) for value in args.workers.split(",")] if args.workers else sorted({1, max(1, cores // 2), cores})
+    hashed = security.pwd_context.hash("benchmark-password")
+
+    for workers in sizes:
+        security.password_pool = security.PasswordWorkerPool(workers=workers, max_pending=args.logins)
+        # Callers are concurrent requests awaiting the pool, as in the login route
+        async def logins():
+            return await asyncio.gather(*(security.verify_password("benchmark-password", hashed) for _ in range(args.logins)))
+
+        started = time.perf_counter()
+        results = asyncio.run(logins())
+        elapsed = time.perf_counter() - started
+        assert all(results)
+        logins_per_second = args.logins / elapsed
+        print(json.dumps({
+            "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+            "workers": workers,
+            "logins": args.logins,
+            "logins_per_second": round(logins_per_second, 1),
+            "logins_per_second_per_core": round(logins_per_second / min(workers, cores), 1),
+            "ms_per_login": round(elapsed / args.logins * 1000 * min(workers, cores), 1),
+        }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Endpoint benchmark suite: latency percentiles, throughput and peak memory per scenario.
+
+Serves the application in-process against SQLite or PostgreSQL, generates a
+synthetic dataset when the database has none, drives every router and writes
+machine-readable results that ``benchmarks.compare`` can diff between commits.
+
+Run from the ``Backend`` directory:
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --database-url postgresql+psycopg2://localhost/flowfinance_bench --users 50 --transactions-per-user 20000
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+import urllib.error
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+
+from benchmarks.common import latency_summary, request, start_server
+
+IMPORT_ROWS = 500
+
+
+def _scenarios(token: str, context: dict):
+    """(name, weight, callable) triples; each callable performs one request."""
+    new_transaction = {"amount": 12.5, "transaction_type": "expense", "description": "Benchmark", "date": date.today().isoformat()}
+    import_file = json.dumps([
+        {**new_transaction, "description": f"Imported {n}", "account_id": context["account_id"]} for n in range(IMPORT_ROWS)
+    ]).encode()
+
+    def deep_page(base_url):
+        cursor = None
+        for _ in range(10):
+            page = request(base_url, "GET", "/transactions/?limit=100" + (f"&cursor={cursor}" if cursor else ""), token)
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+
+    return [
+        ("auth.login", 0.2, lambda url: request(url, "POST", "/token", form={"username": context["username"], "password": context["password"]})),
+        ("users.me", 1, lambda url: request(url, "GET", "/users/me", token)),
+        ("accounts.list", 1, lambda url: request(url, "GET", "/accounts/", token)),
+        ("accounts.get", 1, lambda url: request(url, "GET", f"/accounts/{context['account_id']}", token)),
+        ("accounts.create", 0.5, lambda url: request(url, "POST", "/accounts/", token, body={"name": "Benchmark", "initial_balance": 0})),
+        ("categories.list", 1, lambda url: request(url, "GET", "/categories/", token)),
+        ("transactions.list_first_page", 1, lambda url: request(url, "GET", "/transactions/?limit=100", token)),
+        ("transactions.list_ten_pages", 0.2, deep_page),
+        ("transactions.list_filtered", 1, lambda url: request(url, "GET", f"/transactions/?category_id={context['category_id']}&transaction_type=expense", token)),
+        ("transactions.get", 1, lambda url: request(url, "GET", f"/transactions/{context['transaction_id']}", token)),
+        ("transactions.create", 1, lambda url: request(url, "POST", "/transactions/", token, body=new_transaction)),
+        ("transactions.summary_monthly", 0.5, lambda url: request(url, "GET", "/transactions/summary?period=month&group_by=category", token)),
+        # Cached per data version, so this is mostly hits once the first request has computed it
+        ("forecast.history_5y", 0.5, lambda url: request(url, "GET", "/forecast/?months=12&history_months=60", token)),
+        ("transactions.import", 0.1, lambda url: request(url, "POST", "/transactions/import", token, files={"file": import_file})),
+        ("transactions.export", 0.1, lambda url: request(url, "GET", "/transactions/export", token, raw=True)),
+    ]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return "unknown"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None, help="Defaults to a throwaway SQLite file")
+    parser.add_argument("--users", type=int, default=10, help="Users to generate when the database has none")
+    parser.add_argument("--transactions-per-user", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=50, help="Requests per scenario at weight 1")
+    parser.add_argument("--concurrency", type=int, default=1, help="Parallel clients per scenario")
+    parser.add_argument("--scenario", action="append", help="Only run scenarios starting with this prefix")
+    parser.add_argument("--admission", action="store_true",
+                        help="Keep per-user admission limits on; they reject most import and export requests with 429")
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc (it slows every request)")
+    parser.add_argument("--output", default=None, help="Write results JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='flowfinance-bench-'), 'bench.db')}"
+    # One user replays every scenario far above the per-user rate limits
+    os.environ["ADMISSION_ENABLED"] = "true" if args.admission else "false"
+
+    from sqlalchemy import func, select
+
+    from benchmarks.generate_dataset import PASSWORD, generate
+    from src.core.database import SessionLocal, engine
+    from src.core.migrations import upgrade_database
+    from src.main import app
+    from src.models.account import Account
+    from src.models.category import Category
+    from src.models.transaction import Transaction
+    from src.models.user import User
+
+    upgrade_database()
+    username = "bench_user_1"
+    with SessionLocal() as db:
+        user = db.execute(select(User).where(User.username == username)).scalar_one_or_none()
+    if user is None:
+        generate(engine, args.users, args.transactions_per_user)
+    with SessionLocal() as db:
+        user_id = db.execute(select(User.id).where(User.username == username)).scalar_one()
+        context = {
+            "username": username,
+            "password": PASSWORD,
+            "account_id": db.execute(select(func.min(Account.id)).where(Account.user_id == user_id)).scalar_one(),
+            "category_id": db.execute(select(func.min(Category.id)).where(Category.user_id == user_id)).scalar_one(),
+            "transaction_id": db.execute(select(func.min(Transaction.id)).where(Transaction.user_id == user_id)).scalar_one(),
+        }
+        dataset = {
+            "users": db.execute(select(func.count(User.id))).scalar_one(),
+            "transactions": db.execute(select(func.count(Transaction.id))).scalar_one(),
+            "benchmark_user_transactions": db.execute(select(func.count(Transaction.id)).where(Transaction.user_id == user_id)).scalar_one(),
+        }
+
+    server, base_url = start_server(app)
+    token = request(base_url, "POST", "/token", form={"username": username, "password": PASSWORD})["access_token"]
+
+    if not args.no_memory:
+        tracemalloc.start()
+    results = []
+    for name, weight, run in _scenarios(token, context):
+        if args.scenario and not any(name.startswith(prefix) for prefix in args.scenario):
+            continue
+        iterations = max(2, int(args.iterations * weight))
+        run(base_url)  # warm-up
+
+        def client(count):
+            # Failed requests are counted by status instead of timed, so a fast
+            # 429 or 500 never lowers the percentiles
+            latencies, failures = [], Counter()
+            for _ in range(count):
+                started = time.perf_counter()
+                try:
+                    run(base_url)
+                except urllib.error.HTTPError as e:
+                    failures[str(e.code)] += 1
+                    continue
+                except Exception:
+                    failures["exception"] += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+            return latencies, failures
+
+        if not args.no_memory:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        per_client = [iterations // args.concurrency + (i < iterations % args.concurrency) for i in range(args.concurrency)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            outcomes = list(pool.map(client, per_client))
+        elapsed = time.perf_counter() - started
+        latencies = [latency for chunk, _ in outcomes for latency in chunk]
+        failures = sum((chunk for _, chunk in outcomes), Counter())
+        result = {
+            "scenario": name, "concurrency": args.concurrency, "errors": sum(failures.values()),
+            "error_statuses": dict(sorted(failures.items())), **latency_summary(latencies, elapsed),
+        }
+        if not args.no_memory:
+            result["peak_memory_kb"] = round((tracemalloc.get_traced_memory()[1] - baseline) / 1024, 1)
+        results.append(result)
+        print(json.dumps(result), flush=True)
+
+    server.should_exit = True
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "dataset": dataset,
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "admission": args.admission,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
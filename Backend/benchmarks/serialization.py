@@ -0,0 +1,75 @@
+"""Serialization benchmark: ORM + pydantic list path versus column rows + orjson.
+
+The ORM path mirrors what FastAPI did for ``List[TransactionInDB]``: hydrate
+``Transaction`` objects, validate each through the schema and JSON-encode the
+result. The fast path is ``TransactionService.get_transactions_page``.
+
+Run from the ``Backend`` directory:
+    python -m benchmarks.serialization --rows 1000,10000,100000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+
+def _best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", default="1000,10000,100000", help="Comma separated list sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    sizes = [int(value) for value in args.rows.split(",")]
+
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='flowfinance-serialization-'), 'bench.db')}"
+
+    from pydantic import TypeAdapter
+    from typing import List
+
+    from benchmarks.generate_dataset import generate
+    from src.core.database import SessionLocal, engine
+    from src.core.migrations import upgrade_database
+    from src.models import account, budget, category, recurring_transaction, transaction, user  # noqa: F401 - register tables
+    from src.models.transaction import Transaction
+    from src.schemas.transaction import TransactionFilter, TransactionInDB
+    from src.services.transaction_service import TransactionService
+
+    upgrade_database()
+    # Twice the largest size so the randomized per-user count always covers it
+    generate(engine, users=1, transactions_per_user=2 * max(sizes), verbose=False)
+    list_adapter = TypeAdapter(List[TransactionInDB])
+
+    for size in sizes:
+        def orm_path():
+            with SessionLocal() as db:
+                rows = (
+                    db.query(Transaction).filter(Transaction.user_id == 1)
+                    .order_by(Transaction.date.desc(), Transaction.id.desc()).limit(size).all()
+                )
+                return list_adapter.dump_json(list_adapter.validate_python(rows, from_attributes=True))
+
+        def fast_path():
+            with SessionLocal() as db:
+                return TransactionService(db).get_transactions_page(1, TransactionFilter(), size)
+
+        orm_seconds = _best_of(args.repeat, orm_path)
+        fast_seconds = _best_of(args.repeat, fast_path)
+        print(json.dumps({
+            "rows": size,
+            "orm_pydantic_ms": round(orm_seconds * 1000, 1),
+            "rows_orjson_ms": round(fast_seconds * 1000, 1),
+            "speedup": round(orm_seconds / fast_seconds, 2),
+        }))
+
+
+if __name__ == "__main__":
+    main()
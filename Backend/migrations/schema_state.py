@@ -0,0 +1,35 @@
+"""Introspection helpers so migrations also apply to databases first built by ``create_all``.
+
+Before migrations existed the application created its tables on startup, so
+an existing database may already contain any prefix of the schema below.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+def dialect_name() -> str:
+    return op.get_bind().dialect.name
+
+
+def has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def has_column(table: str, column: str) -> bool:
+    return column in {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def column_type(table: str, column: str) -> sa.types.TypeEngine:
+    return next(c["type"] for c in sa.inspect(op.get_bind()).get_columns(table) if c["name"] == column)
+
+
+def has_index(table: str, index: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    names = {i["name"] for i in inspector.get_indexes(table)}
+    names.update(c["name"] for c in inspector.get_unique_constraints(table))
+    return index in names
+
+
+def create_index_if_missing(index: str, table: str, columns, **kw) -> None:
+    if not has_index(table, index):
+        op.create_index(index, table, columns, **kw)
\ No newline at end of file
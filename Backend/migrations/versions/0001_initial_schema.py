@@ -0,0 +1,73 @@
+"""Initial schema: users, categories, accounts and transactions
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema_state import has_table
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_table("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("email", sa.String()),
+            sa.Column("username", sa.String()),
+            sa.Column("hashed_password", sa.String()),
+            sa.Column("is_active", sa.Boolean()),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+        op.create_index("ix_users_username", "users", ["username"], unique=True)
+
+    if not has_table("categories"):
+        op.create_table(
+            "categories",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+        )
+        op.create_index("ix_categories_id", "categories", ["id"])
+        op.create_index("ix_categories_name", "categories", ["name"], unique=True)
+
+    if not has_table("accounts"):
+        op.create_table(
+            "accounts",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("initial_balance", sa.Float(), nullable=False),
+        )
+        op.create_index("ix_accounts_id", "accounts", ["id"])
+        op.create_index("ix_accounts_name", "accounts", ["name"])
+
+    if not has_table("transactions"):
+        op.create_table(
+            "transactions",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), nullable=True),
+            sa.Column("account_id", sa.Integer(), sa.ForeignKey("accounts.id"), nullable=True),
+            sa.Column("amount", sa.Float(), nullable=False),
+            sa.Column("transaction_type", sa.String(), nullable=False),
+            sa.Column("description", sa.String(), nullable=True),
+            sa.Column("source", sa.String(), nullable=True),
+            sa.Column("date", sa.Date(), nullable=False),
+        )
+        op.create_index("ix_transactions_id", "transactions", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("transactions")
+    op.drop_table("accounts")
+    op.drop_table("categories")
+    op.drop_table("users")
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Composite indexes for per-user transaction listing and keyset pagination
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+from migrations.schema_state import create_index_if_missing
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_if_missing("ix_transactions_user_id_date_id", "transactions", ["user_id", "date", "id"])
+    create_index_if_missing("ix_transactions_user_id_category_id_date_id", "transactions", ["user_id", "category_id", "date", "id"])
+    create_index_if_missing("ix_transactions_user_id_account_id_date_id", "transactions", ["user_id", "account_id", "date", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_user_id_account_id_date_id", table_name="transactions")
+    op.drop_index("ix_transactions_user_id_category_id_date_id", table_name="transactions")
+    op.drop_index("ix_transactions_user_id_date_id", table_name="transactions")
\ No newline at end of file
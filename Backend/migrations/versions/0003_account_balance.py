@@ -0,0 +1,30 @@
+"""Stored account balance, backfilled from transaction history
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema_state import has_column
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if has_column("accounts", "balance"):
+        return
+    op.add_column("accounts", sa.Column("balance", sa.Float(), nullable=False, server_default="0"))
+    op.execute(
+        "UPDATE accounts SET balance = initial_balance + COALESCE(("
+        "SELECT SUM(CASE WHEN t.transaction_type = 'revenue' THEN t.amount ELSE -t.amount END) "
+        "FROM transactions t WHERE t.account_id = accounts.id AND t.user_id = accounts.user_id), 0)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("accounts", "balance")
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""Full-text search over transaction description and source
+
+PostgreSQL gets a GIN expression index; the search query must repeat the
+indexed expression (``SEARCH_DOCUMENT`` in src/models/transaction.py).
+SQLite gets an external-content FTS5 table kept in sync by triggers.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+from migrations.schema_state import dialect_name
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+SQLITE_TRIGGERS = (
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_insert AFTER INSERT ON transactions BEGIN "
+    "INSERT INTO transactions_fts(rowid, description, source) VALUES (new.id, new.description, new.source); END",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_delete AFTER DELETE ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description, source) "
+    "VALUES ('delete', old.id, old.description, old.source); END",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_update AFTER UPDATE OF description, source ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description, source) "
+    "VALUES ('delete', old.id, old.description, old.source); "
+    "INSERT INTO transactions_fts(rowid, description, source) VALUES (new.id, new.description, new.source); END",
+)
+
+
+def upgrade() -> None:
+    if dialect_name() == "postgresql":
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_transactions_search ON transactions "
+            "USING gin (to_tsvector('simple', coalesce(description, '') || ' ' || coalesce(source, '')))"
+        )
+    elif dialect_name() == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5("
+            "description, source, content='transactions', content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+        )
+        for statement in SQLITE_TRIGGERS:
+            op.execute(statement)
+        # Index the rows that existed before the triggers
+        op.execute("INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if dialect_name() == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_transactions_search")
+    elif dialect_name() == "sqlite":
+        for trigger in ("transactions_fts_insert", "transactions_fts_delete", "transactions_fts_update"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS transactions_fts")
\ No newline at end of file
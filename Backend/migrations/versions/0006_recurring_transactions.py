@@ -0,0 +1,56 @@
+"""Recurring transaction rules and the occurrence key on transactions
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema_state import create_index_if_missing, dialect_name, has_column, has_table
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_table("recurring_transactions"):
+        op.create_table(
+            "recurring_transactions",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id"), nullable=True),
+            sa.Column("account_id", sa.Integer(), sa.ForeignKey("accounts.id"), nullable=True),
+            sa.Column("amount", sa.Float(), nullable=False),
+            sa.Column("transaction_type", sa.String(), nullable=False),
+            sa.Column("description", sa.String(), nullable=True),
+            sa.Column("source", sa.String(), nullable=True),
+            sa.Column("interval", sa.String(), nullable=False),
+            sa.Column("interval_count", sa.Integer(), nullable=False),
+            sa.Column("anchor_date", sa.Date(), nullable=False),
+            sa.Column("end_date", sa.Date(), nullable=True),
+            sa.Column("materialized_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("next_date", sa.Date(), nullable=True),
+        )
+        op.create_index("ix_recurring_transactions_id", "recurring_transactions", ["id"])
+        op.create_index("ix_recurring_transactions_user_id", "recurring_transactions", ["user_id"])
+        op.create_index("ix_recurring_transactions_next_date_id", "recurring_transactions", ["next_date", "id"])
+
+    if not has_column("transactions", "recurring_id"):
+        # SQLite cannot add a constraint to an existing table (and does not enforce it by default)
+        foreign_key = [] if dialect_name() == "sqlite" else [sa.ForeignKey("recurring_transactions.id", ondelete="SET NULL")]
+        op.add_column("transactions", sa.Column("recurring_id", sa.Integer(), *foreign_key, nullable=True))
+    if not has_column("transactions", "occurrence_date"):
+        op.add_column("transactions", sa.Column("occurrence_date", sa.Date(), nullable=True))
+    create_index_if_missing(
+        "uq_transactions_recurring_id_occurrence_date", "transactions", ["recurring_id", "occurrence_date"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_transactions_recurring_id_occurrence_date", table_name="transactions")
+    op.drop_column("transactions", "occurrence_date")
+    op.drop_column("transactions", "recurring_id")
+    op.drop_table("recurring_transactions")
\ No newline at end of file
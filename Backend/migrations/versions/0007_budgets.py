@@ -0,0 +1,59 @@
+"""Budgets and per-category spend counters, backfilled from transaction history
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema_state import dialect_name, has_table
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+SQLITE_PERIOD_STARTS = {
+    "week": "date(date, 'weekday 0', '-6 days')",
+    "month": "strftime('%Y-%m-01', date)",
+    "year": "strftime('%Y-01-01', date)",
+}
+
+
+def upgrade() -> None:
+    if not has_table("budgets"):
+        op.create_table(
+            "budgets",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("period", sa.String(8), nullable=False),
+            sa.Column("amount", sa.Float(), nullable=False),
+            sa.UniqueConstraint("user_id", "category_id", "period", name="uq_budgets_user_id_category_id_period"),
+        )
+        op.create_index("ix_budgets_id", "budgets", ["id"])
+
+    if has_table("category_spend"):
+        return
+    op.create_table(
+        "category_spend",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("period", sa.String(8), primary_key=True),
+        sa.Column("period_start", sa.Date(), primary_key=True),
+        sa.Column("spent", sa.Float(), nullable=False),
+    )
+    for period, sqlite_start in SQLITE_PERIOD_STARTS.items():
+        start = sqlite_start if dialect_name() == "sqlite" else f"CAST(date_trunc('{period}', date) AS DATE)"
+        op.execute(
+            "INSERT INTO category_spend (user_id, category_id, period, period_start, spent) "
+            f"SELECT user_id, category_id, '{period}', {start}, SUM(amount) FROM transactions "
+            "WHERE transaction_type = 'expense' AND category_id IS NOT NULL "
+            f"GROUP BY user_id, category_id, {start}"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("category_spend")
+    op.drop_table("budgets")
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Index the owner column of accounts and categories
+
+Every account and category read filters on ``user_id``.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+from migrations.schema_state import create_index_if_missing
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_if_missing("ix_accounts_user_id", "accounts", ["user_id"])
+    create_index_if_missing("ix_categories_user_id", "categories", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_categories_user_id", table_name="categories")
+    op.drop_index("ix_accounts_user_id", table_name="accounts")
\ No newline at end of file
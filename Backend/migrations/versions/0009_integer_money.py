@@ -0,0 +1,113 @@
+"""Store amounts as integer cents and transaction types as small integer codes
+
+Each converted column is swapped for a new one in four steps:
+
+1. add ``<column>_new`` as NOT NULL with a constant default, which needs no
+   table rewrite on PostgreSQL 11+;
+2. fill it in primary-key ranges of ``BATCH_SIZE`` rows, each committed on
+   its own, so no lock or transaction outlives a batch;
+3. with writes to the table blocked, convert again every row whose new
+   column no longer matches its old one: rows the previous application
+   version inserted or changed during step 2;
+4. drop the old column and rename the new one, both catalog-only changes,
+   in the transaction of step 3.
+
+A run interrupted during the backfill can simply be restarted.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.schema_state import column_type, dialect_name, has_column
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 50000
+
+TO_MINOR_UNITS = "CAST(ROUND({column} * 100) AS BIGINT)"
+FROM_MINOR_UNITS = "{column} / 100.0"
+# No ELSE: an unknown type fails the NOT NULL constraint instead of being guessed
+TO_TYPE_CODE = "CASE {column} WHEN 'expense' THEN 1 WHEN 'revenue' THEN 2 END"
+FROM_TYPE_CODE = "CASE {column} WHEN 1 THEN 'expense' WHEN 2 THEN 'revenue' END"
+
+# (table, key the batches range over, money columns, type columns)
+CONVERSIONS = (
+    ("transactions", "id", ("amount",), ("transaction_type",)),
+    ("recurring_transactions", "id", ("amount",), ("transaction_type",)),
+    ("accounts", "id", ("initial_balance", "balance"), ()),
+    ("budgets", "id", ("amount",), ()),
+    ("category_spend", "user_id", ("spent",), ()),
+)
+# Columns whose server default is part of the model
+KEEP_SERVER_DEFAULT = {("accounts", "balance")}
+
+
+def _backfill(table: str, key: str, assignments: dict) -> None:
+    """Run ``UPDATE table SET ...`` over consecutive ``key`` ranges, committing after each one."""
+    low, high = op.get_bind().execute(sa.text(f"SELECT MIN({key}), MAX({key}) FROM {table}")).one()
+    if low is None:
+        return
+    sets = ", ".join(f"{target} = {expression}" for target, expression in assignments.items())
+    statement = sa.text(f"UPDATE {table} SET {sets} WHERE {key} >= :low AND {key} < :high")
+    with op.get_context().autocommit_block():
+        for start in range(low, high + 1, BATCH_SIZE):
+            op.get_bind().execute(statement, {"low": start, "high": start + BATCH_SIZE})
+
+
+def _catch_up(table: str, columns: dict) -> None:
+    """Convert the rows written since their batch was backfilled; writers stay blocked until the migration commits."""
+    if dialect_name() == "postgresql":
+        # Readers carry on; the column drop that follows takes the exclusive lock
+        op.execute(f"LOCK TABLE {table} IN SHARE MODE")
+        differs = "IS DISTINCT FROM"
+    else:
+        differs = "IS NOT"
+    expressions = {f"{name}_new": expression.format(column=name) for name, (_, _, expression) in columns.items()}
+    sets = ", ".join(f"{target} = {expression}" for target, expression in expressions.items())
+    stale = " OR ".join(f"{target} {differs} {expression}" for target, expression in expressions.items())
+    op.execute(f"UPDATE {table} SET {sets} WHERE {stale}")
+
+
+def _swap(table: str, key: str, columns: dict) -> None:
+    """Replace each column with a converted copy; ``columns`` maps a name to ``(new type, default, expression)``."""
+    for name, (new_type, default, _) in columns.items():
+        if not has_column(table, f"{name}_new"):
+            op.add_column(table, sa.Column(f"{name}_new", new_type, nullable=False, server_default=default))
+    _backfill(table, key, {f"{name}_new": expression.format(column=name) for name, (_, _, expression) in columns.items()})
+    _catch_up(table, columns)
+    for name in columns:
+        op.drop_column(table, name)
+        options = {}
+        # SQLite cannot drop a default without rebuilding the table; the leftover one is never used
+        if dialect_name() == "postgresql" and (table, name) not in KEEP_SERVER_DEFAULT:
+            options["server_default"] = None
+        op.alter_column(table, f"{name}_new", new_column_name=name, **options)
+
+
+def upgrade() -> None:
+    for table, key, money, types in CONVERSIONS:
+        columns = {}
+        for name in money:
+            columns[name] = (sa.BigInteger(), "0", TO_MINOR_UNITS)
+        for name in types:
+            columns[name] = (sa.SmallInteger(), "1", TO_TYPE_CODE)
+        # Databases built by create_all from the current models are already converted
+        pending = {name: spec for name, spec in columns.items() if not isinstance(column_type(table, name), sa.Integer)}
+        if pending:
+            _swap(table, key, pending)
+
+
+def downgrade() -> None:
+    for table, key, money, types in CONVERSIONS:
+        columns = {}
+        for name in money:
+            columns[name] = (sa.Float(), "0", FROM_MINOR_UNITS)
+        for name in types:
+            columns[name] = (sa.String(), "expense", FROM_TYPE_CODE)
+        _swap(table, key, columns)
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""Rebuild or verify the materialized account balances.
+
+Usage:
+    python -m src.commands.account_balances verify [--user-id ID]
+    python -m src.commands.account_balances rebuild [--user-id ID]
+"""
+import argparse
+import sys
+
+from src.core.database import SessionLocal
+from src.models import account, budget, category, recurring_transaction, transaction, user  # noqa: F401 - register mappers
+from src.repositories.account_repository import AccountRepository
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild or verify stored account balances.")
+    parser.add_argument("action", choices=["verify", "rebuild"])
+    parser.add_argument("--user-id", type=int, default=None, help="Limit to a single user's accounts")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        repository = AccountRepository(db)
+        if args.action == "rebuild":
+            updated = repository.rebuild_balances(args.user_id)
+            print(f"Rebuilt balances for {updated} account(s)")
+            return 0
+
+        drift = repository.find_balance_drift(args.user_id)
+        for row in drift:
+            print(f"account {row.id} (user {row.user_id}): stored {row.balance:.2f}, expected {row.expected_balance:.2f}")
+        print(f"{len(drift)} account(s) with drifted balances")
+        return 1 if drift else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
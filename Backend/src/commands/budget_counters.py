@@ -0,0 +1,39 @@
+"""Rebuild or verify the per-category spend counters behind budgets.
+
+Usage:
+    python -m src.commands.budget_counters verify [--user-id ID]
+    python -m src.commands.budget_counters rebuild [--user-id ID]
+"""
+import argparse
+import sys
+
+from src.core.database import SessionLocal
+from src.models import account, budget, category, recurring_transaction, transaction, user  # noqa: F401 - register mappers
+from src.repositories.budget_repository import BudgetRepository
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild or verify budget spend counters.")
+    parser.add_argument("action", choices=["verify", "rebuild"])
+    parser.add_argument("--user-id", type=int, default=None, help="Limit to a single user's counters")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        repository = BudgetRepository(db)
+        if args.action == "rebuild":
+            rows = repository.rebuild_spend(args.user_id)
+            print(f"Rebuilt {rows} spend counter(s)")
+            return 0
+
+        drift = repository.find_spend_drift(args.user_id)
+        for (user_id, category_id, period, start), stored, expected in drift:
+            print(f"user {user_id}, category {category_id}, {period} of {start}: stored {stored:.2f}, expected {expected:.2f}")
+        print(f"{len(drift)} counter(s) drifted")
+        return 1 if drift else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
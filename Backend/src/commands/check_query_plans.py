@@ -0,0 +1,148 @@
+"""Fail when a hot repository query cannot use an index.
+
+Each hot read path is run against the configured (migrated) database while its
+statements are recorded, then every recorded SELECT is EXPLAINed. On SQLite a
+plan fails if it SCANs one of the hot tables; on PostgreSQL it fails if it has
+a Seq Scan on one, with ``enable_seqscan`` off so that small tables do not hide
+a missing index. Empty tables are fine: only the plan matters.
+
+Usage:
+    python -m src.commands.check_query_plans [--user-id ID] [--verbose]
+"""
+import argparse
+import json
+import re
+import sys
+from datetime import date, timedelta
+from typing import Any, Callable, Iterator, List, Tuple
+
+from sqlalchemy import event
+
+from src.core.database import SessionLocal, engine
+from src.models import account, budget, category, job, recurring_transaction, transaction, user  # noqa: F401 - register mappers
+from src.repositories.account_repository import AccountRepository
+from src.repositories.budget_repository import BudgetRepository
+from src.repositories.category_repository import CategoryRepository
+from src.repositories.data_version_repository import DataVersionRepository, TRANSACTIONS
+from src.repositories.job_repository import JobRepository
+from src.repositories.recurring_transaction_repository import RecurringTransactionRepository
+from src.repositories.transaction_repository import TransactionRepository
+from src.repositories.user_repository import UserRepository
+from src.schemas.transaction import SummaryGroup, SummaryPeriod, TransactionFilter
+
+HOT_TABLES = {
+    "users", "accounts", "categories", "transactions", "data_versions",
+    "recurring_transactions", "budgets", "category_spend", "jobs",
+}
+
+
+def hot_queries(db, user_id: int) -> List[Tuple[str, Callable[[], Any]]]:
+    transactions = TransactionRepository(db)
+    accounts = AccountRepository(db)
+    categories = CategoryRepository(db)
+    rules = RecurringTransactionRepository(db)
+    today = date.today()
+    last_year = TransactionFilter(date_from=today - timedelta(days=365), date_to=today)
+    return [
+        ("users.get", lambda: UserRepository(db).get(user_id)),
+        ("users.get_by_username", lambda: UserRepository(db).get_by_username("check")),
+        ("data_versions.get", lambda: DataVersionRepository(db).get(user_id, TRANSACTIONS)),
+        ("accounts.list", lambda: accounts.get_all(user_id)),
+        ("accounts.get", lambda: accounts.get(user_id, 1)),
+        ("categories.list", lambda: categories.get_all(user_id)),
+        ("categories.get", lambda: categories.get(user_id, 1)),
+        ("transactions.get", lambda: transactions.get(user_id, 1)),
+        ("transactions.page", lambda: transactions.get_page(user_id, TransactionFilter(), 100)),
+        ("transactions.page_after_cursor", lambda: transactions.get_page(user_id, TransactionFilter(), 100, (today, 1))),
+        ("transactions.page_by_date", lambda: transactions.get_page(user_id, last_year, 100)),
+        ("transactions.page_by_category", lambda: transactions.get_page(user_id, TransactionFilter(category_id=1), 100)),
+        ("transactions.page_by_account", lambda: transactions.get_page(user_id, TransactionFilter(account_id=1), 100)),
+        ("transactions.summary", lambda: transactions.summarize(user_id, last_year, [SummaryGroup.CATEGORY], SummaryPeriod.MONTH)),
+        ("transactions.search", lambda: transactions.search(user_id, ["coffee"], TransactionFilter(), 50)),
+        ("transactions.export", lambda: list(transactions.iter_rows(user_id, 1000))),
+        ("transactions.export_by_date", lambda: list(transactions.iter_rows(user_id, 1000, last_year))),
+        ("transactions.export_by_account", lambda: list(transactions.iter_rows(user_id, 1000, TransactionFilter(account_id=1)))),
+        ("transactions.export_by_category", lambda: list(transactions.iter_rows(user_id, 1000, TransactionFilter(category_id=1)))),
+        ("transactions.monthly_net", lambda: transactions.monthly_net(user_id, today - timedelta(days=365), today)),
+        ("recurring.list", lambda: rules.get_all(user_id)),
+        ("recurring.due", lambda: rules.get_due(today, 100)),
+        ("budgets.list", lambda: BudgetRepository(db).get_all(user_id)),
+        ("budgets.status", lambda: BudgetRepository(db).get_status(user_id, today)),
+        ("jobs.list", lambda: JobRepository(db).get_all(user_id, 50)),
+        ("jobs.get", lambda: JobRepository(db).get(user_id, 1)),
+    ]
+
+
+def _sqlite_violations(connection, statement: str, parameters) -> Iterator[Tuple[str, bool]]:
+    for row in connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters):
+        detail = row[-1]
+        match = re.match(r"SCAN (\w+)", detail)
+        yield detail, bool(match and match.group(1) in HOT_TABLES)
+
+
+def _postgresql_violations(connection, statement: str, parameters) -> Iterator[Tuple[str, bool]]:
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    plan = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(node.get("Plans", []))
+        relation = node.get("Relation Name")
+        yield f"{node['Node Type']}{' on ' + relation if relation else ''}", node["Node Type"] == "Seq Scan" and relation in HOT_TABLES
+
+
+def check_plans(user_id: int) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """``(name, violations, plan lines)`` for each hot query, EXPLAINed on the configured database."""
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            recorded.append((statement, parameters))
+
+    explain = _sqlite_violations if engine.dialect.name == "sqlite" else _postgresql_violations
+    db = SessionLocal()
+    try:
+        for name, run in hot_queries(db, user_id):
+            recorded.clear()
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                run()
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+            db.rollback()
+
+            problems, lines = [], []
+            with engine.connect() as connection:
+                for statement, parameters in recorded:
+                    for line, violation in explain(connection, statement, parameters):
+                        lines.append(line)
+                        if violation:
+                            problems.append(line)
+                connection.rollback()
+            yield name, problems, lines
+    finally:
+        db.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="EXPLAIN every hot repository query and fail on full table scans.")
+    parser.add_argument("--user-id", type=int, default=1, help="User the queries are issued for (need not exist)")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan line")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for name, problems, lines in check_plans(args.user_id):
+        failures += bool(problems)
+        print(f"{'FAIL' if problems else 'ok':4}  {name}" + (f": {'; '.join(problems)}" if problems else ""))
+        if args.verbose:
+            for line in lines:
+                print(f"      {line}")
+
+    print(f"{failures} hot quer{'y' if failures == 1 else 'ies'} without an index path")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""Run queued background jobs (imports and exports) outside the API process.
+
+Start any number of these next to API processes configured with
+``JOB_WORKERS=0``; jobs are claimed through the database, so each runs once.
+Stops on SIGINT/SIGTERM after the running jobs finish.
+
+Usage:
+    python -m src.commands.run_jobs [--workers N] [--drain]
+"""
+import argparse
+import signal
+import sys
+import threading
+
+from src.core.config import settings
+from src.models import account, budget, category, job, recurring_transaction, transaction, user  # noqa: F401 - register mappers
+from src.services.job_service import HANDLERS
+from src.services.job_worker import JobWorker
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run queued background jobs.")
+    parser.add_argument("--workers", type=int, default=None, help="Jobs run at once (default: JOB_WORKERS, at least 1)")
+    parser.add_argument("--drain", action="store_true", help="Run the jobs that are due, then exit")
+    args = parser.parse_args(argv)
+
+    worker = JobWorker(HANDLERS, args.workers or max(1, settings.JOB_WORKERS), settings.JOB_POLL_SECONDS)
+    if args.drain:
+        worker.housekeeping()
+        ran = 0
+        while worker.run_once():
+            ran += 1
+        print(f"Ran {ran} job(s)")
+        return 0
+
+    stopping = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stopping.set())
+    worker.start()
+    print(f"Job worker {worker.name} running {worker.threads} thread(s)")
+    stopping.wait()
+    worker.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""Per-user admission control for expensive endpoints.
+
+Each endpoint class gets a limiter. For every user it keeps a token bucket
+that bounds how often operations may start, plus a cap on how many may run
+at once. A request over the rate is rejected straight away. A request over
+the cap may wait briefly for a slot, but only while few others are waiting;
+otherwise it is rejected. Rejections are 429 responses with ``Retry-After``,
+so a single user cannot tie up the database pool or the workers.
+"""
+import asyncio
+import collections
+import math
+import threading
+import time
+from typing import Any, Deque, Dict, Optional
+
+from fastapi import HTTPException, Request, status
+from jose import JWTError, jwt
+
+from src.core.config import settings
+from src.core.metrics import Counter, Gauge, registry
+
+ADMITTED = registry.register(Counter(
+    "admission_admitted_total", "Expensive operations admitted by endpoint class.", ("endpoint_class",)))
+QUEUED = registry.register(Counter(
+    "admission_queued_total", "Expensive operations that waited for a free slot by endpoint class.", ("endpoint_class",)))
+REJECTED = registry.register(Counter(
+    "admission_rejected_total", "Expensive operations rejected with 429 by endpoint class and reason.",
+    ("endpoint_class", "reason")))
+IN_FLIGHT = registry.register(Gauge(
+    "admission_in_flight", "Expensive operations currently running by endpoint class.", ("endpoint_class",)))
+
+
+class TooManyRequests(HTTPException):
+    def __init__(self, detail: str, retry_after: float):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+class _UserState:
+    __slots__ = ("tokens", "updated", "active", "waiters")
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens = tokens
+        self.updated = now
+        self.active = 0
+        self.waiters: Deque[asyncio.Future] = collections.deque()
+
+
+class AdmissionLimiter:
+    """Token bucket plus concurrency cap per user for one class of endpoints.
+
+    State is per process, like the caches. Waiting requests hold no thread
+    and no database connection; a released slot goes straight to the oldest
+    waiter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        per_minute: float,
+        burst: int,
+        max_concurrent: int,
+        max_queued: int,
+        queue_timeout: float,
+    ):
+        self.name = name
+        self.rate = per_minute / 60
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        self._users: Dict[Any, _UserState] = {}
+        self._next_sweep = 0.0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_rate = 0
+        self.rejected_concurrency = 0
+
+    def _state(self, user: Any, now: float) -> _UserState:
+        if now >= self._next_sweep:
+            self._sweep(now)
+        state = self._users.get(user)
+        if state is None:
+            state = self._users[user] = _UserState(self.burst, now)
+        else:
+            state.tokens = min(self.burst, state.tokens + (now - state.updated) * self.rate)
+            state.updated = now
+        return state
+
+    def _sweep(self, now: float) -> None:
+        """Forget users with a full bucket and nothing running or waiting."""
+        self._next_sweep = now + 60
+        for user, state in list(self._users.items()):
+            refilled = state.tokens + (now - state.updated) * self.rate >= self.burst
+            if refilled and not state.active and not state.waiters:
+                del self._users[user]
+
+    def _reject(self, reason: str, detail: str, retry_after: float) -> TooManyRequests:
+        if reason == "rate":
+            self.rejected_rate += 1
+        else:
+            self.rejected_concurrency += 1
+        REJECTED.inc(self.name, reason)
+        return TooManyRequests(detail, retry_after)
+
+    async def acquire(self, user: Any) -> None:
+        """Take a slot for ``user`` or raise ``TooManyRequests``; pair every success with ``release``."""
+        with self._lock:
+            state = self._state(user, time.monotonic())
+            if state.tokens < 1:
+                raise self._reject(
+                    "rate", f"Too many {self.name} requests, please slow down", (1 - state.tokens) / self.rate
+                )
+            if state.active < self.max_concurrent:
+                state.tokens -= 1
+                state.active += 1
+                self._admit()
+                return
+            if len(state.waiters) >= self.max_queued:
+                raise self._reject("concurrency", f"Too many {self.name} requests in progress", 1)
+            state.tokens -= 1
+            future = asyncio.get_running_loop().create_future()
+            state.waiters.append(future)
+            self.queued += 1
+            QUEUED.inc(self.name)
+
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if future in state.waiters:
+                    state.waiters.remove(future)
+                # Give the token back: the operation never started
+                state.tokens = min(self.burst, state.tokens + 1)
+            raise self._reject("concurrency", f"Too many {self.name} requests in progress", 1)
+        with self._lock:
+            self._admit()
+
+    def _admit(self) -> None:
+        self.admitted += 1
+        ADMITTED.inc(self.name)
+        IN_FLIGHT.inc(self.name)
+
+    def release(self, user: Any) -> None:
+        IN_FLIGHT.dec(self.name)
+        with self._lock:
+            self._hand_over(self._users[user])
+
+    def _hand_over(self, state: _UserState) -> None:
+        """Pass a freed slot to the oldest live waiter, or return it. Caller holds the lock."""
+        while state.waiters:
+            future = state.waiters.popleft()
+            if not future.done():
+                future.get_loop().call_soon_threadsafe(self._grant, state, future)
+                return
+        state.active -= 1
+
+    def _grant(self, state: _UserState, future: asyncio.Future) -> None:
+        if future.done():
+            # Timed out after the slot was handed over; offer it to the next waiter
+            with self._lock:
+                self._hand_over(state)
+        else:
+            future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "per_minute": round(self.rate * 60, 3),
+                "burst": self.burst,
+                "max_concurrent": self.max_concurrent,
+                "max_queued": self.max_queued,
+                "users": len(self._users),
+                "in_flight": sum(state.active for state in self._users.values()),
+                "waiting": sum(len(state.waiters) for state in self._users.values()),
+                "admitted": self.admitted,
+                "queued": self.queued,
+                "rejected_rate": self.rejected_rate,
+                "rejected_concurrency": self.rejected_concurrency,
+            }
+
+
+def _user_key(request: Request) -> Optional[Any]:
+    """The user an access token belongs to, without touching the database; None if it does not verify."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+    return payload.get("uid") or payload.get("sub")
+
+
+def admission(limiter: AdmissionLimiter):
+    """Route dependency that holds one of ``limiter``'s slots until the response, streamed or not, is sent.
+
+    This relies on FastAPI running the code after ``yield`` once the response
+    is sent, which holds from 0.118.0 (0.106 to 0.117 ran it before a
+    streamed body). Requests whose token does not verify pass through
+    untouched; the authentication dependency rejects them.
+    """
+    async def dependency(request: Request):
+        user = _user_key(request) if settings.ADMISSION_ENABLED else None
+        if user is None:
+            yield
+            return
+        await limiter.acquire(user)
+        try:
+            yield
+        finally:
+            limiter.release(user)
+
+    return dependency
+
+
+def _limiter(name: str) -> AdmissionLimiter:
+    prefix = f"ADMISSION_{name.upper()}"
+    return AdmissionLimiter(
+        name,
+        per_minute=getattr(settings, f"{prefix}_PER_MINUTE"),
+        burst=getattr(settings, f"{prefix}_BURST"),
+        max_concurrent=getattr(settings, f"{prefix}_CONCURRENCY"),
+        max_queued=settings.ADMISSION_MAX_QUEUED,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    )
+
+
+# Whole-dataset exports, bulk writes (import, batch, bulk update/delete) and heavy reads
+export_limiter = _limiter("export")
+import_limiter = _limiter("import")
+report_limiter = _limiter("report")
+limiters = (export_limiter, import_limiter, report_limiter)
\ No newline at end of file
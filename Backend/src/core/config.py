@@ -7,6 +7,80 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    # Seconds before a pooled connection is replaced; -1 keeps connections forever
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    # PostgreSQL statement_timeout applied to every connection; None leaves the server default
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    # Comma separated read replica URLs; read-only routes are spread over them when set
+    DATABASE_REPLICA_URLS: str = ""
+    # Seconds a client's reads stay on the primary after it commits a write
+    READ_YOUR_WRITES_SECONDS: float = 5
+    METRICS_ENABLED: bool = True
+    SLOW_QUERY_MS: float = 200
+    # Identical statements per request at which the request is flagged as a likely N+1
+    N_PLUS_ONE_THRESHOLD: int = 10
+    # Recurring rules handled per INSERT/commit by the materialization pass
+    RECURRING_CHUNK_SIZE: int = 5000
+    FORECAST_CACHE_SIZE: int = 1000
+    FORECAST_CACHE_TTL_SECONDS: int = 600
+    # Words of a search query beyond this are ignored
+    SEARCH_MAX_TERMS: int = 8
+    # Buckets a gap-filled summary may return (periods in the range times groups)
+    SUMMARY_MAX_BUCKETS: int = 10000
+    EXPORT_CHUNK_SIZE: int = 1000
+    # Rows per record batch / row group of Arrow and Parquet exports, held in memory while written
+    EXPORT_ROW_GROUP_SIZE: int = 65536
+    IMPORT_CHUNK_SIZE: int = 1000
+    # Items accepted by one POST /transactions/batch request
+    TRANSACTION_BATCH_MAX_ITEMS: int = 5000
+    # Per-user admission control for expensive endpoint classes: operations
+    # started per minute (token bucket refill), burst size and concurrent operations
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_EXPORT_PER_MINUTE: float = 6
+    ADMISSION_EXPORT_BURST: int = 3
+    ADMISSION_EXPORT_CONCURRENCY: int = 1
+    ADMISSION_IMPORT_PER_MINUTE: float = 12
+    ADMISSION_IMPORT_BURST: int = 5
+    ADMISSION_IMPORT_CONCURRENCY: int = 1
+    ADMISSION_REPORT_PER_MINUTE: float = 120
+    ADMISSION_REPORT_BURST: int = 30
+    ADMISSION_REPORT_CONCURRENCY: int = 4
+    # Requests per user and class that may wait for a free slot, and for how long, before a 429
+    ADMISSION_MAX_QUEUED: int = 2
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 5
+    # Background jobs (imports and exports). Worker threads started inside the
+    # API process; set to 0 when `python -m src.commands.run_jobs` runs them instead
+    JOB_WORKERS: int = 2
+    JOB_POLL_SECONDS: float = 1
+    # Runs per job, and the delay before the first retry (doubled on each later one)
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_DELAY_SECONDS: float = 30
+    # How often a running job records its progress and looks for a cancel request
+    JOB_PROGRESS_INTERVAL_SECONDS: float = 1
+    # A running job without progress for this long is taken to be orphaned by a dead worker
+    JOB_STALE_SECONDS: float = 600
+    # Finished jobs and their files are deleted after this long
+    JOB_RETENTION_SECONDS: int = 86400
+    # Directory holding one subdirectory of files per job; defaults to the system temp dir
+    JOB_STORAGE_DIR: Optional[str] = None
+    # Worker threads available to run blocking database calls off the event loop
+    THREADPOOL_SIZE: int = 40
+    AUTH_CACHE_SIZE: int = 10000
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    # Comma separated usernames allowed to read the /internal endpoints
+    INTERNAL_ADMIN_USERNAMES: str = ""
+    # Put the user id in access tokens so they resolve by primary key
+    AUTH_TOKEN_EMBED_USER_ID: bool = True
+    BCRYPT_ROUNDS: int = 12
+    # Threads dedicated to bcrypt; defaults to the CPU count
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    # Hash/verify calls allowed to wait for a worker before new ones are rejected
+    # with a 503; capped so that workers plus waiting calls stay at half of THREADPOOL_SIZE
+    PASSWORD_HASH_MAX_PENDING: int = 16
 
     class Config:
         env_file = ".env"
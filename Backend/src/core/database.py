@@ -1,19 +1,218 @@
-from sqlalchemy import create_engine
+import itertools
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from src.core.config import settings
 
-# Create engine with explicit encoding settings
-engine = create_engine(settings.DATABASE_URL)
+
+class PoolStats:
+    """Counters fed by pool events, for sizing the pool against the worker count."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.disconnects = 0
+        self.invalidations = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.waits = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_wait(self, seconds: float, overflowed: bool, timed_out: bool) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self.overflow_checkouts += overflowed
+            self.timeouts += timed_out
+
+    def snapshot(self, pool) -> Dict[str, Any]:
+        with self._lock:
+            stats = {
+                "pool_class": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "disconnects": self.disconnects,
+                "invalidations": self.invalidations,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.waits, 6) if self.waits else 0.0,
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                pool_size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=pool.overflow(),
+                max_overflow=pool._max_overflow,
+            )
+        return stats
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            pool_stats.record_wait(time.perf_counter() - started, self.overflow() > 0, timed_out)
+
+
+def _engine_options(database_url: str, instrumented: bool = True) -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    backend = make_url(database_url).get_backend_name()
+    if backend == "sqlite":
+        # SQLite picks its own pool class; sizing does not apply to a local file
+        return options
+    options.update(
+        poolclass=InstrumentedQueuePool if instrumented else QueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    if backend == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS is not None:
+        options["connect_args"] = {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    return options
+
+
+def instrument_pool(engine) -> None:
+    for name, counter in (
+        ("checkout", "checkouts"),
+        ("checkin", "checkins"),
+        ("connect", "connects"),
+        ("close", "disconnects"),
+        ("close_detached", "disconnects"),
+        ("invalidate", "invalidations"),
+    ):
+        event.listen(engine, name, lambda *_, counter=counter: pool_stats.increment(counter))
+
+
+engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
+instrument_pool(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Replicas share the primary's pool settings; pool_stats only tracks the primary
+replica_engines = [
+    create_engine(url, **_engine_options(url, instrumented=False))
+    for url in (url.strip() for url in settings.DATABASE_REPLICA_URLS.split(","))
+    if url
+]
+
 Base = declarative_base()
 
 
-def get_db():
+class ReadRouting:
+    """Sends read-only sessions to the replicas, except for clients that just wrote.
+
+    A client is identified by its ``Authorization`` header. Committing on a
+    primary session pins that client to the primary for ``window_seconds``,
+    so it reads its own writes while the replicas catch up. Pins live in
+    process memory, like the auth cache.
+    """
+
+    def __init__(self, replica_engines, window_seconds: float):
+        self.replica_sessions = [sessionmaker(autocommit=False, autoflush=False, bind=e) for e in replica_engines]
+        self.window_seconds = window_seconds
+        self._replicas = itertools.cycle(self.replica_sessions)
+        self._lock = threading.Lock()
+        self._pinned_until: Dict[str, float] = {}
+        self._next_sweep = 0.0
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.pinned_reads = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replica_sessions)
+
+    def pin(self, client: Optional[str]) -> None:
+        if not self.enabled or not client:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._pinned_until[client] = now + self.window_seconds
+            if now >= self._next_sweep:
+                self._pinned_until = {key: until for key, until in self._pinned_until.items() if until > now}
+                self._next_sweep = now + self.window_seconds
+
+    def session_factory(self, client: Optional[str]) -> sessionmaker:
+        with self._lock:
+            if not self.enabled:
+                self.primary_reads += 1
+                return SessionLocal
+            if client and self._pinned_until.get(client, 0.0) > time.monotonic():
+                self.pinned_reads += 1
+                return SessionLocal
+            self.replica_reads += 1
+            return next(self._replicas)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            pinned = sum(until > now for until in self._pinned_until.values())
+        return {
+            "replicas": len(self.replica_sessions),
+            "window_seconds": self.window_seconds,
+            "pinned_clients": pinned,
+            "replica_reads": self.replica_reads,
+            "pinned_reads": self.pinned_reads,
+            "primary_reads": self.primary_reads,
+        }
+
+
+read_routing = ReadRouting(replica_engines, settings.READ_YOUR_WRITES_SECONDS)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _pin_writer(session) -> None:
+    # Pin at commit time rather than on teardown, which runs after the response is sent
+    read_routing.pin(session.info.get("client"))
+
+
+def get_db(request: Request):
     db = SessionLocal()
+    db.info["client"] = request.headers.get("authorization")
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db(request: Request):
+    """``get_db`` for routes that never write: a replica session unless the client is pinned to the primary."""
+    db = read_routing.session_factory(request.headers.get("authorization"))()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""Request and SQL instrumentation feeding the Prometheus registry in ``src.core.metrics``."""
+import logging
+import time
+from collections import Counter as Tally
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+
+from src.core.config import settings
+from src.core.database import engine, pool_stats
+from src.core.metrics import CallbackGauge, Counter, Gauge, Histogram, registry
+
+logger = logging.getLogger(__name__)
+
+REQUESTS = registry.register(Counter(
+    "http_requests_total", "HTTP requests by method, route template and status code.", ("method", "route", "status")))
+REQUEST_LATENCY = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route template.", ("method", "route")))
+IN_FLIGHT = registry.register(Gauge("http_requests_in_flight", "HTTP requests currently being served."))
+REQUEST_QUERIES = registry.register(Histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request.", ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)))
+N_PLUS_ONE = registry.register(Counter(
+    "http_requests_n_plus_one_total", "Requests that repeated one SQL statement at least N_PLUS_ONE_THRESHOLD times.",
+    ("method", "route")))
+QUERY_LATENCY = registry.register(Histogram(
+    "db_query_duration_seconds", "SQL statement execution time by operation.", ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)))
+SLOW_QUERIES = registry.register(Counter(
+    "db_slow_queries_total", "SQL statements slower than SLOW_QUERY_MS by operation.", ("operation",)))
+registry.register(CallbackGauge(
+    "db_pool_checked_out", "Connections currently checked out of the pool.",
+    lambda: pool_stats.snapshot(engine.pool).get("checked_out", 0)))
+registry.register(CallbackGauge(
+    "db_pool_overflow_checkouts_total", "Checkouts served from overflow connections.",
+    lambda: pool_stats.overflow_checkouts, kind="counter"))
+registry.register(CallbackGauge(
+    "db_pool_wait_seconds_total", "Total time spent waiting for a pooled connection.",
+    lambda: pool_stats.wait_seconds_total, kind="counter"))
+
+_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+
+class _RequestStats:
+    __slots__ = ("queries", "statements")
+
+    def __init__(self):
+        self.queries = 0
+        self.statements = Tally()
+
+
+# Shared with the worker threads a request hands its database work to
+_request_stats: ContextVar[Optional[_RequestStats]] = ContextVar("request_stats", default=None)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, status codes, in-flight requests and SQL counts per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = _RequestStats()
+        token = _request_stats.set(stats)
+        IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_FLIGHT.dec()
+            _request_stats.reset(token)
+            # Label by route template so ids in paths do not explode cardinality
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            REQUESTS.inc(method, route, str(status_code))
+            REQUEST_LATENCY.observe(elapsed, method, route)
+            REQUEST_QUERIES.observe(stats.queries, method, route)
+            statement, repeats = max(stats.statements.items(), key=lambda item: item[1], default=("", 0))
+            if repeats >= settings.N_PLUS_ONE_THRESHOLD:
+                N_PLUS_ONE.inc(method, route)
+                logger.warning("Possible N+1 on %s %s: statement ran %d times: %s", method, route, repeats, statement[:300])
+
+
+def instrument_engine(target) -> None:
+    @event.listens_for(target, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        operation = statement.lstrip()[:6].upper()
+        if operation not in _OPERATIONS:
+            operation = "OTHER"
+        QUERY_LATENCY.observe(elapsed, operation)
+        if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+            SLOW_QUERIES.inc(operation)
+            logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement[:500])
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.statements[statement] += 1
\ No newline at end of file
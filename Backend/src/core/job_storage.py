@@ -0,0 +1,34 @@
+"""Files of background jobs: one directory per job under ``JOB_STORAGE_DIR``.
+
+An import keeps its upload here until it succeeds; an export writes its
+result here for download. The directory goes away with the job.
+"""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from src.core.config import settings
+
+INPUT_FILENAME = "input.json"
+# Suffix of a result still being written; renamed into place once complete
+PARTIAL_SUFFIX = ".part"
+
+
+def storage_root() -> Path:
+    return Path(settings.JOB_STORAGE_DIR or os.path.join(tempfile.gettempdir(), "flowfinance-jobs"))
+
+
+def job_dir(job_id: int, create: bool = False) -> Path:
+    path = storage_root() / str(job_id)
+    if create:
+        path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def remove_job_file(job_id: int, filename: str) -> None:
+    (job_dir(job_id) / filename).unlink(missing_ok=True)
+
+
+def remove_job_files(job_id: int) -> None:
+    shutil.rmtree(job_dir(job_id), ignore_errors=True)
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""Run the Alembic migrations from code, e.g. for scratch databases in benchmarks."""
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def alembic_config(database_url: str = None) -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    if database_url:
+        config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
+    return config
+
+
+def upgrade_database(database_url: str = None, revision: str = "head") -> None:
+    command.upgrade(alembic_config(database_url), revision)
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""Calendar periods shared by summaries and budgets. Weeks start on Monday."""
+from datetime import date, timedelta
+
+from sqlalchemy import Date, cast, func
+
+DAY = "day"
+WEEK = "week"
+MONTH = "month"
+YEAR = "year"
+
+
+def period_start(value: date, period: str) -> date:
+    period = getattr(period, "value", period)
+    if period == WEEK:
+        return value - timedelta(days=value.weekday())
+    if period == MONTH:
+        return value.replace(day=1)
+    if period == YEAR:
+        return value.replace(month=1, day=1)
+    return value
+
+
+def next_period(value: date, period: str) -> date:
+    period = getattr(period, "value", period)
+    if period == DAY:
+        return value + timedelta(days=1)
+    if period == WEEK:
+        return value + timedelta(weeks=1)
+    if period == MONTH:
+        return date(value.year + value.month // 12, value.month % 12 + 1, 1)
+    return date(value.year + 1, 1, 1)
+
+
+def period_start_sql(dialect_name: str, period: str, column):
+    """SQL expression truncating a date column to the start of its period."""
+    period = getattr(period, "value", period)
+    if dialect_name == "sqlite":
+        if period == DAY:
+            return column
+        if period == WEEK:
+            return func.date(column, "weekday 0", "-6 days")
+        if period == MONTH:
+            return func.strftime("%Y-%m-01", column)
+        return func.strftime("%Y-01-01", column)
+    return cast(func.date_trunc(period, column), Date)
\ No newline at end of file
@@ -1,17 +1,37 @@
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.core.database import engine, Base
+from src.core.config import settings
+from src.core.database import engine, replica_engines
+from src.core.instrumentation import MetricsMiddleware, instrument_engine
+from src.services.job_service import job_worker
 from src.routes.transactions_routes import router as finance_router
 from src.routes.auth_routes import router as auth_router
 from src.routes.user_routes import router as user_router
 from src.routes.category_routes import router as category_router
 from src.routes.account_routes import router as account_router
+from src.routes.recurring_transaction_routes import router as recurring_transaction_router
+from src.routes.budget_routes import router as budget_router
+from src.routes.forecast_routes import router as forecast_router
+from src.routes.job_routes import router as job_router
+from src.routes.internal_routes import router as internal_router
+from src.routes.metrics_routes import router as metrics_router
+
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Routes hand their synchronous database work to this pool
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    # No threads when JOB_WORKERS is 0, i.e. when `python -m src.commands.run_jobs` runs the jobs
+    job_worker.start()
+    yield
+    await anyio.to_thread.run_sync(job_worker.stop)
 
-app = FastAPI(title="Flow Finance API")
+
+app = FastAPI(title="Flow Finance API", lifespan=lifespan)
 
 # Configure CORS
 origins = [
@@ -20,6 +40,11 @@ origins = [
     "null", # For local file access, if you open index.html directly
 ]
 
+if settings.METRICS_ENABLED:
+    for target in (engine, *replica_engines):
+        instrument_engine(target)
+    app.add_middleware(MetricsMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -32,4 +57,11 @@ app.include_router(auth_router)
 app.include_router(user_router)
 app.include_router(finance_router)
 app.include_router(category_router)
-app.include_router(account_router) 
\ No newline at end of file
+app.include_router(account_router)
+app.include_router(recurring_transaction_router)
+app.include_router(budget_router)
+app.include_router(forecast_router)
+app.include_router(job_router)
+app.include_router(internal_router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router) 
\ No newline at end of file
@@ -1,14 +1,17 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 from src.core.database import Base
+from src.models.types import Money
 
 class Account(Base):
     __tablename__ = "accounts"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String, index=True, nullable=False)
-    initial_balance = Column(Float, nullable=False, default=0.0)
+    initial_balance = Column(Money, nullable=False, default=0.0)
+    # initial_balance plus the net of every linked transaction, maintained on write
+    balance = Column(Money, nullable=False, default=0.0, server_default="0")
 
     user = relationship("User", back_populates="accounts")
     transactions = relationship("Transaction", back_populates="account") 
\ No newline at end of file
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from src.core.database import Base
+from src.models.types import Money
+
+class Budget(Base):
+    __tablename__ = "budgets"
+    __table_args__ = (
+        UniqueConstraint("user_id", "category_id", "period", name="uq_budgets_user_id_category_id_period"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), nullable=False)
+    period = Column(String(8), nullable=False)
+    amount = Column(Money, nullable=False)
+
+    category = relationship("Category")
+
+class CategorySpend(Base):
+    """Expenses of a category within one period, kept current by every transaction write."""
+    __tablename__ = "category_spend"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True)
+    period = Column(String(8), primary_key=True)
+    period_start = Column(Date, primary_key=True)
+    spent = Column(Money, nullable=False, default=0.0)
\ No newline at end of file
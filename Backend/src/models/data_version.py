@@ -0,0 +1,11 @@
+from sqlalchemy import Column, DateTime, Integer, String, ForeignKey
+from src.core.database import Base
+
+class DataVersion(Base):
+    """Per-user, per-collection write counter used to validate cached GET responses."""
+    __tablename__ = "data_versions"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    collection = Column(String(32), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
\ No newline at end of file
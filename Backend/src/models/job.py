@@ -0,0 +1,48 @@
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text, false
+from src.core.database import Base
+import enum
+
+class JobKind(enum.Enum):
+    IMPORT = "import"
+    EXPORT = "export"
+
+class JobStatus(enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+class Job(Base):
+    """Long-running import or export, queued in this table until a job worker claims it."""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Workers claim the oldest due job; clients list their own jobs newest first
+        Index("ix_jobs_status_run_after_id", "status", "run_after", "id"),
+        Index("ix_jobs_user_id_id", "user_id", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    kind = Column(String(16), nullable=False)
+    status = Column(String(16), nullable=False)
+    params = Column(JSON, nullable=False)
+    # Rows processed so far, out of ``total`` when that is known up front
+    progress = Column(Integer, nullable=False, default=0, server_default="0")
+    total = Column(Integer, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    max_attempts = Column(Integer, nullable=False)
+    cancel_requested = Column(Boolean, nullable=False, default=False, server_default=false())
+    error = Column(Text, nullable=True)
+    result = Column(JSON, nullable=True)
+    # Name of the downloadable file the job produced, inside its storage directory
+    result_filename = Column(String, nullable=True)
+    worker = Column(String, nullable=True)
+    run_after = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<Job(id={self.id}, user_id={self.user_id}, kind={self.kind}, status={self.status}, progress={self.progress}/{self.total}, attempts={self.attempts})>"
\ No newline at end of file
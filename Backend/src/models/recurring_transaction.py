@@ -0,0 +1,41 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from src.core.database import Base
+from src.models.types import Money, TransactionTypeCode
+import enum
+
+class RecurrenceInterval(enum.Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+class RecurringTransaction(Base):
+    """Template for a transaction that repeats every ``interval_count`` intervals from ``anchor_date``."""
+    __tablename__ = "recurring_transactions"
+    __table_args__ = (
+        # The materialization pass only scans rules that are due
+        Index("ix_recurring_transactions_next_date_id", "next_date", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
+    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=True)
+    amount = Column(Money, nullable=False)
+    transaction_type = Column(TransactionTypeCode, nullable=False)
+    description = Column(String, nullable=True)
+    source = Column(String, nullable=True)
+    interval = Column(String, nullable=False)
+    interval_count = Column(Integer, nullable=False, default=1)
+    anchor_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
+    # Occurrences already turned into transactions, and the date of the next one (null once the rule has ended)
+    materialized_count = Column(Integer, nullable=False, default=0, server_default="0")
+    next_date = Column(Date, nullable=True)
+
+    user = relationship("User")
+    transactions = relationship("Transaction", back_populates="recurring", passive_deletes=True)
+
+    def __repr__(self):
+        return f"<RecurringTransaction(id={self.id}, user_id={self.user_id}, amount={self.amount}, transaction_type={self.transaction_type}, interval={self.interval_count} {self.interval}, anchor_date={self.anchor_date}, next_date={self.next_date})>"
\ No newline at end of file
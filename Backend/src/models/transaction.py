@@ -1,28 +1,45 @@
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from src.core.database import Base
+from src.models.types import Money, TransactionTypeCode
 import enum
 
+# Text searched by /transactions/search. PostgreSQL only uses the expression
+# index created by migration 0005 when a query repeats this expression verbatim.
+SEARCH_DOCUMENT = "coalesce(description, '') || ' ' || coalesce(source, '')"
+SEARCH_CONFIG = "simple"
+
 class TransactionType(enum.Enum):
     EXPENSE = "expense"
     REVENUE = "revenue"
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Keyset pagination walks (date, id) inside a single user's rows
+        Index("ix_transactions_user_id_date_id", "user_id", "date", "id"),
+        Index("ix_transactions_user_id_category_id_date_id", "user_id", "category_id", "date", "id"),
+        Index("ix_transactions_user_id_account_id_date_id", "user_id", "account_id", "date", "id"),
+        # One transaction per occurrence of a recurring rule, so materialization can be rerun safely
+        Index("uq_transactions_recurring_id_occurrence_date", "recurring_id", "occurrence_date", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=True)
-    amount = Column(Float, nullable=False)
-    transaction_type = Column(String, nullable=False)
+    amount = Column(Money, nullable=False)
+    transaction_type = Column(TransactionTypeCode, nullable=False)
     description = Column(String, nullable=True)
     source = Column(String, nullable=True)
     date = Column(Date, nullable=False)
+    recurring_id = Column(Integer, ForeignKey("recurring_transactions.id", ondelete="SET NULL"), nullable=True)
+    occurrence_date = Column(Date, nullable=True)
 
     user = relationship("User", back_populates="transactions")
     category = relationship("Category", back_populates="transactions")
     account = relationship("Account", back_populates="transactions")
+    recurring = relationship("RecurringTransaction", back_populates="transactions")
 
     def __repr__(self):
-        return f"<Transaction(id={self.id}, user_id={self.user_id}, category_id={self.category_id}, amount={self.amount}, transaction_type={self.transaction_type}, description={self.description}, source={self.source}, date={self.date})>" 
\ No newline at end of file
+        return f"<Transaction(id={self.id}, user_id={self.user_id}, category_id={self.category_id}, amount={self.amount}, transaction_type={self.transaction_type}, description={self.description}, source={self.source}, date={self.date})>"
\ No newline at end of file
@@ -0,0 +1,66 @@
+from sqlalchemy import BigInteger, SmallInteger
+from sqlalchemy.types import TypeDecorator
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Optional
+
+# Stored codes of the transaction types; never renumber, rows keep them forever
+TRANSACTION_TYPE_CODES = {"expense": 1, "revenue": 2}
+TRANSACTION_TYPE_NAMES = {code: name for name, code in TRANSACTION_TYPE_CODES.items()}
+
+
+def to_minor_units(value: Any) -> int:
+    """Cents for a decimal amount, rounding half away from zero."""
+    if isinstance(value, int):
+        return value * 100
+    return int((Decimal(str(value)) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_minor_units(value: Any) -> float:
+    if isinstance(value, int):
+        return value / 100
+    # PostgreSQL hands SUM(bigint) back as a Decimal
+    return float(Decimal(value) / 100)
+
+
+class Money(TypeDecorator):
+    """Decimal amounts stored as integer minor units (cents).
+
+    Python and the API keep working with decimal values; the database only
+    ever sees integers, so SUMs computed in SQL are exact. Expressions
+    derived from a Money column (negation, CASE, SUM, COALESCE) keep the
+    type, so their results come back as decimals too. Adding or subtracting
+    two of them types as BigInteger; wrap such a result in
+    ``type_coerce(..., Money)`` before reading it.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        return None if value is None else to_minor_units(value)
+
+    def process_result_value(self, value: Any, dialect) -> Optional[float]:
+        return None if value is None else from_minor_units(value)
+
+    def coerce_compared_value(self, op, value):
+        return self
+
+
+class TransactionTypeCode(TypeDecorator):
+    """``"expense"``/``"revenue"`` stored as a small integer code."""
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        name = getattr(value, "value", value)
+        try:
+            return TRANSACTION_TYPE_CODES[name]
+        except KeyError:
+            raise ValueError(f"Unknown transaction type: {name}")
+
+    def process_result_value(self, value: Any, dialect) -> Optional[str]:
+        return None if value is None else TRANSACTION_TYPE_NAMES[value]
+
+    def coerce_compared_value(self, op, value):
+        return self
\ No newline at end of file
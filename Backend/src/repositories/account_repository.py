@@ -1,15 +1,39 @@
+from sqlalchemy import BigInteger, bindparam, case, func, literal, select, type_coerce, update
 from sqlalchemy.orm import Session
 from src.models.account import Account
+from src.models.transaction import Transaction
+from src.models.types import to_minor_units
+from src.repositories.data_version_repository import DataVersionRepository, ACCOUNTS
 from src.schemas.account import AccountCreate, AccountUpdate
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def signed_amount(transaction_type: str, amount: float) -> int:
+    """Contribution of a transaction to its account balance, in cents."""
+    value = getattr(transaction_type, "value", transaction_type)
+    cents = to_minor_units(amount)
+    return cents if value == "revenue" else -cents
+
+
+def _net_transactions_subquery():
+    signed = case((Transaction.transaction_type == "revenue", Transaction.amount), else_=-Transaction.amount)
+    return (
+        select(func.coalesce(func.sum(signed), 0))
+        # Only the owner's transactions count, even if a row points at someone else's account
+        .where(Transaction.account_id == Account.id, Transaction.user_id == Account.user_id)
+        .scalar_subquery()
+    )
+
 
 class AccountRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.versions = DataVersionRepository(db)
 
     def create(self, user_id: int, account: AccountCreate) -> Account:
-        db_account = Account(**account.dict(), user_id=user_id)
+        db_account = Account(**account.dict(), user_id=user_id, balance=account.initial_balance)
         self.db.add(db_account)
+        self.versions.bump(user_id, ACCOUNTS)
         self.db.commit()
         self.db.refresh(db_account)
         return db_account
@@ -24,8 +48,14 @@ class AccountRepository:
         db_account = self.get(user_id, account_id)
         if not db_account:
             return None
-        for key, value in account.dict(exclude_unset=True).items():
+        update_data = account.dict(exclude_unset=True)
+        if update_data.get("initial_balance") is not None:
+            self.apply_balance_delta(
+                user_id, account_id, to_minor_units(update_data["initial_balance"]) - to_minor_units(db_account.initial_balance)
+            )
+        for key, value in update_data.items():
             setattr(db_account, key, value)
+        self.versions.bump(user_id, ACCOUNTS)
         self.db.commit()
         self.db.refresh(db_account)
         return db_account
@@ -35,5 +65,58 @@ class AccountRepository:
         if not db_account:
             return False
         self.db.delete(db_account)
+        self.versions.bump(user_id, ACCOUNTS)
+        self.db.commit()
+        return True
+
+    def apply_balance_delta(self, user_id: int, account_id: Optional[int], delta: int) -> None:
+        """Shift a stored balance by ``delta`` cents in the caller's transaction; the caller commits."""
+        if account_id is None or not delta:
+            return
+        self.db.execute(
+            update(Account)
+            .where(Account.id == account_id, Account.user_id == user_id)
+            .values(balance=type_coerce(Account.balance, BigInteger) + literal(delta, BigInteger))
+            .execution_options(synchronize_session=False)
+        )
+
+    def apply_balance_deltas(self, deltas: Dict[Tuple[int, Optional[int]], int]) -> None:
+        """``apply_balance_delta`` for many ``(user_id, account_id)`` keys as one executemany UPDATE."""
+        params = [
+            {"b_user_id": user_id, "b_account_id": account_id, "b_delta": delta}
+            for (user_id, account_id), delta in deltas.items()
+            if account_id is not None and delta
+        ]
+        if not params:
+            return
+        accounts = Account.__table__
+        self.db.execute(
+            update(accounts)
+            .where(accounts.c.id == bindparam("b_account_id"), accounts.c.user_id == bindparam("b_user_id"))
+            .values(balance=type_coerce(accounts.c.balance, BigInteger) + bindparam("b_delta", type_=BigInteger)),
+            params,
+        )
+
+    def find_balance_drift(self, user_id: Optional[int] = None) -> List[Any]:
+        """Accounts whose stored balance differs from initial_balance plus their transactions."""
+        # Compared as integer cents in SQL; the returned balances are decimals
+        expected = type_coerce(Account.initial_balance, BigInteger) + _net_transactions_subquery()
+        query = self.db.query(
+            Account.id, Account.user_id, Account.balance, type_coerce(expected, Account.balance.type).label("expected_balance")
+        ).filter(type_coerce(Account.balance, BigInteger) != expected)
+        if user_id is not None:
+            query = query.filter(Account.user_id == user_id)
+        return query.all()
+
+    def rebuild_balances(self, user_id: Optional[int] = None) -> int:
+        """Recompute every stored balance from scratch in one set-based UPDATE."""
+        statement = update(Account).values(balance=Account.initial_balance + _net_transactions_subquery())
+        if user_id is not None:
+            statement = statement.where(Account.user_id == user_id)
+        result = self.db.execute(statement.execution_options(synchronize_session=False))
+        if user_id is None:
+            self.versions.bump_all_users(ACCOUNTS)
+        else:
+            self.versions.bump(user_id, ACCOUNTS)
         self.db.commit()
-        return True 
\ No newline at end of file
+        return result.rowcount
\ No newline at end of file
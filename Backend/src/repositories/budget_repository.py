@@ -0,0 +1,162 @@
+from sqlalchemy import BigInteger, String, and_, bindparam, case, delete, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from src.core.periods import WEEK, MONTH, YEAR, period_start, period_start_sql
+from src.models.budget import Budget, CategorySpend
+from src.models.category import Category
+from src.models.transaction import Transaction
+from src.models.types import from_minor_units, to_minor_units
+from src.schemas.budget import BudgetCreate, BudgetUpdate
+from collections import defaultdict
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+# Every expense is counted once per period a budget can use
+BUDGET_PERIODS = (WEEK, MONTH, YEAR)
+
+SpendKey = Tuple[int, int, str, date]
+
+
+def accumulate_spend(
+    deltas: Dict[SpendKey, int],
+    user_id: int,
+    category_id: Optional[int],
+    transaction_type: str,
+    amount: float,
+    day: date,
+    sign: int = 1,
+) -> None:
+    """Add a transaction's effect on the spend counters to ``deltas``, in cents; only categorized expenses count."""
+    if category_id is None or getattr(transaction_type, "value", transaction_type) != "expense" or not amount:
+        return
+    cents = sign * to_minor_units(amount)
+    for period in BUDGET_PERIODS:
+        deltas[(user_id, category_id, period, period_start(day, period))] += cents
+
+
+class BudgetRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, user_id: int, budget: BudgetCreate) -> Budget:
+        if not self.db.query(Category.id).filter_by(id=budget.category_id, user_id=user_id).first():
+            raise ValueError("Category not found")
+        db_budget = Budget(**budget.dict(), user_id=user_id)
+        self.db.add(db_budget)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise ValueError("A budget for this category and period already exists")
+        self.db.refresh(db_budget)
+        return db_budget
+
+    def get(self, user_id: int, budget_id: int) -> Optional[Budget]:
+        return self.db.query(Budget).filter_by(id=budget_id, user_id=user_id).first()
+
+    def get_all(self, user_id: int) -> List[Budget]:
+        return self.db.query(Budget).filter_by(user_id=user_id).all()
+
+    def update(self, user_id: int, budget_id: int, budget: BudgetUpdate) -> Optional[Budget]:
+        db_budget = self.get(user_id, budget_id)
+        if not db_budget:
+            return None
+        for key, value in budget.dict(exclude_unset=True).items():
+            setattr(db_budget, key, value)
+        self.db.commit()
+        self.db.refresh(db_budget)
+        return db_budget
+
+    def delete(self, user_id: int, budget_id: int) -> bool:
+        db_budget = self.get(user_id, budget_id)
+        if not db_budget:
+            return False
+        self.db.delete(db_budget)
+        self.db.commit()
+        return True
+
+    def get_status(self, user_id: int, as_of: date) -> List[Any]:
+        """Each budget with the counter of the period containing ``as_of``, in one primary-key join."""
+        current_start = case({period: period_start(as_of, period) for period in BUDGET_PERIODS}, value=Budget.period)
+        return (
+            self.db.query(Budget, func.coalesce(CategorySpend.spent, 0).label("spent"))
+            .outerjoin(CategorySpend, and_(
+                CategorySpend.user_id == Budget.user_id,
+                CategorySpend.category_id == Budget.category_id,
+                CategorySpend.period == Budget.period,
+                CategorySpend.period_start == current_start,
+            ))
+            .filter(Budget.user_id == user_id)
+            .order_by(Budget.id)
+            .all()
+        )
+
+    def apply_spend_deltas(self, deltas: Dict[SpendKey, int]) -> None:
+        """Shift spend counters by cents in the caller's transaction with one executemany upsert; the caller commits."""
+        params = [
+            {"user_id": user_id, "category_id": category_id, "period": period, "period_start": start, "s_spent": delta}
+            for (user_id, category_id, period, start), delta in deltas.items()
+            if delta
+        ]
+        if not params:
+            return
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        # The deltas are cents already, so they bypass Money's conversion
+        statement = dialect.insert(CategorySpend).values(spent=bindparam("s_spent", type_=BigInteger))
+        statement = statement.on_conflict_do_update(
+            index_elements=[CategorySpend.user_id, CategorySpend.category_id, CategorySpend.period, CategorySpend.period_start],
+            set_={"spent": CategorySpend.spent + statement.excluded.spent},
+        )
+        self.db.execute(statement, params)
+
+    def _expected_spend(self, period: str, user_id: Optional[int] = None):
+        start = period_start_sql(self.db.get_bind().dialect.name, period, Transaction.date)
+        statement = (
+            select(
+                Transaction.user_id,
+                Transaction.category_id,
+                literal(period, String).label("period"),
+                start.label("period_start"),
+                func.sum(Transaction.amount).label("spent"),
+            )
+            .where(Transaction.transaction_type == "expense", Transaction.category_id.isnot(None))
+            .group_by(Transaction.user_id, Transaction.category_id, start)
+        )
+        if user_id is not None:
+            statement = statement.where(Transaction.user_id == user_id)
+        return statement
+
+    def find_spend_drift(self, user_id: Optional[int] = None) -> List[Tuple[SpendKey, float, float]]:
+        """``(key, stored, expected)`` for every counter that differs from the transactions it summarizes.
+
+        Counters are compared as integer cents.
+        """
+        expected = defaultdict(int)
+        for period in BUDGET_PERIODS:
+            for row in self.db.execute(self._expected_spend(period, user_id)):
+                start = date.fromisoformat(row.period_start) if isinstance(row.period_start, str) else row.period_start
+                expected[(row.user_id, row.category_id, row.period, start)] = to_minor_units(row.spent)
+        query = self.db.query(CategorySpend)
+        if user_id is not None:
+            query = query.filter(CategorySpend.user_id == user_id)
+        stored = {(c.user_id, c.category_id, c.period, c.period_start): to_minor_units(c.spent) for c in query}
+        return [
+            (key, from_minor_units(stored.get(key, 0)), from_minor_units(expected.get(key, 0)))
+            for key in sorted(stored.keys() | expected.keys())
+            if stored.get(key, 0) != expected.get(key, 0)
+        ]
+
+    def rebuild_spend(self, user_id: Optional[int] = None) -> int:
+        """Recompute every counter from scratch with one INSERT ... SELECT per period."""
+        statement = delete(CategorySpend)
+        if user_id is not None:
+            statement = statement.where(CategorySpend.user_id == user_id)
+        self.db.execute(statement.execution_options(synchronize_session=False))
+        columns = ["user_id", "category_id", "period", "period_start", "spent"]
+        rows = 0
+        for period in BUDGET_PERIODS:
+            result = self.db.execute(insert(CategorySpend).from_select(columns, self._expected_spend(period, user_id)))
+            rows += result.rowcount
+        self.db.commit()
+        return rows
\ No newline at end of file
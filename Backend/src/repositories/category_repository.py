@@ -1,15 +1,18 @@
 from sqlalchemy.orm import Session
 from src.models.category import Category
+from src.repositories.data_version_repository import DataVersionRepository, CATEGORIES
 from src.schemas.category import CategoryCreate, CategoryUpdate
 from typing import List, Optional
 
 class CategoryRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.versions = DataVersionRepository(db)
 
     def create(self, user_id: int, category: CategoryCreate) -> Category:
         db_category = Category(**category.dict(), user_id=user_id)
         self.db.add(db_category)
+        self.versions.bump(user_id, CATEGORIES)
         self.db.commit()
         self.db.refresh(db_category)
         return db_category
@@ -26,6 +29,7 @@ class CategoryRepository:
             return None
         for key, value in category.dict(exclude_unset=True).items():
             setattr(db_category, key, value)
+        self.versions.bump(user_id, CATEGORIES)
         self.db.commit()
         self.db.refresh(db_category)
         return db_category
@@ -35,5 +39,6 @@ class CategoryRepository:
         if not db_category:
             return False
         self.db.delete(db_category)
+        self.versions.bump(user_id, CATEGORIES)
         self.db.commit()
         return True 
\ No newline at end of file
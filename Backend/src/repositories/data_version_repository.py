@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from src.models.data_version import DataVersion
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+TRANSACTIONS = "transactions"
+ACCOUNTS = "accounts"
+CATEGORIES = "categories"
+RECURRING = "recurring_transactions"
+
+
+class DataVersionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def bump(self, user_id: int, *collections: str) -> None:
+        """Advance the version of each collection in the caller's transaction; the caller commits."""
+        self.bump_users([user_id], *collections)
+
+    def bump_users(self, user_ids: Iterable[int], *collections: str) -> None:
+        """``bump`` for many users at once, as a single executemany upsert."""
+        now = datetime.now(timezone.utc)
+        params = [
+            {"user_id": user_id, "collection": collection, "version": 1, "updated_at": now}
+            for user_id in user_ids
+            for collection in collections
+        ]
+        if not params:
+            return
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        statement = dialect.insert(DataVersion).on_conflict_do_update(
+            index_elements=[DataVersion.user_id, DataVersion.collection],
+            set_={"version": DataVersion.version + 1, "updated_at": now},
+        )
+        self.db.execute(statement, params)
+
+    def bump_all_users(self, collection: str) -> None:
+        self.db.execute(
+            update(DataVersion)
+            .where(DataVersion.collection == collection)
+            .values(version=DataVersion.version + 1, updated_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+
+    def get(self, user_id: int, collection: str) -> Tuple[int, Optional[datetime]]:
+        row = self.db.query(DataVersion.version, DataVersion.updated_at).filter_by(user_id=user_id, collection=collection).first()
+        if row is None:
+            return 0, None
+        return row.version, row.updated_at
+
+    def get_many(self, user_id: int, collections: Sequence[str]) -> Dict[str, int]:
+        """Current version of each collection in one query; missing rows count as version 0."""
+        rows = self.db.query(DataVersion.collection, DataVersion.version).filter(
+            DataVersion.user_id == user_id, DataVersion.collection.in_(collections)
+        )
+        versions = dict.fromkeys(collections, 0)
+        versions.update({row.collection: row.version for row in rows})
+        return versions
\ No newline at end of file
@@ -0,0 +1,260 @@
+from datetime import datetime, timezone
+from sqlalchemy import select, text, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from src.models.job import Job, JobKind, JobStatus
+from typing import Any, Callable, Collection, Dict, List, NamedTuple, Optional
+
+FINISHED = (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value)
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class Claim(NamedTuple):
+    """One run of a job. Its updates only apply while the job is still running under this claim."""
+    job_id: int
+    worker: str
+    attempt: int
+
+    @classmethod
+    def of(cls, job: Job) -> "Claim":
+        return cls(job.id, job.worker, job.attempts)
+
+
+class JobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _update(self, *criteria, **values) -> int:
+        try:
+            result = self.db.execute(update(Job).where(*criteria).values(**values).execution_options(synchronize_session=False))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return result.rowcount
+
+    def create(
+        self,
+        user_id: int,
+        kind: JobKind,
+        params: Dict[str, Any],
+        max_attempts: int,
+        stage: Optional[Callable[[int], None]] = None,
+    ) -> Job:
+        """Queue a job. ``stage(job_id)`` runs before the commit makes the job visible to workers, e.g. to store its input."""
+        now = utcnow()
+        db_job = Job(
+            user_id=user_id,
+            kind=kind.value,
+            status=JobStatus.QUEUED.value,
+            params=params,
+            progress=0,
+            attempts=0,
+            max_attempts=max_attempts,
+            cancel_requested=False,
+            run_after=now,
+            created_at=now,
+        )
+        try:
+            self.db.add(db_job)
+            self.db.flush()
+            if stage is not None:
+                stage(db_job.id)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        self.db.refresh(db_job)
+        return db_job
+
+    def get(self, user_id: int, job_id: int) -> Optional[Job]:
+        return self.db.query(Job).filter_by(id=job_id, user_id=user_id).first()
+
+    def get_all(self, user_id: int, limit: int) -> List[Job]:
+        return self.db.query(Job).filter(Job.user_id == user_id).order_by(Job.id.desc()).limit(limit).all()
+
+    def claim_next(self, worker: str) -> Optional[Job]:
+        """Mark the oldest due queued job as running by ``worker`` and return it, or None if there is none.
+
+        PostgreSQL workers skip rows another worker is claiming. Elsewhere the
+        status check in the UPDATE settles races: the loser claims nothing and
+        tries the next candidate.
+        """
+        for _ in range(5):
+            now = utcnow()
+            candidate = (
+                select(Job.id)
+                .where(Job.status == JobStatus.QUEUED.value, Job.run_after <= now)
+                .order_by(Job.run_after, Job.id)
+                .limit(1)
+            )
+            if self.db.get_bind().dialect.name == "postgresql":
+                candidate = candidate.with_for_update(skip_locked=True)
+            job_id = self.db.execute(candidate).scalar()
+            if job_id is None:
+                self.db.rollback()
+                return None
+            claimed = self._update(
+                Job.id == job_id,
+                Job.status == JobStatus.QUEUED.value,
+                status=JobStatus.RUNNING.value,
+                worker=worker,
+                attempts=Job.attempts + 1,
+                progress=0,
+                total=None,
+                started_at=now,
+                heartbeat_at=now,
+            )
+            if claimed:
+                return self.db.get(Job, job_id)
+        return None
+
+    @staticmethod
+    def _held(claim: Claim) -> tuple:
+        """Criteria matching the job only while ``claim`` still runs it, i.e. it was not reclaimed as stale."""
+        return (
+            Job.id == claim.job_id,
+            Job.status == JobStatus.RUNNING.value,
+            Job.worker == claim.worker,
+            Job.attempts == claim.attempt,
+        )
+
+    def heartbeat(self, claim: Claim, progress: int, total: Optional[int]) -> bool:
+        """Record a running job's progress; returns whether the run should stop.
+
+        It should stop once the job has been asked to cancel or no longer
+        belongs to this claim. SQLite has a single writer, which the job's own
+        import holds until it commits, so there a beat that cannot get the
+        lock at once is skipped instead of waited for.
+        """
+        sqlite = self.db.get_bind().dialect.name == "sqlite"
+        busy_timeout = None
+        try:
+            if sqlite:
+                busy_timeout = self.db.execute(text("PRAGMA busy_timeout")).scalar()
+                self.db.execute(text("PRAGMA busy_timeout = 0"))
+            held = self._update(*self._held(claim), progress=progress, total=total, heartbeat_at=utcnow())
+        except OperationalError:
+            if not sqlite:
+                raise
+            held = True
+        finally:
+            if busy_timeout is not None:
+                self.db.execute(text(f"PRAGMA busy_timeout = {int(busy_timeout)}"))
+        return not held or self.cancel_requested(claim.job_id)
+
+    def cancel_requested(self, job_id: int) -> bool:
+        requested = self.db.query(Job.cancel_requested).filter(Job.id == job_id).scalar()
+        self.db.rollback()
+        return bool(requested)
+
+    def stage_result(self, claim: Claim, result: Dict[str, Any]) -> None:
+        """Store ``result`` in the caller's open transaction without committing it.
+
+        Work that must not be done twice commits this together with its own
+        writes: the update holds the job row until then, and a later run of
+        the job finds the result and skips the work. Raises ``RuntimeError``
+        when the job no longer belongs to ``claim``.
+        """
+        statement = update(Job).where(*self._held(claim)).values(result=result).execution_options(synchronize_session=False)
+        if not self.db.execute(statement).rowcount:
+            raise RuntimeError(f"Job {claim.job_id} was taken over by another worker")
+
+    def finish(
+        self,
+        claim: Claim,
+        progress: int,
+        total: Optional[int],
+        result: Dict[str, Any],
+        result_filename: Optional[str],
+    ) -> bool:
+        """Mark the job succeeded; False, changing nothing, if it no longer belongs to ``claim``."""
+        return bool(self._update(
+            *self._held(claim),
+            status=JobStatus.SUCCEEDED.value,
+            progress=progress,
+            total=total,
+            result=result,
+            result_filename=result_filename,
+            error=None,
+            finished_at=utcnow(),
+        ))
+
+    def fail(self, claim: Claim, error: str, retry_at: Optional[datetime] = None) -> bool:
+        """Put a failed run back in the queue for ``retry_at``, or fail the job for good when None.
+
+        Like ``finish``, returns False if the job no longer belongs to ``claim``.
+        """
+        if retry_at is None:
+            return bool(self._update(*self._held(claim), status=JobStatus.FAILED.value, error=error, finished_at=utcnow()))
+        return bool(self._update(*self._held(claim), status=JobStatus.QUEUED.value, error=error, run_after=retry_at, worker=None))
+
+    def mark_cancelled(self, claim: Claim) -> bool:
+        return bool(self._update(*self._held(claim), status=JobStatus.CANCELLED.value, finished_at=utcnow()))
+
+    def request_cancel(self, user_id: int, job_id: int) -> Optional[Job]:
+        """Cancel a queued job outright; flag a running one so its worker stops at the next progress report."""
+        owned = (Job.id == job_id, Job.user_id == user_id)
+        self._update(*owned, Job.status == JobStatus.QUEUED.value, status=JobStatus.CANCELLED.value, finished_at=utcnow())
+        self._update(*owned, Job.status == JobStatus.RUNNING.value, cancel_requested=True)
+        return self.get(user_id, job_id)
+
+    def requeue(self, user_id: int, job_id: int) -> bool:
+        """Queue a failed or cancelled job again with a fresh set of attempts."""
+        return bool(self._update(
+            Job.id == job_id,
+            Job.user_id == user_id,
+            Job.status.in_((JobStatus.FAILED.value, JobStatus.CANCELLED.value)),
+            status=JobStatus.QUEUED.value,
+            attempts=0,
+            progress=0,
+            total=None,
+            cancel_requested=False,
+            error=None,
+            result=None,
+            result_filename=None,
+            worker=None,
+            run_after=utcnow(),
+            started_at=None,
+            heartbeat_at=None,
+            finished_at=None,
+        ))
+
+    def reclaim_stale(self, before: datetime, exclude_ids: Collection[int] = ()) -> int:
+        """Requeue running jobs with no heartbeat since ``before``, or fail those out of attempts.
+
+        ``exclude_ids`` are jobs known to be alive, e.g. the ones running in
+        the calling process.
+        """
+        stale = (
+            Job.status == JobStatus.RUNNING.value,
+            Job.heartbeat_at < before,
+            Job.id.notin_(list(exclude_ids)),
+        )
+        error = "The worker running this job stopped responding"
+        failed = self._update(
+            *stale, Job.attempts >= Job.max_attempts,
+            status=JobStatus.FAILED.value, error=error, finished_at=utcnow(),
+        )
+        requeued = self._update(*stale, status=JobStatus.QUEUED.value, error=error, run_after=utcnow(), worker=None)
+        return failed + requeued
+
+    def expired_ids(self, before: datetime) -> List[int]:
+        """Jobs that finished before ``before``."""
+        ids = [job_id for (job_id,) in self.db.query(Job.id).filter(Job.status.in_(FINISHED), Job.finished_at < before)]
+        self.db.rollback()
+        return ids
+
+    def delete_many(self, job_ids: Collection[int]) -> int:
+        if not job_ids:
+            return 0
+        try:
+            deleted = self.db.query(Job).filter(Job.id.in_(list(job_ids))).delete(synchronize_session=False)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return deleted
\ No newline at end of file
@@ -0,0 +1,134 @@
+from sqlalchemy import tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from src.models.recurring_transaction import RecurringTransaction, RecurrenceInterval
+from src.models.transaction import Transaction
+from src.repositories.account_repository import AccountRepository, signed_amount
+from src.repositories.budget_repository import BudgetRepository, accumulate_spend
+from src.repositories.data_version_repository import DataVersionRepository, ACCOUNTS, RECURRING, TRANSACTIONS
+from src.schemas.recurring_transaction import RecurringTransactionCreate, RecurringTransactionUpdate
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import calendar
+
+
+def occurrence_date(anchor: date, interval: str, interval_count: int, index: int) -> date:
+    """Date of the ``index``-th occurrence (0 is the anchor).
+
+    Monthly and yearly rules count from the anchor, so a rule anchored on the
+    31st lands on the last day of shorter months and returns to the 31st after.
+    """
+    interval = getattr(interval, "value", interval)
+    step = index * interval_count
+    if interval == RecurrenceInterval.DAY.value:
+        return anchor + timedelta(days=step)
+    if interval == RecurrenceInterval.WEEK.value:
+        return anchor + timedelta(weeks=step)
+    months = anchor.month - 1 + (step if interval == RecurrenceInterval.MONTH.value else step * 12)
+    year, month = anchor.year + months // 12, months % 12 + 1
+    return date(year, month, min(anchor.day, calendar.monthrange(year, month)[1]))
+
+
+def scheduled_date(rule: RecurringTransaction, index: int) -> Optional[date]:
+    """Date of the rule's ``index``-th occurrence, or None if that falls after its end date."""
+    scheduled = occurrence_date(rule.anchor_date, rule.interval, rule.interval_count, index)
+    return scheduled if rule.end_date is None or scheduled <= rule.end_date else None
+
+
+def next_occurrence(rule: RecurringTransaction) -> Optional[date]:
+    """First occurrence not yet materialized, or None once the rule has ended."""
+    return scheduled_date(rule, rule.materialized_count or 0)
+
+
+class RecurringTransactionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+        self.accounts = AccountRepository(db)
+        self.budgets = BudgetRepository(db)
+        self.versions = DataVersionRepository(db)
+
+    def create(self, user_id: int, rule: RecurringTransactionCreate) -> RecurringTransaction:
+        db_rule = RecurringTransaction(**rule.dict(), user_id=user_id, materialized_count=0)
+        db_rule.next_date = next_occurrence(db_rule)
+        self.db.add(db_rule)
+        self.versions.bump(user_id, RECURRING)
+        self.db.commit()
+        self.db.refresh(db_rule)
+        return db_rule
+
+    def get(self, user_id: int, rule_id: int) -> Optional[RecurringTransaction]:
+        return self.db.query(RecurringTransaction).filter_by(id=rule_id, user_id=user_id).first()
+
+    def get_all(self, user_id: int) -> List[RecurringTransaction]:
+        return self.db.query(RecurringTransaction).filter_by(user_id=user_id).all()
+
+    def update(self, user_id: int, rule_id: int, rule: RecurringTransactionUpdate) -> Optional[RecurringTransaction]:
+        """Change the template or end date; occurrences already materialized are left as they are."""
+        db_rule = self.get(user_id, rule_id)
+        if not db_rule:
+            return None
+        for key, value in rule.dict(exclude_unset=True).items():
+            setattr(db_rule, key, value)
+        db_rule.next_date = next_occurrence(db_rule)
+        self.versions.bump(user_id, RECURRING)
+        self.db.commit()
+        self.db.refresh(db_rule)
+        return db_rule
+
+    def delete(self, user_id: int, rule_id: int) -> bool:
+        """Delete a rule, keeping the transactions it already produced."""
+        db_rule = self.get(user_id, rule_id)
+        if not db_rule:
+            return False
+        self.db.query(Transaction).filter(Transaction.recurring_id == rule_id).update(
+            {Transaction.recurring_id: None}, synchronize_session=False
+        )
+        self.db.delete(db_rule)
+        self.versions.bump(user_id, TRANSACTIONS, RECURRING)
+        self.db.commit()
+        return True
+
+    def get_due(self, as_of: date, limit: int, after: Optional[Tuple[date, int]] = None) -> List[RecurringTransaction]:
+        """Rules with an occurrence on or before ``as_of``, in ``(next_date, id)`` order after the given key."""
+        query = self.db.query(RecurringTransaction).filter(RecurringTransaction.next_date <= as_of)
+        if after is not None:
+            query = query.filter(tuple_(RecurringTransaction.next_date, RecurringTransaction.id) > tuple_(*after))
+        return query.order_by(RecurringTransaction.next_date, RecurringTransaction.id).limit(limit).all()
+
+    def materialize(self, values: List[Dict[str, Any]]) -> int:
+        """Insert occurrence transactions and commit them with the rules' advanced progress.
+
+        ``values`` go out as one multi-row INSERT. Occurrences that already
+        have a transaction are skipped by the ``(recurring_id, occurrence_date)``
+        unique index, so only rows actually inserted move account balances and
+        budget spend counters.
+        Returns the number of rows inserted.
+        """
+        try:
+            inserted = []
+            if values:
+                dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+                statement = (
+                    dialect.insert(Transaction)
+                    .on_conflict_do_nothing(index_elements=[Transaction.recurring_id, Transaction.occurrence_date])
+                    .returning(
+                        Transaction.user_id, Transaction.account_id, Transaction.category_id,
+                        Transaction.transaction_type, Transaction.amount, Transaction.date,
+                    )
+                )
+                inserted = self.db.execute(statement, values).all()
+            deltas = defaultdict(int)
+            spend = defaultdict(int)
+            for row in inserted:
+                deltas[(row.user_id, row.account_id)] += signed_amount(row.transaction_type, row.amount)
+                accumulate_spend(spend, row.user_id, row.category_id, row.transaction_type, row.amount, row.date)
+            self.accounts.apply_balance_deltas(deltas)
+            self.budgets.apply_spend_deltas(spend)
+            self.versions.bump_users({row.user_id for row in inserted}, TRANSACTIONS, ACCOUNTS)
+            self.versions.bump_users({value["user_id"] for value in values}, RECURRING)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(inserted)
\ No newline at end of file
@@ -1,31 +1,378 @@
+from sqlalchemy import case, column, func, insert, literal_column, select, table, tuple_
 from sqlalchemy.orm import Session
-from src.models.transaction import Transaction, TransactionType
-from src.schemas.transaction import TransactionCreate, TransactionUpdate
-from typing import List, Optional
+from src.core.periods import period_start_sql
+from src.models.account import Account
+from src.models.category import Category
+from src.models.transaction import Transaction, TransactionType, SEARCH_CONFIG, SEARCH_DOCUMENT
+from src.repositories.account_repository import AccountRepository, signed_amount
+from src.repositories.budget_repository import BudgetRepository, accumulate_spend
+from src.repositories.data_version_repository import DataVersionRepository, ACCOUNTS, TRANSACTIONS
+from src.schemas.transaction import (
+    TransactionCreate, TransactionUpdate, TransactionFilter, TransactionBulkFilter, SummaryGroup, SummaryPeriod,
+)
+from datetime import date
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+# Every column of a transaction, for read paths that skip ORM instantiation
+ROW_COLUMNS = (
+    Transaction.id,
+    Transaction.user_id,
+    Transaction.category_id,
+    Transaction.account_id,
+    Transaction.amount,
+    Transaction.transaction_type,
+    Transaction.description,
+    Transaction.source,
+    Transaction.date,
+    Transaction.recurring_id,
+)
+ROW_FIELDS = tuple(column.key for column in ROW_COLUMNS)
+
+# Columns a transaction's balance and spend counter contributions depend on, besides the amount
+BOOKKEEPING_KEYS = ("account_id", "category_id", "transaction_type", "date")
+
+transactions_fts = table("transactions_fts", column("rowid"))
+
 
 class TransactionRepository:
     def __init__(self, db: Session):
         self.db = db
+        self.accounts = AccountRepository(db)
+        self.budgets = BudgetRepository(db)
+        self.versions = DataVersionRepository(db)
 
     def create(self, user_id: int, transaction: TransactionCreate) -> Transaction:
         db_transaction = Transaction(**transaction.dict(), user_id=user_id)
         self.db.add(db_transaction)
+        self.accounts.apply_balance_delta(
+            user_id, db_transaction.account_id, signed_amount(db_transaction.transaction_type, db_transaction.amount)
+        )
+        spend = defaultdict(int)
+        accumulate_spend(spend, user_id, transaction.category_id, transaction.transaction_type, transaction.amount, transaction.date)
+        self.budgets.apply_spend_deltas(spend)
+        self.versions.bump(user_id, TRANSACTIONS, ACCOUNTS)
         self.db.commit()
         self.db.refresh(db_transaction)
         return db_transaction
 
+    def bulk_create(
+        self,
+        user_id: int,
+        chunks: Iterable[List[TransactionCreate]],
+        before_commit: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[int, int]:
+        """Insert every chunk with one multi-row INSERT each, all in a single transaction.
+
+        Account balances and budget spend counters are shifted once per key
+        per chunk. Nothing is committed unless every chunk succeeds.
+        ``before_commit(rows, chunks)`` runs inside the transaction, e.g. to
+        record the import with it; raising aborts the import. Returns
+        ``(rows, chunks)``.
+        """
+        rows = chunk_count = 0
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                values = [{**transaction.dict(), "user_id": user_id} for transaction in chunk]
+                self.db.execute(insert(Transaction), values)
+                self._apply_inserted(user_id, values)
+                rows += len(values)
+                chunk_count += 1
+            if rows:
+                self.versions.bump(user_id, TRANSACTIONS, ACCOUNTS)
+            if before_commit is not None:
+                before_commit(rows, chunk_count)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return rows, chunk_count
+
+    def create_many(self, user_id: int, transactions: List[TransactionCreate]) -> List[int]:
+        """Insert ``transactions`` as one multi-row INSERT and commit; returns their ids in input order."""
+        if not transactions:
+            return []
+        values = [{**transaction.dict(), "user_id": user_id} for transaction in transactions]
+        try:
+            statement = insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True)
+            ids = list(self.db.execute(statement, values).scalars())
+            self._apply_inserted(user_id, values)
+            self.versions.bump(user_id, TRANSACTIONS, ACCOUNTS)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return ids
+
+    def _apply_inserted(self, user_id: int, values: List[dict]) -> None:
+        """Shift account balances and budget spend counters once per key for freshly inserted rows."""
+        deltas = defaultdict(int)
+        spend = defaultdict(int)
+        for value in values:
+            deltas[(user_id, value["account_id"])] += signed_amount(value["transaction_type"], value["amount"])
+            accumulate_spend(spend, user_id, value["category_id"], value["transaction_type"], value["amount"], value["date"])
+        self.accounts.apply_balance_deltas(deltas)
+        self.budgets.apply_spend_deltas(spend)
+
+    def owned_references(self, user_id: int, category_ids: Set[int], account_ids: Set[int]) -> Tuple[Set[int], Set[int]]:
+        """The subsets of ``category_ids`` and ``account_ids`` that exist and belong to the user."""
+        categories = accounts = set()
+        if category_ids:
+            categories = set(self.db.scalars(
+                select(Category.id).where(Category.user_id == user_id, Category.id.in_(category_ids))
+            ))
+        if account_ids:
+            accounts = set(self.db.scalars(
+                select(Account.id).where(Account.user_id == user_id, Account.id.in_(account_ids))
+            ))
+        return categories, accounts
+
+    def check_references(self, user_id: int, category_id: Optional[int], account_id: Optional[int]) -> None:
+        """Raise ``ValueError`` unless the category and account, where given, belong to the user."""
+        categories, accounts = self.owned_references(
+            user_id,
+            {category_id} if category_id is not None else set(),
+            {account_id} if account_id is not None else set(),
+        )
+        if category_id is not None and category_id not in categories:
+            raise ValueError(f"Category {category_id} not found")
+        if account_id is not None and account_id not in accounts:
+            raise ValueError(f"Account {account_id} not found")
+
     def get(self, user_id: int, transaction_id: int) -> Optional[Transaction]:
         return self.db.query(Transaction).filter_by(id=transaction_id, user_id=user_id).first()
 
     def get_all(self, user_id: int) -> List[Transaction]:
         return self.db.query(Transaction).filter_by(user_id=user_id).all()
 
+    def iter_rows(self, user_id: int, chunk_size: int, filters: Optional[TransactionFilter] = None) -> Iterator[Any]:
+        """Stream a user's transactions matching ``filters`` as plain rows, oldest first, ``chunk_size`` at a time.
+
+        Selecting columns instead of entities keeps the identity map empty, and
+        ``yield_per`` uses a server-side cursor where the driver supports one.
+        """
+        statement = (
+            self._filtered(user_id, filters or TransactionFilter())
+            .with_entities(*ROW_COLUMNS)
+            .order_by(Transaction.date, Transaction.id)
+            .statement.execution_options(yield_per=chunk_size)
+        )
+        yield from self.db.execute(statement)
+
+    def monthly_net(self, user_id: int, date_from: date, date_to: date) -> List[Any]:
+        """``(account_id, month, net)`` per account and month in ``[date_from, date_to)``, revenue minus expenses.
+
+        Transactions produced by a recurring rule are left out; forecasts
+        project those from the rule itself.
+        """
+        month = period_start_sql(self.db.get_bind().dialect.name, SummaryPeriod.MONTH, Transaction.date)
+        signed = case((Transaction.transaction_type == "expense", -Transaction.amount), else_=Transaction.amount)
+        statement = (
+            select(Transaction.account_id, month.label("month"), func.sum(signed).label("net"))
+            .where(
+                Transaction.user_id == user_id,
+                Transaction.date >= date_from,
+                Transaction.date < date_to,
+                Transaction.account_id.isnot(None),
+                Transaction.recurring_id.is_(None),
+            )
+            .group_by(Transaction.account_id, month)
+        )
+        return self.db.execute(statement).all()
+
+    def _filtered(self, user_id: int, filters: TransactionFilter):
+        query = self.db.query(Transaction).filter(Transaction.user_id == user_id)
+        if filters.date_from is not None:
+            query = query.filter(Transaction.date >= filters.date_from)
+        if filters.date_to is not None:
+            query = query.filter(Transaction.date <= filters.date_to)
+        if filters.category_id is not None:
+            query = query.filter(Transaction.category_id == filters.category_id)
+        if filters.account_id is not None:
+            query = query.filter(Transaction.account_id == filters.account_id)
+        if filters.transaction_type is not None:
+            query = query.filter(Transaction.transaction_type == filters.transaction_type.value)
+        if filters.min_amount is not None:
+            query = query.filter(Transaction.amount >= filters.min_amount)
+        if filters.max_amount is not None:
+            query = query.filter(Transaction.amount <= filters.max_amount)
+        return query
+
+    def _bulk_filtered(self, user_id: int, filters: TransactionBulkFilter):
+        query = self._filtered(user_id, filters)
+        if filters.ids is not None:
+            query = query.filter(Transaction.id.in_(filters.ids))
+        if filters.description is not None:
+            query = query.filter(Transaction.description.icontains(filters.description, autoescape=True))
+        return query
+
+    def count_matching(self, user_id: int, filters: TransactionBulkFilter) -> int:
+        return self._bulk_filtered(user_id, filters).count()
+
+    def _bookkeeping_groups(self, query) -> List[Any]:
+        """Amount sums of the matched rows per distinct ``BOOKKEEPING_KEYS`` combination."""
+        keys = [getattr(Transaction, key) for key in BOOKKEEPING_KEYS]
+        return query.with_entities(*keys, func.sum(Transaction.amount).label("amount")).group_by(*keys).all()
+
+    def bulk_update(self, user_id: int, filters: TransactionBulkFilter, values: Dict[str, Any]) -> int:
+        """Apply ``values`` to every matching transaction with one ``UPDATE ... WHERE``.
+
+        When the patch touches a column balances or spend counters depend on,
+        the matched rows are first summed per bookkeeping key in one GROUP BY,
+        and each group's contribution is moved from its old key to its new one.
+        Returns the number of rows updated.
+        """
+        query = self._bulk_filtered(user_id, filters)
+        try:
+            if values.keys() & set(BOOKKEEPING_KEYS):
+                deltas = defaultdict(int)
+                spend = defaultdict(int)
+                for group in self._bookkeeping_groups(query):
+                    new = {**group._asdict(), **values}
+                    deltas[(user_id, group.account_id)] -= signed_amount(group.transaction_type, group.amount)
+                    deltas[(user_id, new["account_id"])] += signed_amount(new["transaction_type"], group.amount)
+                    accumulate_spend(spend, user_id, group.category_id, group.transaction_type, group.amount, group.date, sign=-1)
+                    accumulate_spend(spend, user_id, new["category_id"], new["transaction_type"], group.amount, new["date"])
+                self.accounts.apply_balance_deltas(deltas)
+                self.budgets.apply_spend_deltas(spend)
+            affected = query.update(values, synchronize_session=False)
+            if affected:
+                self.versions.bump(user_id, TRANSACTIONS, ACCOUNTS)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return affected
+
+    def bulk_delete(self, user_id: int, filters: TransactionBulkFilter) -> int:
+        """Delete every matching transaction with one ``DELETE ... WHERE``, backing out its bookkeeping first."""
+        query = self._bulk_filtered(user_id, filters)
+        try:
+            deltas = defaultdict(int)
+            spend = defaultdict(int)
+            for group in self._bookkeeping_groups(query):
+                deltas[(user_id, group.account_id)] -= signed_amount(group.transaction_type, group.amount)
+                accumulate_spend(spend, user_id, group.category_id, group.transaction_type, group.amount, group.date, sign=-1)
+            self.accounts.apply_balance_deltas(deltas)
+            self.budgets.apply_spend_deltas(spend)
+            affected = query.delete(synchronize_session=False)
+            if affected:
+                self.versions.bump(user_id, TRANSACTIONS, ACCOUNTS)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return affected
+
+    def get_page(
+        self,
+        user_id: int,
+        filters: TransactionFilter,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+    ) -> List[Any]:
+        """Newest-first page of at most ``limit`` column rows strictly after the ``(date, id)`` key."""
+        query = self._filtered(user_id, filters).with_entities(*ROW_COLUMNS)
+        if after is not None:
+            query = query.filter(tuple_(Transaction.date, Transaction.id) < tuple_(*after))
+        return query.order_by(Transaction.date.desc(), Transaction.id.desc()).limit(limit).all()
+
+    def search(
+        self,
+        user_id: int,
+        terms: Sequence[str],
+        filters: TransactionFilter,
+        limit: int,
+        offset: int = 0,
+    ) -> List[Any]:
+        """Column rows matching every term as a prefix, best match first, with a trailing ``rank`` column.
+
+        PostgreSQL matches against the GIN-indexed tsvector of description and
+        source; SQLite goes through the ``transactions_fts`` FTS5 table.
+        """
+        query = self._filtered(user_id, filters)
+        if self.db.get_bind().dialect.name == "sqlite":
+            # bm25() is lower for better matches; negate it so rank grows with relevance
+            rank = (-func.bm25(literal_column("transactions_fts"))).label("rank")
+            match = " ".join(f'"{term}"*' for term in terms)
+            query = (
+                query.join(transactions_fts, transactions_fts.c.rowid == Transaction.id)
+                .filter(literal_column("transactions_fts").op("MATCH")(match))
+            )
+        else:
+            config = literal_column(f"'{SEARCH_CONFIG}'")
+            document = func.to_tsvector(config, literal_column(SEARCH_DOCUMENT))
+            tsquery = func.to_tsquery(config, " & ".join(f"{term}:*" for term in terms))
+            rank = func.ts_rank_cd(document, tsquery).label("rank")
+            query = query.filter(document.op("@@")(tsquery))
+        return (
+            query.with_entities(*ROW_COLUMNS, rank)
+            .order_by(rank.desc(), Transaction.date.desc(), Transaction.id.desc())
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+
+    def _period_start(self, period: SummaryPeriod):
+        """SQL expression truncating ``Transaction.date`` to the start of its period."""
+        return period_start_sql(self.db.get_bind().dialect.name, period, Transaction.date)
+
+    def summarize(
+        self,
+        user_id: int,
+        filters: TransactionFilter,
+        group_by: Sequence[SummaryGroup] = (),
+        period: Optional[SummaryPeriod] = None,
+    ) -> List[Any]:
+        """Income/expense sums and counts per group, computed in a single GROUP BY query."""
+        is_revenue = Transaction.transaction_type == "revenue"
+        is_expense = Transaction.transaction_type == "expense"
+        keys = []
+        if period is not None:
+            keys.append(self._period_start(period).label("period"))
+        if SummaryGroup.CATEGORY in group_by:
+            keys.append(Transaction.category_id.label("category_id"))
+        if SummaryGroup.ACCOUNT in group_by:
+            keys.append(Transaction.account_id.label("account_id"))
+
+        query = self._filtered(user_id, filters).with_entities(
+            *keys,
+            func.coalesce(func.sum(case((is_revenue, Transaction.amount), else_=0)), 0).label("income"),
+            func.coalesce(func.sum(case((is_expense, Transaction.amount), else_=0)), 0).label("expense"),
+            func.count(case((is_revenue, 1))).label("income_count"),
+            func.count(case((is_expense, 1))).label("expense_count"),
+        )
+        if keys:
+            query = query.group_by(*keys).order_by(*keys)
+        return query.all()
+
     def update(self, user_id: int, transaction_id: int, transaction: TransactionUpdate) -> Optional[Transaction]:
         db_transaction = self.get(user_id, transaction_id)
         if not db_transaction:
             return None
+        old_account_id = db_transaction.account_id
+        old_amount = signed_amount(db_transaction.transaction_type, db_transaction.amount)
+        spend = defaultdict(int)
+        accumulate_spend(
+            spend, user_id, db_transaction.category_id, db_transaction.transaction_type,
+            db_transaction.amount, db_transaction.date, sign=-1,
+        )
         for key, value in transaction.dict().items():
             setattr(db_transaction, key, value)
+        new_amount = signed_amount(db_transaction.transaction_type, db_transaction.amount)
+        if old_account_id == db_transaction.account_id:
+            self.accounts.apply_balance_delta(user_id, old_account_id, new_amount - old_amount)
+        else:
+            self.accounts.apply_balance_delta(user_id, old_account_id, -old_amount)
+            self.accounts.apply_balance_delta(user_id, db_transaction.account_id, new_amount)
+        accumulate_spend(
+            spend, user_id, db_transaction.category_id, db_transaction.transaction_type,
+            db_transaction.amount, db_transaction.date,
+        )
+        self.budgets.apply_spend_deltas(spend)
+        self.versions.bump(user_id, TRANSACTIONS, ACCOUNTS)
         self.db.commit()
         self.db.refresh(db_transaction)
         return db_transaction
@@ -34,6 +381,16 @@ class TransactionRepository:
         db_transaction = self.get(user_id, transaction_id)
         if not db_transaction:
             return False
+        self.accounts.apply_balance_delta(
+            user_id, db_transaction.account_id, -signed_amount(db_transaction.transaction_type, db_transaction.amount)
+        )
+        spend = defaultdict(int)
+        accumulate_spend(
+            spend, user_id, db_transaction.category_id, db_transaction.transaction_type,
+            db_transaction.amount, db_transaction.date, sign=-1,
+        )
+        self.budgets.apply_spend_deltas(spend)
         self.db.delete(db_transaction)
+        self.versions.bump(user_id, TRANSACTIONS, ACCOUNTS)
         self.db.commit()
-        return True 
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -2,40 +2,44 @@ from sqlalchemy.orm import Session
 
 from src.models.user import User
 from src.schemas.user import UserCreate, UserUpdate
-from src.core.security import get_password_hash
+from src.core.cache import user_cache
 
 
 class UserRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def get(self, user_id: int) -> User | None:
+        return self.db.query(User).filter(User.id == user_id).first()
+
     def get_by_email(self, email: str) -> User | None:
         return self.db.query(User).filter(User.email == email).first()
 
     def get_by_username(self, username: str) -> User | None:
         return self.db.query(User).filter(User.username == username).first()
 
-    def create(self, user: UserCreate) -> User:
+    def create(self, user: UserCreate, hashed_password: str) -> User:
         db_user = User(
             email=user.email,
             username=user.username,
-            hashed_password=get_password_hash(user.password)
+            hashed_password=hashed_password
         )
         self.db.add(db_user)
         self.db.commit()
         self.db.refresh(db_user)
         return db_user
 
-    def update_user(self, user_id: int, user_update: UserUpdate) -> User | None:
+    def update_user(self, user_id: int, user_update: UserUpdate, hashed_password: str | None = None) -> User | None:
         db_user = self.db.query(User).filter(User.id == user_id).first()
         if not db_user:
             return None
 
         update_data = user_update.dict(exclude_unset=True)
 
-        if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data["password"])
-            del update_data["password"]
+        # The plain password is hashed by the caller, off the database thread
+        update_data.pop("password", None)
+        if hashed_password is not None:
+            update_data["hashed_password"] = hashed_password
 
         for key, value in update_data.items():
             setattr(db_user, key, value)
@@ -43,4 +47,7 @@ class UserRepository:
         self.db.add(db_user)
         self.db.commit()
         self.db.refresh(db_user)
+        if update_data:
+            # Tokens resolved before the change must not keep serving the old record
+            user_cache.invalidate_where(lambda cached: cached.id == user_id)
         return db_user 
\ No newline at end of file
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List
-from src.core.database import get_db
+from src.core.database import get_db, get_read_db
 from src.services.auth_service import get_current_user
+from src.services.data_version_service import DataVersionService, ACCOUNTS
 from src.services.account_service import AccountService
 from src.schemas.account import AccountCreate, AccountUpdate, AccountInDB
 from src.models.user import User
@@ -18,7 +20,7 @@ async def create_account(
     try:
         user = await current_user
         service = AccountService(db)
-        return service.create_account(user.id, account)
+        return await run_in_threadpool(service.create_account, user.id, account)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -26,13 +28,16 @@ async def create_account(
 
 @router.get("/", response_model=List[AccountInDB])
 async def list_accounts(
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
         user = await current_user
+        await DataVersionService(db).check_not_modified(request, response, user.id, ACCOUNTS)
         service = AccountService(db)
-        return service.get_accounts(user.id)
+        return await run_in_threadpool(service.get_accounts, user.id)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -41,13 +46,16 @@ async def list_accounts(
 @router.get("/{account_id}", response_model=AccountInDB)
 async def get_account(
     account_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
         user = await current_user
+        await DataVersionService(db).check_not_modified(request, response, user.id, ACCOUNTS)
         service = AccountService(db)
-        account = service.get_account(user.id, account_id)
+        account = await run_in_threadpool(service.get_account, user.id, account_id)
         if not account:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
         return account
@@ -66,7 +74,7 @@ async def update_account(
     try:
         user = await current_user
         service = AccountService(db)
-        updated = service.update_account(user.id, account_id, account)
+        updated = await run_in_threadpool(service.update_account, user.id, account_id, account)
         if not updated:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
         return updated
@@ -84,7 +92,7 @@ async def delete_account(
     try:
         user = await current_user
         service = AccountService(db)
-        deleted = service.delete_account(user.id, account_id)
+        deleted = await run_in_threadpool(service.delete_account, user.id, account_id)
         if not deleted:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
         return None
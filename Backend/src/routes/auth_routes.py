@@ -6,9 +6,9 @@ from src.services.auth_service import AuthService
 router = APIRouter(tags=["auth"])
 
 @router.post("/register", response_model=UserSchema)
-def register(user: UserCreate, auth_service: AuthService = Depends()):
+async def register(user: UserCreate, auth_service: AuthService = Depends()):
     try:
-        return auth_service.register_user(user)
+        return await auth_service.register_user(user)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -20,16 +20,14 @@ async def login(
     auth_service: AuthService = Depends()
 ):
     try:
-        user = auth_service.authenticate_user(form_data.username, form_data.password)
+        user = await auth_service.authenticate_user(form_data.username, form_data.password)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        access_token = auth_service.create_access_token(
-            data={"sub": user.username}
-        )
+        access_token = auth_service.create_user_token(user)
         return {"access_token": access_token, "token_type": "bearer"}
     except HTTPException as e:
         raise e
@@ -0,0 +1,113 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from datetime import date
+from typing import List, Optional
+from src.core.database import get_db, get_read_db
+from src.services.auth_service import get_current_user
+from src.services.budget_service import BudgetService
+from src.schemas.budget import BudgetCreate, BudgetUpdate, BudgetInDB, BudgetStatus
+from src.models.user import User
+
+router = APIRouter(prefix="/budgets", tags=["budgets"])
+
+@router.post("/", response_model=BudgetInDB, status_code=status.HTTP_201_CREATED)
+async def create_budget(
+    budget: BudgetCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = BudgetService(db)
+        return await run_in_threadpool(service.create_budget, user.id, budget)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while creating budget: {e}")
+
+@router.get("/", response_model=List[BudgetInDB])
+async def list_budgets(
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = BudgetService(db)
+        return await run_in_threadpool(service.get_budgets, user.id)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while listing budgets: {e}")
+
+@router.get("/status", response_model=List[BudgetStatus])
+async def get_budget_status(
+    as_of: Optional[date] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = BudgetService(db)
+        return await run_in_threadpool(service.get_status, user.id, as_of)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while computing budget status: {e}")
+
+@router.get("/{budget_id}", response_model=BudgetInDB)
+async def get_budget(
+    budget_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = BudgetService(db)
+        budget = await run_in_threadpool(service.get_budget, user.id, budget_id)
+        if not budget:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget not found")
+        return budget
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while fetching budget: {e}")
+
+@router.put("/{budget_id}", response_model=BudgetInDB)
+async def update_budget(
+    budget_id: int,
+    budget: BudgetUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = BudgetService(db)
+        updated = await run_in_threadpool(service.update_budget, user.id, budget_id, budget)
+        if not updated:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget not found")
+        return updated
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while updating budget: {e}")
+
+@router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_budget(
+    budget_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = BudgetService(db)
+        deleted = await run_in_threadpool(service.delete_budget, user.id, budget_id)
+        if not deleted:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget not found")
+        return None
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while deleting budget: {e}")
\ No newline at end of file
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List
-from src.core.database import get_db
+from src.core.database import get_db, get_read_db
 from src.services.auth_service import get_current_user
+from src.services.data_version_service import DataVersionService, CATEGORIES
 from src.services.category_service import CategoryService
 from src.schemas.category import CategoryCreate, CategoryUpdate, CategoryInDB
 from src.models.user import User
@@ -18,7 +20,7 @@ async def create_category(
     try:
         user = await current_user
         service = CategoryService(db)
-        return service.create_category(user.id, category)
+        return await run_in_threadpool(service.create_category, user.id, category)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -26,13 +28,16 @@ async def create_category(
 
 @router.get("/", response_model=List[CategoryInDB])
 async def list_categories(
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
         user = await current_user
+        await DataVersionService(db).check_not_modified(request, response, user.id, CATEGORIES)
         service = CategoryService(db)
-        return service.get_categories(user.id)
+        return await run_in_threadpool(service.get_categories, user.id)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -41,13 +46,16 @@ async def list_categories(
 @router.get("/{category_id}", response_model=CategoryInDB)
 async def get_category(
     category_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
         user = await current_user
+        await DataVersionService(db).check_not_modified(request, response, user.id, CATEGORIES)
         service = CategoryService(db)
-        category = service.get_category(user.id, category_id)
+        category = await run_in_threadpool(service.get_category, user.id, category_id)
         if not category:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
         return category
@@ -66,7 +74,7 @@ async def update_category(
     try:
         user = await current_user
         service = CategoryService(db)
-        updated = service.update_category(user.id, category_id, category)
+        updated = await run_in_threadpool(service.update_category, user.id, category_id, category)
         if not updated:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
         return updated
@@ -84,7 +92,7 @@ async def delete_category(
     try:
         user = await current_user
         service = CategoryService(db)
-        deleted = service.delete_category(user.id, category_id)
+        deleted = await run_in_threadpool(service.delete_category, user.id, category_id)
         if not deleted:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
         return None
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from src.core.admission import admission, report_limiter
+from src.core.database import get_read_db
+from src.services.auth_service import get_current_user
+from src.services.forecast_service import ForecastService
+from src.schemas.forecast import Forecast
+from src.models.user import User
+
+router = APIRouter(prefix="/forecast", tags=["forecast"])
+
+@router.get("/", response_model=Forecast, dependencies=[Depends(admission(report_limiter))])
+async def get_forecast(
+    months: int = Query(12, ge=1, le=60),
+    history_months: int = Query(6, ge=1, le=60),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = ForecastService(db)
+        return await run_in_threadpool(service.forecast, user.id, months, history_months)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while forecasting balances: {e}")
\ No newline at end of file
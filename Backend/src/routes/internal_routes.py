@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends
+
+from src.core.admission import limiters
+from src.core.cache import forecast_cache, user_cache
+from src.core.database import engine, pool_stats, read_routing
+from src.services.auth_service import require_admin
+from src.services.job_service import job_worker
+
+# Operational state of this process, some of it per user: admins only
+router = APIRouter(prefix="/internal", tags=["internal"], dependencies=[Depends(require_admin)])
+
+@router.get("/auth-cache")
+async def auth_cache_stats():
+    return user_cache.stats()
+
+@router.get("/forecast-cache")
+async def forecast_cache_stats():
+    return forecast_cache.stats()
+
+@router.get("/db-pool")
+async def db_pool_stats():
+    return pool_stats.snapshot(engine.pool)
+
+@router.get("/read-routing")
+async def read_routing_stats():
+    return read_routing.stats()
+
+@router.get("/admission")
+async def admission_stats():
+    return {limiter.name: limiter.stats() for limiter in limiters}
+
+@router.get("/jobs")
+async def job_worker_stats():
+    return job_worker.stats()
\ No newline at end of file
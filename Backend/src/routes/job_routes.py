@@ -0,0 +1,142 @@
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from src.core.admission import admission, export_limiter, import_limiter
+from src.core.database import get_db
+from src.services.auth_service import get_current_user
+from src.services.job_service import JobService
+from src.schemas.job import JobInDB
+from src.schemas.transaction import ExportFormat, TransactionFilter
+from src.models.user import User
+
+# Job state is changed by the workers, not by the client, so read-your-writes
+# pinning would not cover it: every job route reads from the primary
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@router.post("/import", response_model=JobInDB, status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(admission(import_limiter))])
+async def enqueue_import(
+    file: UploadFile = File(...),
+    chunk_size: Optional[int] = Query(None, ge=1, le=50000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = JobService(db)
+        return await run_in_threadpool(service.enqueue_import, user.id, file.file, chunk_size)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while queueing import: {e}")
+
+@router.post("/export", response_model=JobInDB, status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(admission(export_limiter))])
+async def enqueue_export(
+    filters: TransactionFilter = Depends(),
+    export_format: ExportFormat = Query(ExportFormat.JSON, alias="format"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = JobService(db)
+        return await run_in_threadpool(service.enqueue_export, user.id, filters, export_format)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while queueing export: {e}")
+
+@router.get("/", response_model=List[JobInDB])
+async def list_jobs(
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = JobService(db)
+        return await run_in_threadpool(service.get_jobs, user.id, limit)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while listing jobs: {e}")
+
+@router.get("/{job_id}", response_model=JobInDB)
+async def get_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = JobService(db)
+        job = await run_in_threadpool(service.get_job, user.id, job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+        return job
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while getting job: {e}")
+
+@router.get("/{job_id}/download", response_class=FileResponse)
+async def download_job_result(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = JobService(db)
+        found = await run_in_threadpool(service.result_path, user.id, job_id)
+        if found is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job result not found")
+        path, filename, media_type = found
+        return FileResponse(path, media_type=media_type, filename=filename)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while downloading job result: {e}")
+
+@router.post("/{job_id}/cancel", response_model=JobInDB)
+async def cancel_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = JobService(db)
+        job = await run_in_threadpool(service.cancel_job, user.id, job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+        return job
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while cancelling job: {e}")
+
+@router.post("/{job_id}/retry", response_model=JobInDB)
+async def retry_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = JobService(db)
+        job = await run_in_threadpool(service.retry_job, user.id, job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+        return job
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while retrying job: {e}")
\ No newline at end of file
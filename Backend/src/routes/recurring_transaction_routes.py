@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from typing import List
+from src.core.database import get_db, get_read_db
+from src.services.auth_service import get_current_user
+from src.services.recurring_transaction_service import RecurringTransactionService
+from src.schemas.recurring_transaction import RecurringTransactionCreate, RecurringTransactionUpdate, RecurringTransactionInDB
+from src.models.user import User
+
+router = APIRouter(prefix="/recurring-transactions", tags=["recurring transactions"])
+
+@router.post("/", response_model=RecurringTransactionInDB, status_code=status.HTTP_201_CREATED)
+async def create_recurring_transaction(
+    rule: RecurringTransactionCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = RecurringTransactionService(db)
+        return await run_in_threadpool(service.create_rule, user.id, rule)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while creating recurring transaction: {e}")
+
+@router.get("/", response_model=List[RecurringTransactionInDB])
+async def list_recurring_transactions(
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = RecurringTransactionService(db)
+        return await run_in_threadpool(service.get_rules, user.id)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while listing recurring transactions: {e}")
+
+@router.get("/{rule_id}", response_model=RecurringTransactionInDB)
+async def get_recurring_transaction(
+    rule_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = RecurringTransactionService(db)
+        rule = await run_in_threadpool(service.get_rule, user.id, rule_id)
+        if not rule:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recurring transaction not found")
+        return rule
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while fetching recurring transaction: {e}")
+
+@router.put("/{rule_id}", response_model=RecurringTransactionInDB)
+async def update_recurring_transaction(
+    rule_id: int,
+    rule: RecurringTransactionUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = RecurringTransactionService(db)
+        updated = await run_in_threadpool(service.update_rule, user.id, rule_id, rule)
+        if not updated:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recurring transaction not found")
+        return updated
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while updating recurring transaction: {e}")
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_recurring_transaction(
+    rule_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = RecurringTransactionService(db)
+        deleted = await run_in_threadpool(service.delete_rule, user.id, rule_id)
+        if not deleted:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recurring transaction not found")
+        return None
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while deleting recurring transaction: {e}")
\ No newline at end of file
@@ -1,14 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, UploadFile, File, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List
-from src.core.database import get_db
+from typing import List, Optional
+from src.core.admission import admission, export_limiter, import_limiter, report_limiter
+from src.core.database import get_db, get_read_db
 from src.services.auth_service import get_current_user
+from src.services.data_version_service import DataVersionService, TRANSACTIONS
 from src.services.transaction_service import TransactionService
-from src.schemas.transaction import TransactionCreate, TransactionUpdate, TransactionInDB
+from src.schemas.transaction import (
+    TransactionCreate, TransactionUpdate, TransactionInDB, TransactionFilter, TransactionPage,
+    TransactionBatchCreate, TransactionBatchResult, TransactionBulkUpdate, TransactionBulkDelete, TransactionBulkResult,
+    TransactionSearchPage, TransactionImportSummary, SummaryGroup, SummaryPeriod, TransactionSummary, ExportFormat,
+)
 from src.models.user import User
-import os
-import shutil
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
@@ -21,42 +26,172 @@ async def create_transaction(
     try:
         user = await current_user
         service = TransactionService(db)
-        return service.create_transaction(user.id, transaction)
+        return await run_in_threadpool(service.create_transaction, user.id, transaction)
     except HTTPException as e:
         raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while creating transaction: {e}")
 
-@router.get("/", response_model=List[TransactionInDB])
-async def list_transactions(
+@router.post("/batch", response_model=TransactionBatchResult, status_code=status.HTTP_201_CREATED, dependencies=[Depends(admission(import_limiter))])
+async def create_transactions_batch(
+    batch: TransactionBatchCreate,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
         user = await current_user
         service = TransactionService(db)
-        return service.get_transactions(user.id)
+        result = await run_in_threadpool(service.create_transactions_batch, user.id, batch)
+        if not result.committed:
+            # Atomic batch with invalid items: nothing was written
+            response.status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        return result
     except HTTPException as e:
         raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while creating transactions: {e}")
+
+@router.post("/bulk-update", response_model=TransactionBulkResult, dependencies=[Depends(admission(import_limiter))])
+async def bulk_update_transactions(
+    request: TransactionBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = TransactionService(db)
+        return await run_in_threadpool(service.bulk_update_transactions, user.id, request)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while updating transactions: {e}")
+
+@router.post("/bulk-delete", response_model=TransactionBulkResult, dependencies=[Depends(admission(import_limiter))])
+async def bulk_delete_transactions(
+    request: TransactionBulkDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        service = TransactionService(db)
+        return await run_in_threadpool(service.bulk_delete_transactions, user.id, request)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while deleting transactions: {e}")
+
+@router.get("/", response_model=TransactionPage)
+async def list_transactions(
+    request: Request,
+    response: Response,
+    filters: TransactionFilter = Depends(),
+    limit: int = Query(100, ge=1, le=10000),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        await DataVersionService(db).check_not_modified(request, response, user.id, TRANSACTIONS)
+        service = TransactionService(db)
+        body = await run_in_threadpool(service.get_transactions_page, user.id, filters, limit, cursor)
+        # Already serialized; returning a Response skips re-validation through TransactionPage
+        return Response(content=body, media_type="application/json", headers=dict(response.headers))
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while listing transactions: {e}")
 
-@router.get("/export", response_class=FileResponse)
+@router.get("/search", response_model=TransactionSearchPage, dependencies=[Depends(admission(report_limiter))])
+async def search_transactions(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    filters: TransactionFilter = Depends(),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0, le=10000),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        await DataVersionService(db).check_not_modified(request, response, user.id, TRANSACTIONS)
+        service = TransactionService(db)
+        body = await run_in_threadpool(service.search_transactions, user.id, q, filters, limit, offset)
+        return Response(content=body, media_type="application/json", headers=dict(response.headers))
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while searching transactions: {e}")
+
+@router.get("/summary", response_model=TransactionSummary, dependencies=[Depends(admission(report_limiter))])
+async def summarize_transactions(
+    request: Request,
+    response: Response,
+    filters: TransactionFilter = Depends(),
+    group_by: List[SummaryGroup] = Query([]),
+    period: Optional[SummaryPeriod] = None,
+    fill_gaps: bool = True,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        user = await current_user
+        await DataVersionService(db).check_not_modified(request, response, user.id, TRANSACTIONS)
+        service = TransactionService(db)
+        return await run_in_threadpool(service.summarize_transactions, user.id, filters, group_by, period, fill_gaps)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while summarizing transactions: {e}")
+
+# Kept synchronous: clients of this endpoint read the file from the response.
+# POST /jobs/export queues the same export as a background job.
+@router.get("/export", response_class=StreamingResponse, dependencies=[Depends(admission(export_limiter))])
 async def export_transactions(
-    db: Session = Depends(get_db),
+    filters: TransactionFilter = Depends(),
+    export_format: ExportFormat = Query(ExportFormat.JSON, alias="format"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
         user = await current_user
         service = TransactionService(db)
-        zip_file_path = service.export_transactions(user.id)
-        
-        # Return the zip file
-        return FileResponse(
-            path=zip_file_path,
-            filename=os.path.basename(zip_file_path),
-            media_type="application/zip"
+        service.check_export_format(export_format)
+
+        def stream():
+            # The body is produced after the endpoint returns, so release the
+            # session here rather than relying on the dependency teardown order
+            try:
+                yield from service.export_transactions(user.id, filters, export_format)
+            finally:
+                db.close()
+
+        return StreamingResponse(
+            stream(),
+            media_type=service.export_media_type(export_format),
+            headers={"Content-Disposition": f'attachment; filename="{service.export_filename(export_format)}"'},
         )
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -66,13 +201,16 @@ async def export_transactions(
 @router.get("/{transaction_id}", response_model=TransactionInDB)
 async def get_transaction(
     transaction_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
         user = await current_user
+        await DataVersionService(db).check_not_modified(request, response, user.id, TRANSACTIONS)
         service = TransactionService(db)
-        transaction = service.get_transaction(user.id, transaction_id)
+        transaction = await run_in_threadpool(service.get_transaction, user.id, transaction_id)
         if not transaction:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
         return transaction
@@ -91,12 +229,14 @@ async def update_transaction(
     try:
         user = await current_user
         service = TransactionService(db)
-        updated = service.update_transaction(user.id, transaction_id, transaction)
+        updated = await run_in_threadpool(service.update_transaction, user.id, transaction_id, transaction)
         if not updated:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
         return updated
     except HTTPException as e:
         raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while updating transaction: {e}")
 
@@ -109,7 +249,7 @@ async def delete_transaction(
     try:
         user = await current_user
         service = TransactionService(db)
-        deleted = service.delete_transaction(user.id, transaction_id)
+        deleted = await run_in_threadpool(service.delete_transaction, user.id, transaction_id)
         if not deleted:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transaction not found")
         return None
@@ -118,33 +258,25 @@ async def delete_transaction(
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while deleting transaction: {e}")
 
-@router.post("/import", response_model=List[TransactionInDB])
+# Kept synchronous: clients of this endpoint read the import summary from the
+# response. POST /jobs/import queues the same import as a background job.
+@router.post("/import", response_model=TransactionImportSummary, dependencies=[Depends(admission(import_limiter))])
 async def import_transactions(
     file: UploadFile = File(...),
+    chunk_size: Optional[int] = Query(None, ge=1, le=50000),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
         user = await current_user
-        
-        # Create temp directory if it doesn't exist
-        os.makedirs("temp", exist_ok=True)
-        
-        # Save uploaded file temporarily
-        temp_file_path = f"temp/{file.filename}"
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        # Import transactions
         service = TransactionService(db)
-        imported_transactions = service.import_transactions(user.id, temp_file_path)
-        
-        # Clean up temporary file
-        os.remove(temp_file_path)
-        
-        return imported_transactions
+        return await run_in_threadpool(service.import_transactions, user.id, file.file, chunk_size)
+    except HTTPException as e:
+        raise e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An error occurred while importing transactions: {str(e)}"
-        ) 
\ No newline at end of file
+        )
\ No newline at end of file
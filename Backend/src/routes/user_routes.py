@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from src.core.database import get_db
+from src.core.security import get_password_hash
 from src.schemas.user import User as UserSchema, UserUpdate
 from src.services.auth_service import get_current_user
 from src.repositories.user_repository import UserRepository
@@ -27,7 +29,8 @@ async def update_users_me(
     try:
         user = await current_user
         user_repo = UserRepository(db)
-        updated_user = user_repo.update_user(user.id, user_update)
+        hashed_password = await get_password_hash(user_update.password) if user_update.password else None
+        updated_user = await run_in_threadpool(user_repo.update_user, user.id, user_update, hashed_password)
         if not updated_user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         return updated_user
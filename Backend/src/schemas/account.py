@@ -15,6 +15,7 @@ class AccountUpdate(AccountBase):
 class AccountInDB(AccountBase):
     id: int
     user_id: int
+    balance: float
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
\ No newline at end of file
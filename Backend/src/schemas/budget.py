@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field
+from datetime import date
+from typing import Optional
+from enum import Enum
+
+class BudgetPeriod(str, Enum):
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+class BudgetBase(BaseModel):
+    category_id: int
+    period: BudgetPeriod = BudgetPeriod.MONTH
+    amount: float = Field(..., gt=0)
+
+class BudgetCreate(BudgetBase):
+    pass
+
+class BudgetUpdate(BaseModel):
+    amount: Optional[float] = Field(None, gt=0)
+
+class BudgetInDB(BudgetBase):
+    id: int
+    user_id: int
+
+    class Config:
+        from_attributes = True
+
+class BudgetStatus(BudgetInDB):
+    period_start: date
+    period_end: date
+    spent: float
+    remaining: float
+    used_ratio: float
\ No newline at end of file
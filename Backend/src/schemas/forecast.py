@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import List
+
+class ForecastMonth(BaseModel):
+    month: date
+    # Net of the recurring rules due this month
+    recurring: float
+    # Typical net of everything else, from the account's history
+    baseline: float
+    net: float
+    balance: float
+    low: float
+    high: float
+
+class AccountForecast(BaseModel):
+    account_id: int
+    name: str
+    starting_balance: float
+    baseline_mean: float
+    baseline_std: float
+    months: List[ForecastMonth]
+
+class Forecast(BaseModel):
+    as_of: date
+    months: int
+    history_months: int
+    history_from: date
+    history_to: date
+    accounts: List[AccountForecast]
\ No newline at end of file
@@ -0,0 +1,37 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Dict, Optional
+from enum import Enum
+
+class JobKind(str, Enum):
+    IMPORT = "import"
+    EXPORT = "export"
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+class JobInDB(BaseModel):
+    id: int
+    kind: JobKind
+    status: JobStatus
+    params: Dict[str, Any]
+    progress: int
+    total: Optional[int] = None
+    attempts: int
+    max_attempts: int
+    cancel_requested: bool
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    result_filename: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    # Where to fetch the job's file once it has succeeded
+    download_url: Optional[str] = None
+
+    class Config:
+        from_attributes = True
\ No newline at end of file
@@ -0,0 +1,50 @@
+from pydantic import BaseModel, Field
+from datetime import date
+from typing import List, Optional
+from enum import Enum
+from src.schemas.transaction import TransactionType
+
+class RecurrenceInterval(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+class RecurringTransactionBase(BaseModel):
+    amount: float
+    transaction_type: TransactionType
+    description: Optional[str] = None
+    source: Optional[str] = None
+    category_id: Optional[int] = None
+    account_id: Optional[int] = None
+    end_date: Optional[date] = None
+
+class RecurringTransactionCreate(RecurringTransactionBase):
+    interval: RecurrenceInterval
+    interval_count: int = Field(1, ge=1, le=1000)
+    anchor_date: date
+
+class RecurringTransactionUpdate(RecurringTransactionBase):
+    amount: Optional[float] = None
+    transaction_type: Optional[TransactionType] = None
+
+class RecurringTransactionInDB(RecurringTransactionBase):
+    id: int
+    user_id: int
+    interval: RecurrenceInterval
+    interval_count: int
+    anchor_date: date
+    materialized_count: int
+    next_date: Optional[date] = None
+
+    class Config:
+        from_attributes = True
+
+class RecurringMaterializationSummary(BaseModel):
+    as_of: date
+    rules: int
+    materialized: int
+    # Occurrences that already had a transaction, e.g. after an interrupted pass
+    already_present: int
+    invalid_rule_ids: List[int] = []
+    duration_seconds: float
\ No newline at end of file
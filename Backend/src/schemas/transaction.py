@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date
-from typing import Optional
+import datetime
+from typing import List, Optional
 from enum import Enum
 
 class TransactionType(str, Enum):
@@ -25,6 +26,124 @@ class TransactionUpdate(TransactionBase):
 class TransactionInDB(TransactionBase):
     id: int
     user_id: int
+    recurring_id: Optional[int] = None
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+class ExportFormat(str, Enum):
+    # Zip archive holding one JSON array, the format the import reads
+    JSON = "json"
+    CSV = "csv"
+    # Arrow IPC file and Parquet need the optional pyarrow package
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+class TransactionImportSummary(BaseModel):
+    imported: int
+    chunks: int
+    duration_seconds: float
+    rows_per_second: float
+
+class TransactionBatchMode(str, Enum):
+    # Write nothing unless every item is valid
+    ATOMIC = "atomic"
+    # Write the valid items and report the others
+    PARTIAL = "partial"
+
+class TransactionBatchCreate(BaseModel):
+    items: List[TransactionCreate] = Field(..., min_length=1)
+    mode: TransactionBatchMode = TransactionBatchMode.ATOMIC
+
+class TransactionBatchItemStatus(str, Enum):
+    CREATED = "created"
+    FAILED = "failed"
+    # Valid, but not written because another item of an atomic batch failed
+    SKIPPED = "skipped"
+
+class TransactionBatchItemResult(BaseModel):
+    index: int
+    status: TransactionBatchItemStatus
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+class TransactionBatchResult(BaseModel):
+    committed: bool
+    created: int
+    failed: int
+    results: List[TransactionBatchItemResult]
+
+class TransactionFilter(BaseModel):
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    category_id: Optional[int] = None
+    account_id: Optional[int] = None
+    transaction_type: Optional[TransactionType] = None
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+
+class TransactionBulkFilter(TransactionFilter):
+    ids: Optional[List[int]] = None
+    # Case-insensitive substring of the description
+    description: Optional[str] = Field(None, min_length=1, max_length=200)
+
+class TransactionPatch(BaseModel):
+    # Only the fields present in the request are changed; null clears an optional field
+    category_id: Optional[int] = None
+    account_id: Optional[int] = None
+    transaction_type: Optional[TransactionType] = None
+    description: Optional[str] = None
+    source: Optional[str] = None
+    # Spelled out: a field named ``date`` shadows the type inside the class body
+    date: Optional[datetime.date] = None
+
+class TransactionBulkUpdate(BaseModel):
+    filter: TransactionBulkFilter
+    patch: TransactionPatch
+    dry_run: bool = False
+
+class TransactionBulkDelete(BaseModel):
+    filter: TransactionBulkFilter
+    dry_run: bool = False
+
+class TransactionBulkResult(BaseModel):
+    # Rows changed, or the rows that would be changed on a dry run
+    affected: int
+    dry_run: bool
+
+class TransactionPage(BaseModel):
+    items: List[TransactionInDB]
+    next_cursor: Optional[str] = None
+
+class TransactionSearchHit(TransactionInDB):
+    rank: float
+
+class TransactionSearchPage(BaseModel):
+    items: List[TransactionSearchHit]
+    next_offset: Optional[int] = None
+
+class SummaryPeriod(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+class SummaryGroup(str, Enum):
+    CATEGORY = "category"
+    ACCOUNT = "account"
+
+class TransactionSummaryBucket(BaseModel):
+    period: Optional[date] = None
+    category_id: Optional[int] = None
+    account_id: Optional[int] = None
+    income: float = 0.0
+    expense: float = 0.0
+    income_count: int = 0
+    expense_count: int = 0
+
+class TransactionSummary(BaseModel):
+    income: float
+    expense: float
+    income_count: int
+    expense_count: int
+    buckets: List[TransactionSummaryBucket]
\ No newline at end of file
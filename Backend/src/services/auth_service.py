@@ -1,14 +1,17 @@
+import time
 from datetime import timedelta
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
+from src.core.cache import user_cache
 from src.core.config import settings
 from src.core.database import get_db
-from src.core.security import verify_password, create_access_token
+from src.core.security import get_password_hash, verify_password, create_access_token
 from src.repositories.user_repository import UserRepository
-from src.schemas.user import TokenData, UserCreate
+from src.schemas.user import TokenData, UserCreate, User as UserSchema
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -18,14 +21,20 @@ class AuthService:
         self.db = db
         self.user_repository = UserRepository(db)
 
-    def authenticate_user(self, username: str, password: str):
-        user = self.user_repository.get_by_username(username)
+    async def authenticate_user(self, username: str, password: str):
+        user = await run_in_threadpool(self.user_repository.get_by_username, username)
         if not user:
             return False
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password(password, user.hashed_password):
             return False
         return user
 
+    def create_user_token(self, user) -> str:
+        data = {"sub": user.username}
+        if settings.AUTH_TOKEN_EMBED_USER_ID:
+            data["uid"] = user.id
+        return self.create_access_token(data=data)
+
     def create_access_token(self, data: dict):
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         return create_access_token(
@@ -42,6 +51,10 @@ class AuthService:
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+        cached = user_cache.get(token)
+        if cached is not None:
+            return cached
+
         try:
             payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
             username: str = payload.get("sub")
@@ -50,27 +63,44 @@ class AuthService:
             token_data = TokenData(username=username)
         except JWTError:
             raise credentials_exception
-        
+
         user_repository = UserRepository(db)
-        user = user_repository.get_by_username(username=token_data.username)
+        user_id = payload.get("uid")
+        if user_id is not None:
+            user = await run_in_threadpool(user_repository.get, user_id)
+        else:
+            user = await run_in_threadpool(user_repository.get_by_username, username=token_data.username)
         if user is None:
             raise credentials_exception
-        return user
 
-    def register_user(self, user: UserCreate):
-        db_user = self.user_repository.get_by_email(email=user.email)
+        # Never cache a token past its own expiry
+        current_user = UserSchema.model_validate(user)
+        user_cache.set(token, current_user, ttl=payload.get("exp", 0) - time.time())
+        return current_user
+
+    async def register_user(self, user: UserCreate):
+        db_user = await run_in_threadpool(self.user_repository.get_by_email, email=user.email)
         if db_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
-        db_user = self.user_repository.get_by_username(username=user.username)
+        db_user = await run_in_threadpool(self.user_repository.get_by_username, username=user.username)
         if db_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already taken"
             )
-        return self.user_repository.create(user=user)
+        hashed_password = await get_password_hash(user.password)
+        return await run_in_threadpool(self.user_repository.create, user=user, hashed_password=hashed_password)
 
 def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    return AuthService(db).get_current_user(token=token, db=db) 
\ No newline at end of file
+    return AuthService(db).get_current_user(token=token, db=db)
+
+async def require_admin(current_user: UserSchema = Depends(get_current_user)) -> UserSchema:
+    """Let through only the users named in ``INTERNAL_ADMIN_USERNAMES``."""
+    user = await current_user
+    admins = {name.strip() for name in settings.INTERNAL_ADMIN_USERNAMES.split(",") if name.strip()}
+    if user.username not in admins:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
+    return user
\ No newline at end of file
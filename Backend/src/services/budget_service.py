@@ -0,0 +1,49 @@
+from sqlalchemy.orm import Session
+from src.core.periods import next_period, period_start
+from src.repositories.budget_repository import BudgetRepository
+from src.schemas.budget import BudgetCreate, BudgetUpdate, BudgetStatus
+from src.models.budget import Budget
+from datetime import date, timedelta
+from typing import List, Optional
+
+class BudgetService:
+    def __init__(self, db: Session):
+        self.repository = BudgetRepository(db)
+
+    def create_budget(self, user_id: int, budget: BudgetCreate) -> Budget:
+        return self.repository.create(user_id, budget)
+
+    def get_budget(self, user_id: int, budget_id: int) -> Optional[Budget]:
+        return self.repository.get(user_id, budget_id)
+
+    def get_budgets(self, user_id: int) -> List[Budget]:
+        return self.repository.get_all(user_id)
+
+    def update_budget(self, user_id: int, budget_id: int, budget: BudgetUpdate) -> Optional[Budget]:
+        return self.repository.update(user_id, budget_id, budget)
+
+    def delete_budget(self, user_id: int, budget_id: int) -> bool:
+        return self.repository.delete(user_id, budget_id)
+
+    def get_status(self, user_id: int, as_of: Optional[date] = None) -> List[BudgetStatus]:
+        """Spending against every budget for the period containing ``as_of`` (default today).
+
+        Reads one stored counter per budget instead of summing transactions.
+        """
+        as_of = as_of or date.today()
+        statuses = []
+        for budget, spent in self.repository.get_status(user_id, as_of):
+            start = period_start(as_of, budget.period)
+            statuses.append(BudgetStatus(
+                id=budget.id,
+                user_id=budget.user_id,
+                category_id=budget.category_id,
+                period=budget.period,
+                amount=budget.amount,
+                period_start=start,
+                period_end=next_period(start, budget.period) - timedelta(days=1),
+                spent=round(spent, 2),
+                remaining=round(budget.amount - spent, 2),
+                used_ratio=round(spent / budget.amount, 4),
+            ))
+        return statuses
\ No newline at end of file
@@ -0,0 +1,59 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from src.repositories.data_version_repository import DataVersionRepository, ACCOUNTS, CATEGORIES, TRANSACTIONS  # noqa: F401 - collection names for routes
+
+
+class DataVersionService:
+    """Conditional GET support keyed on the per-user collection version counters."""
+
+    def __init__(self, db: Session):
+        self.repository = DataVersionRepository(db)
+
+    async def check_not_modified(self, request: Request, response: Response, user_id: int, collection: str) -> None:
+        """Raise ``304 Not Modified`` if the client's copy is current, else set validators on ``response``.
+
+        Only the small ``data_versions`` row is read, so an unchanged poll never
+        queries the collection itself.
+        """
+        version, updated_at = await run_in_threadpool(self.repository.get, user_id, collection)
+        # Different paths and query strings are different representations of the same version
+        variant = hashlib.sha1(f"{request.url.path}?{request.url.query}".encode()).hexdigest()[:12]
+        headers = {
+            "ETag": f'W/"{user_id}-{collection}-{version}-{variant}"',
+            "Cache-Control": "private, no-cache",
+            "Vary": "Authorization",
+        }
+        if updated_at is not None:
+            if updated_at.tzinfo is None:
+                updated_at = updated_at.replace(tzinfo=timezone.utc)
+            headers["Last-Modified"] = format_datetime(updated_at, usegmt=True)
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            candidates = {tag.strip() for tag in if_none_match.split(",")}
+            weak_etag = headers["ETag"]
+            if "*" in candidates or weak_etag in candidates or weak_etag[2:] in candidates:
+                raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        elif updated_at is not None and self._not_modified_since(request.headers.get("if-modified-since"), updated_at):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response.headers.update(headers)
+
+    @staticmethod
+    def _not_modified_since(header: str | None, updated_at: datetime) -> bool:
+        if not header:
+            return False
+        try:
+            since = parsedate_to_datetime(header)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have one-second resolution
+        return updated_at.replace(microsecond=0) <= since
\ No newline at end of file
@@ -0,0 +1,181 @@
+from sqlalchemy.orm import Session
+from src.core.cache import forecast_cache
+from src.repositories.account_repository import AccountRepository, signed_amount
+from src.repositories.data_version_repository import DataVersionRepository, ACCOUNTS, RECURRING, TRANSACTIONS
+from src.repositories.recurring_transaction_repository import RecurringTransactionRepository, scheduled_date
+from src.schemas.recurring_transaction import RecurrenceInterval
+from src.repositories.transaction_repository import TransactionRepository
+from src.schemas.forecast import AccountForecast, Forecast, ForecastMonth
+from src.models.recurring_transaction import RecurringTransaction
+from src.models.types import from_minor_units
+from datetime import date, timedelta
+from typing import Any, List, Sequence
+import numpy as np
+
+
+def month_index(value: date) -> int:
+    """Months since January 1970, the same numbering as ``datetime64[M]``."""
+    return (value.year - 1970) * 12 + value.month - 1
+
+
+def month_start(index: int) -> date:
+    return date(1970 + index // 12, index % 12 + 1, 1)
+
+
+def monthly_history(rows: Sequence[Any], account_ids: np.ndarray, first_month: int, months: int) -> np.ndarray:
+    """Net amount per account (rows, in ``account_ids`` order) and month (columns) of history.
+
+    ``rows`` are ``(account_id, month, net)`` buckets; they become column
+    arrays once and are scattered into the matrix with a single ``bincount``.
+    """
+    history = np.zeros((len(account_ids), months))
+    if not rows or not len(account_ids):
+        return history
+    accounts, month_starts, nets = zip(*rows)
+    # SQLite returns the month as an ISO string, PostgreSQL as a date; both parse as datetime64
+    month = np.array(month_starts, dtype="datetime64[D]").astype("datetime64[M]").astype(np.int64) - first_month
+    accounts = np.asarray(accounts, dtype=np.float64)
+    known = np.isin(accounts, account_ids) & (month >= 0) & (month < months)
+    position = np.searchsorted(account_ids, accounts[known])
+    flat = np.bincount(
+        position * months + month[known],
+        weights=np.asarray(nets, dtype=np.float64)[known],
+        minlength=len(account_ids) * months,
+    )
+    return flat.reshape(len(account_ids), months)
+
+
+def first_index_from(rule: RecurringTransaction, start: date) -> int:
+    """Index of the rule's first occurrence on or after ``start``, never below its first unmaterialized one.
+
+    The index is estimated from the interval and then stepped forward, so a
+    rule anchored long ago costs a few iterations rather than one per past
+    occurrence.
+    """
+    first = rule.materialized_count or 0
+    anchor = rule.anchor_date
+    interval = getattr(rule.interval, "value", rule.interval)
+    if interval == RecurrenceInterval.DAY.value:
+        estimate = (start - anchor).days // rule.interval_count
+    elif interval == RecurrenceInterval.WEEK.value:
+        estimate = (start - anchor).days // (7 * rule.interval_count)
+    else:
+        step = rule.interval_count * (1 if interval == RecurrenceInterval.MONTH.value else 12)
+        estimate = ((start.year - anchor.year) * 12 + start.month - anchor.month) // step - 1
+    index = max(first, estimate)
+    while True:
+        occurrence = scheduled_date(rule, index)
+        if occurrence is None or occurrence >= start:
+            return index
+        index += 1
+
+
+def recurring_schedule(
+    rules: Sequence[RecurringTransaction], account_ids: np.ndarray, first_month: int, months: int
+) -> np.ndarray:
+    """Net of every pending occurrence per account and projected month.
+
+    Only occurrences inside the projected months count. Overdue ones that are
+    not materialized yet are left out, so a rule whose ``next_date`` lies far
+    in the past does not pile its whole backlog into the first month.
+    """
+    schedule = np.zeros((len(account_ids), months))
+    window_start = month_start(first_month)
+    horizon_end = month_start(first_month + months) - timedelta(days=1)
+    rows, columns, amounts = [], [], []
+    for rule in rules:
+        if rule.account_id is None or rule.next_date is None:
+            continue
+        position = int(np.searchsorted(account_ids, rule.account_id))
+        if position >= len(account_ids) or account_ids[position] != rule.account_id:
+            continue
+        amount = from_minor_units(signed_amount(rule.transaction_type, rule.amount))
+        if rule.next_date >= window_start:
+            index, occurrence = rule.materialized_count, rule.next_date
+        else:
+            index = first_index_from(rule, window_start)
+            occurrence = scheduled_date(rule, index)
+        while occurrence is not None and occurrence <= horizon_end:
+            rows.append(position)
+            columns.append(month_index(occurrence) - first_month)
+            amounts.append(amount)
+            index += 1
+            occurrence = scheduled_date(rule, index)
+    np.add.at(schedule, (np.asarray(rows, dtype=np.int64), np.asarray(columns, dtype=np.int64)), amounts)
+    return schedule
+
+
+class ForecastService:
+    def __init__(self, db: Session):
+        self.transactions = TransactionRepository(db)
+        self.accounts = AccountRepository(db)
+        self.rules = RecurringTransactionRepository(db)
+        self.versions = DataVersionRepository(db)
+
+    def forecast(self, user_id: int, months: int = 12, history_months: int = 6) -> Forecast:
+        """Project every account's month-end balance for the ``months`` months after the current one.
+
+        Each month adds the account's recurring rules that fall in it plus a
+        baseline: the mean monthly net of its other transactions over the last
+        ``history_months`` complete months. ``low``/``high`` widen by one
+        standard deviation of that net per sqrt(month).
+
+        Results are cached under the user's transaction, account and recurring
+        rule versions, so any write to those makes the next call recompute.
+        """
+        as_of = date.today()
+        versions = self.versions.get_many(user_id, (TRANSACTIONS, ACCOUNTS, RECURRING))
+        key = (user_id, months, history_months, as_of, tuple(versions.values()))
+        cached = forecast_cache.get(key)
+        if cached is not None:
+            return cached
+
+        current_month = month_index(as_of)
+        history_from, history_to = month_start(current_month - history_months), month_start(current_month)
+        accounts = sorted(self.accounts.get_all(user_id), key=lambda account: account.id)
+        account_ids = np.array([account.id for account in accounts], dtype=np.float64)
+
+        rows = self.transactions.monthly_net(user_id, history_from, history_to)
+        history = monthly_history(rows, account_ids, current_month - history_months, history_months)
+        baseline_mean = history.mean(axis=1)
+        baseline_std = history.std(axis=1)
+        recurring = recurring_schedule(self.rules.get_all(user_id), account_ids, current_month + 1, months)
+
+        net = baseline_mean[:, None] + recurring
+        starting = np.array([account.balance for account in accounts], dtype=np.float64)
+        balance = starting[:, None] + np.cumsum(net, axis=1)
+        spread = baseline_std[:, None] * np.sqrt(np.arange(1, months + 1))
+
+        month_starts = [month_start(current_month + 1 + offset) for offset in range(months)]
+        result = Forecast(
+            as_of=as_of,
+            months=months,
+            history_months=history_months,
+            history_from=history_from,
+            history_to=history_to - timedelta(days=1),
+            accounts=[
+                AccountForecast(
+                    account_id=account.id,
+                    name=account.name,
+                    starting_balance=round(starting[row], 2),
+                    baseline_mean=round(baseline_mean[row], 2),
+                    baseline_std=round(baseline_std[row], 2),
+                    months=self._months(month_starts, recurring[row], baseline_mean[row], net[row], balance[row], spread[row]),
+                )
+                for row, account in enumerate(accounts)
+            ],
+        )
+        forecast_cache.set(key, result)
+        return result
+
+    @staticmethod
+    def _months(month_starts: List[date], recurring, baseline: float, net, balance, spread) -> List[ForecastMonth]:
+        rounded = np.round(np.stack([recurring, net, balance, balance - spread, balance + spread]), 2).tolist()
+        baseline = round(float(baseline), 2)
+        return [
+            ForecastMonth(
+                month=month, recurring=values[0], baseline=baseline, net=values[1],
+                balance=values[2], low=values[3], high=values[4],
+            )
+            for month, *values in zip(month_starts, *rounded)
+        ]
\ No newline at end of file
@@ -0,0 +1,142 @@
+from sqlalchemy.orm import Session
+from src.repositories.job_repository import JobRepository
+from src.services.job_worker import JobContext, JobWorker, running
+from src.services.transaction_service import TransactionService
+from src.schemas.job import JobInDB
+from src.schemas.transaction import ExportFormat, TransactionBulkFilter, TransactionFilter
+from src.models.job import Job, JobKind, JobStatus
+from src.core.config import settings
+from src.core.job_storage import INPUT_FILENAME, PARTIAL_SUFFIX, job_dir, remove_job_file, remove_job_files
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+import os
+import shutil
+
+
+def run_import(db: Session, job: Job, context: JobContext) -> Tuple[Dict[str, Any], Optional[str]]:
+    if job.result is not None:
+        # An earlier run committed the rows but lost the job before finishing it
+        remove_job_files(job.id)
+        return job.result, None
+
+    def record(rows: int, chunks: int) -> None:
+        # Committed with the rows, so the job can never import them twice
+        JobRepository(db).stage_result(context.claim, {"imported": rows, "chunks": chunks})
+
+    with open(job_dir(job.id) / INPUT_FILENAME, "rb") as stream:
+        summary = TransactionService(db).import_transactions(
+            job.user_id, stream, job.params.get("chunk_size"), progress=context.report, before_commit=record
+        )
+    # The upload is only kept around so that a failed import can be retried
+    remove_job_files(job.id)
+    return summary.dict(), None
+
+
+def run_export(db: Session, job: Job, context: JobContext) -> Tuple[Dict[str, Any], Optional[str]]:
+    service = TransactionService(db)
+    export_format = ExportFormat(job.params.get("format", ExportFormat.JSON.value))
+    filters = TransactionBulkFilter(**job.params.get("filters", {}))
+    context.report(0, service.repository.count_matching(job.user_id, filters))
+    filename = service.export_filename(export_format)
+    path = job_dir(job.id, create=True) / filename
+    partial = path.with_name(path.name + PARTIAL_SUFFIX)
+    try:
+        with open(partial, "wb") as out:
+            for data in service.export_transactions(job.user_id, filters, export_format, progress=context.report):
+                out.write(data)
+        os.replace(partial, path)
+    finally:
+        partial.unlink(missing_ok=True)
+    return {"rows": context.progress, "bytes": path.stat().st_size}, filename
+
+
+HANDLERS = {
+    JobKind.IMPORT.value: run_import,
+    JobKind.EXPORT.value: run_export,
+}
+
+# Workers of the API process, started with the application when JOB_WORKERS > 0
+job_worker = JobWorker(HANDLERS, settings.JOB_WORKERS, settings.JOB_POLL_SECONDS)
+
+
+class JobService:
+    def __init__(self, db: Session):
+        self.repository = JobRepository(db)
+
+    @staticmethod
+    def to_schema(job: Job) -> JobInDB:
+        """The job as clients see it, with live progress when it is running in this process."""
+        schema = JobInDB.model_validate(job)
+        if job.status == JobStatus.SUCCEEDED.value and job.result_filename:
+            schema.download_url = f"/jobs/{job.id}/download"
+        context = running.get(job.id)
+        if context is not None and job.status == JobStatus.RUNNING.value:
+            schema.progress = context.progress
+            schema.total = context.total
+        return schema
+
+    def _enqueue(self, user_id: int, kind: JobKind, params: Dict[str, Any], stage=None) -> JobInDB:
+        job = self.repository.create(user_id, kind, params, settings.JOB_MAX_ATTEMPTS, stage)
+        job_worker.notify()
+        return self.to_schema(job)
+
+    def enqueue_import(self, user_id: int, stream: BinaryIO, chunk_size: Optional[int] = None) -> JobInDB:
+        """Store the upload in the job's directory and queue the import; the job is not visible until both are done."""
+        def stage(job_id: int) -> None:
+            try:
+                with open(job_dir(job_id, create=True) / INPUT_FILENAME, "wb") as out:
+                    shutil.copyfileobj(stream, out, 1024 * 1024)
+            except Exception:
+                remove_job_file(job_id, INPUT_FILENAME)
+                raise
+
+        return self._enqueue(user_id, JobKind.IMPORT, {"chunk_size": chunk_size}, stage)
+
+    def enqueue_export(self, user_id: int, filters: TransactionFilter, export_format: ExportFormat) -> JobInDB:
+        TransactionService.check_export_format(export_format)
+        params = {"format": export_format.value, "filters": filters.model_dump(mode="json", exclude_none=True)}
+        return self._enqueue(user_id, JobKind.EXPORT, params)
+
+    def get_job(self, user_id: int, job_id: int) -> Optional[JobInDB]:
+        job = self.repository.get(user_id, job_id)
+        return self.to_schema(job) if job else None
+
+    def get_jobs(self, user_id: int, limit: int) -> List[JobInDB]:
+        return [self.to_schema(job) for job in self.repository.get_all(user_id, limit)]
+
+    def cancel_job(self, user_id: int, job_id: int) -> Optional[JobInDB]:
+        job = self.repository.get(user_id, job_id)
+        if job is None:
+            return None
+        if job.status in (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value):
+            raise ValueError(f"Job {job_id} has already {job.status}")
+        context = running.get(job_id)
+        if context is not None:
+            # Stop it right away when it runs here; the flag in the table reaches other processes
+            context.cancelled.set()
+        job = self.repository.request_cancel(user_id, job_id)
+        return self.to_schema(job) if job else None
+
+    def retry_job(self, user_id: int, job_id: int) -> Optional[JobInDB]:
+        job = self.repository.get(user_id, job_id)
+        if job is None:
+            return None
+        if job.status not in (JobStatus.FAILED.value, JobStatus.CANCELLED.value):
+            raise ValueError(f"Only failed or cancelled jobs can be retried; job {job_id} is {job.status}")
+        if job.kind == JobKind.IMPORT.value and not (job_dir(job_id) / INPUT_FILENAME).exists():
+            raise ValueError(f"The upload of job {job_id} is no longer available; submit the import again")
+        if not self.repository.requeue(user_id, job_id):
+            raise ValueError(f"Job {job_id} changed state; fetch it and try again")
+        job_worker.notify()
+        return self.get_job(user_id, job_id)
+
+    def result_path(self, user_id: int, job_id: int) -> Optional[Tuple[Path, str, str]]:
+        """Path, download name and media type of a succeeded job's file, or None if there is none."""
+        job = self.repository.get(user_id, job_id)
+        if job is None or job.status != JobStatus.SUCCEEDED.value or not job.result_filename:
+            return None
+        path = job_dir(job_id) / job.result_filename
+        if not path.exists():
+            return None
+        export_format = ExportFormat(job.params.get("format", ExportFormat.JSON.value))
+        return path, job.result_filename, TransactionService.export_media_type(export_format)
\ No newline at end of file
@@ -0,0 +1,196 @@
+"""Worker threads that run queued jobs from the ``jobs`` table.
+
+Any number of processes may run workers against the same database: a job is
+claimed with a conditional UPDATE, so exactly one worker runs it. A run only
+records its outcome while it still holds that claim, so a run that was
+reclaimed as stale cannot overwrite the run that replaced it. Running jobs
+report progress through a ``JobContext``, which is also how a cancel request
+reaches them. Unexpected failures are retried with exponential backoff up to
+the job's ``max_attempts``; invalid input (a ``ValueError``) fails at once.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.database import SessionLocal
+from src.core.job_storage import remove_job_files
+from src.core.metrics import CallbackGauge, Counter, registry
+from src.models.job import Job
+from src.repositories.job_repository import Claim, JobRepository, utcnow
+
+logger = logging.getLogger(__name__)
+
+# A handler runs one job and returns its result summary and the name of the file it produced, if any
+Handler = Callable[[Session, Job, "JobContext"], Tuple[Dict[str, Any], Optional[str]]]
+
+
+class JobCancelled(Exception):
+    """Raised from a progress report once the job has been asked to cancel."""
+
+
+class JobContext:
+    """Progress and cancellation of one running job, shared by its worker thread and the API."""
+
+    def __init__(self, claim: Claim):
+        self.claim = claim
+        self.job_id = claim.job_id
+        self.progress = 0
+        self.total: Optional[int] = None
+        self.cancelled = threading.Event()
+        self._synced = time.monotonic()
+
+    def report(self, progress: int, total: Optional[int] = None) -> None:
+        """Record progress; raises ``JobCancelled`` if the job should stop."""
+        self.progress = progress
+        if total is not None:
+            self.total = total
+        now = time.monotonic()
+        if now - self._synced >= settings.JOB_PROGRESS_INTERVAL_SECONDS:
+            self._synced = now
+            self._sync()
+        if self.cancelled.is_set():
+            raise JobCancelled()
+
+    def _sync(self) -> None:
+        with SessionLocal() as db:
+            stop = JobRepository(db).heartbeat(self.claim, self.progress, self.total)
+        if stop:
+            self.cancelled.set()
+
+
+# Jobs running in this process, by id
+running: Dict[int, JobContext] = {}
+_running_lock = threading.Lock()
+
+JOB_RUNS = registry.register(Counter(
+    "job_runs_total", "Finished job runs by kind and outcome (succeeded, failed, retried, cancelled).",
+    ("kind", "outcome")))
+registry.register(CallbackGauge("jobs_running", "Jobs running in this process.", lambda: len(running)))
+
+
+class JobWorker:
+    def __init__(self, handlers: Dict[str, Handler], threads: int, poll_seconds: float):
+        self.handlers = handlers
+        self.threads = threads
+        self.poll_seconds = poll_seconds
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._housekeeping_lock = threading.Lock()
+        self._next_housekeeping = 0.0
+
+    def start(self) -> None:
+        self._stop.clear()
+        for number in range(self.threads):
+            thread = threading.Thread(target=self._loop, name=f"job-worker-{number}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 30) -> None:
+        """Stop claiming jobs and wait up to ``timeout`` seconds for running ones.
+
+        A job still running afterwards is left behind; once its heartbeat is
+        stale, another worker requeues it.
+        """
+        self._stop.set()
+        self._wake.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+
+    def notify(self) -> None:
+        """Wake idle workers, e.g. right after a job was queued in this process."""
+        self._wake.set()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.housekeeping()
+                if self.run_once():
+                    continue
+            except Exception:
+                logger.exception("Job worker iteration failed")
+            self._wake.wait(self.poll_seconds)
+            self._wake.clear()
+
+    def run_once(self) -> bool:
+        """Claim and run one due job; False when there was none."""
+        with SessionLocal() as db:
+            jobs = JobRepository(db)
+            job = jobs.claim_next(f"{self.name}:{threading.current_thread().name}")
+            if job is None:
+                return False
+            self._run(db, jobs, job)
+        return True
+
+    def _run(self, db: Session, jobs: JobRepository, job: Job) -> None:
+        # Read before the handler runs: a rollback expires ``job``, and reloading
+        # it would pick up whatever a worker that reclaimed the job wrote
+        claim, kind, max_attempts = Claim.of(job), job.kind, job.max_attempts
+        context = JobContext(claim)
+        with _running_lock:
+            running[job.id] = context
+        try:
+            result, result_filename = self.handlers[kind](db, job, context)
+        except JobCancelled:
+            db.rollback()
+            outcome, recorded = "cancelled", jobs.mark_cancelled(claim)
+        except ValueError as e:
+            db.rollback()
+            outcome, recorded = "failed", jobs.fail(claim, str(e))
+        except Exception as e:
+            db.rollback()
+            logger.exception("Job %s (%s) failed on attempt %s of %s", claim.job_id, kind, claim.attempt, max_attempts)
+            retry_at = None
+            if claim.attempt < max_attempts:
+                retry_at = utcnow() + timedelta(seconds=settings.JOB_RETRY_DELAY_SECONDS * 2 ** (claim.attempt - 1))
+            outcome = "failed" if retry_at is None else "retried"
+            recorded = jobs.fail(claim, f"{type(e).__name__}: {e}", retry_at)
+        else:
+            outcome, recorded = "succeeded", jobs.finish(claim, context.progress, context.total, result, result_filename)
+        finally:
+            with _running_lock:
+                running.pop(claim.job_id, None)
+        if recorded:
+            JOB_RUNS.inc(kind, outcome)
+        else:
+            logger.warning("Job %s was reclaimed while attempt %s ran; its outcome (%s) is discarded", claim.job_id, claim.attempt, outcome)
+
+    def housekeeping(self) -> None:
+        """Requeue jobs orphaned by dead workers and delete expired jobs with their files, once a minute."""
+        if time.monotonic() < self._next_housekeeping or not self._housekeeping_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_housekeeping = time.monotonic() + 60
+            now = utcnow()
+            with SessionLocal() as db:
+                jobs = JobRepository(db)
+                with _running_lock:
+                    alive = list(running)
+                reclaimed = jobs.reclaim_stale(now - timedelta(seconds=settings.JOB_STALE_SECONDS), alive)
+                if reclaimed:
+                    logger.warning("Reclaimed %d job(s) from unresponsive workers", reclaimed)
+                expired = jobs.expired_ids(now - timedelta(seconds=settings.JOB_RETENTION_SECONDS))
+                for job_id in expired:
+                    remove_job_files(job_id)
+                jobs.delete_many(expired)
+        finally:
+            self._housekeeping_lock.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with _running_lock:
+            jobs = {job_id: {"progress": context.progress, "total": context.total} for job_id, context in running.items()}
+        return {
+            "worker": self.name,
+            "threads": sum(thread.is_alive() for thread in self._threads),
+            "running": jobs,
+        }
\ No newline at end of file
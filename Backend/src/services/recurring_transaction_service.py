@@ -0,0 +1,113 @@
+from sqlalchemy.orm import Session
+from src.repositories.recurring_transaction_repository import RecurringTransactionRepository, scheduled_date
+from src.repositories.transaction_repository import TransactionRepository
+from src.schemas.recurring_transaction import (
+    RecurringTransactionCreate, RecurringTransactionUpdate, RecurringMaterializationSummary,
+)
+from src.schemas.transaction import TransactionCreate
+from src.models.recurring_transaction import RecurringTransaction
+from src.core.config import settings
+from datetime import date
+from typing import Any, Dict, List, Optional
+import time
+
+
+def occurrence_transaction(rule: RecurringTransaction, occurrence: date) -> TransactionCreate:
+    """The transaction a rule produces on ``occurrence``, validated like any other create."""
+    return TransactionCreate(
+        amount=rule.amount,
+        transaction_type=rule.transaction_type,
+        description=rule.description,
+        source=rule.source,
+        category_id=rule.category_id,
+        account_id=rule.account_id,
+        date=occurrence,
+    )
+
+
+class RecurringTransactionService:
+    def __init__(self, db: Session):
+        self.repository = RecurringTransactionRepository(db)
+        self.transactions = TransactionRepository(db)
+
+    def create_rule(self, user_id: int, rule: RecurringTransactionCreate) -> RecurringTransaction:
+        self.transactions.check_references(user_id, rule.category_id, rule.account_id)
+        return self.repository.create(user_id, rule)
+
+    def get_rule(self, user_id: int, rule_id: int) -> Optional[RecurringTransaction]:
+        return self.repository.get(user_id, rule_id)
+
+    def get_rules(self, user_id: int) -> List[RecurringTransaction]:
+        return self.repository.get_all(user_id)
+
+    def update_rule(self, user_id: int, rule_id: int, rule: RecurringTransactionUpdate) -> Optional[RecurringTransaction]:
+        values = rule.dict(exclude_unset=True)
+        # Optional so they can be left out, but the rule always needs them
+        for key in ("amount", "transaction_type"):
+            if key in values and values[key] is None:
+                raise ValueError(f"{key} cannot be cleared")
+        self.transactions.check_references(user_id, values.get("category_id"), values.get("account_id"))
+        return self.repository.update(user_id, rule_id, rule)
+
+    def delete_rule(self, user_id: int, rule_id: int) -> bool:
+        return self.repository.delete(user_id, rule_id)
+
+    @staticmethod
+    def _due_rows(rule: RecurringTransaction, as_of: date) -> List[Dict[str, Any]]:
+        """Insert rows for every occurrence of ``rule`` up to ``as_of``, advancing the rule past them.
+
+        The rule is only advanced once every occurrence has validated.
+        """
+        rows = []
+        count = rule.materialized_count
+        occurrence = rule.next_date
+        while occurrence is not None and occurrence <= as_of:
+            transaction = occurrence_transaction(rule, occurrence)
+            rows.append({
+                **transaction.dict(),
+                "user_id": rule.user_id,
+                "recurring_id": rule.id,
+                "occurrence_date": occurrence,
+            })
+            count += 1
+            occurrence = scheduled_date(rule, count)
+        rule.materialized_count = count
+        rule.next_date = occurrence
+        return rows
+
+    def materialize_due(self, as_of: Optional[date] = None, chunk_size: Optional[int] = None) -> RecurringMaterializationSummary:
+        """Turn every due occurrence of every user's rules into transactions.
+
+        Rules are processed ``chunk_size`` at a time; each chunk is one
+        multi-row INSERT committed together with the rules' progress, so an
+        interrupted pass resumes where it stopped and a rerun inserts nothing
+        twice. Rules whose template no longer validates are skipped and reported.
+        """
+        as_of = as_of or date.today()
+        chunk_size = chunk_size or settings.RECURRING_CHUNK_SIZE
+        started = time.perf_counter()
+        rule_count = materialized = attempted = 0
+        invalid_rule_ids = []
+        after = None
+        while True:
+            rules = self.repository.get_due(as_of, chunk_size, after)
+            if not rules:
+                break
+            after = (rules[-1].next_date, rules[-1].id)
+            values = []
+            for rule in rules:
+                try:
+                    values.extend(self._due_rows(rule, as_of))
+                except ValueError:
+                    invalid_rule_ids.append(rule.id)
+            rule_count += len(rules)
+            attempted += len(values)
+            materialized += self.repository.materialize(values)
+        return RecurringMaterializationSummary(
+            as_of=as_of,
+            rules=rule_count,
+            materialized=materialized,
+            already_present=attempted - materialized,
+            invalid_rule_ids=invalid_rule_ids,
+            duration_seconds=round(time.perf_counter() - started, 3),
+        )
\ No newline at end of file
@@ -1,94 +1,510 @@
 from sqlalchemy.orm import Session
-from src.repositories.transaction_repository import TransactionRepository
-from src.schemas.transaction import TransactionCreate, TransactionUpdate
+from src.repositories.transaction_repository import TransactionRepository, ROW_FIELDS
+from src.schemas.transaction import (
+    TransactionCreate, TransactionUpdate, TransactionFilter, TransactionImportSummary,
+    TransactionBatchCreate, TransactionBatchMode, TransactionBatchItemStatus, TransactionBatchItemResult, TransactionBatchResult,
+    TransactionBulkFilter, TransactionBulkUpdate, TransactionBulkDelete, TransactionBulkResult,
+    SummaryGroup, SummaryPeriod, TransactionSummary, TransactionSummaryBucket, ExportFormat,
+)
 from src.models.transaction import Transaction
-from typing import List, Optional
+from src.core.config import settings
+from src.core.periods import next_period, period_start
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional, Sequence, Tuple
+import base64
+import codecs
+import csv
+import io
+import itertools
 import json
+import orjson
+import re
+import time
 import zipfile
-import os
-from datetime import datetime
+from datetime import date, datetime
+
+
+def encode_cursor(transaction: Transaction) -> str:
+    raw = f"{transaction.date.isoformat()}|{transaction.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_date, raw_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return date.fromisoformat(raw_date), int(raw_id)
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+
+
+def search_terms(query: str) -> List[str]:
+    """Lower-cased words of a search query, with everything but letters, digits and ``_`` dropped."""
+    terms = re.findall(r"\w+", query.lower())[:settings.SEARCH_MAX_TERMS]
+    if not terms:
+        raise ValueError("Search query must contain at least one letter or digit")
+    return terms
+
+
+def _iter_json_array(stream: BinaryIO, read_size: int = 64 * 1024) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array without loading the whole document."""
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer, pos, eof = "", 0, False
+
+    def next_token() -> Optional[str]:
+        nonlocal buffer, pos, eof
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if eof:
+                return None
+            chunk = stream.read(read_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + text.decode(chunk, final=eof), 0
+
+    if next_token() != "[":
+        raise ValueError("Import file must contain a JSON array of transactions")
+    pos += 1
+    if next_token() == "]":
+        return
+    while True:
+        next_token()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                break
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError("Import file is not valid JSON")
+                chunk = stream.read(read_size)
+                eof = not chunk
+                buffer, pos = buffer[pos:] + text.decode(chunk, final=eof), 0
+        pos = end
+        yield item
+        token = next_token()
+        if token == "]":
+            return
+        if token != ",":
+            raise ValueError("Import file is not valid JSON")
+        pos += 1
+
+
+def _parse_import_row(transaction_data: Any) -> TransactionCreate:
+    return TransactionCreate(
+        amount=transaction_data["amount"],
+        transaction_type=transaction_data["transaction_type"],
+        description=transaction_data.get("description"),
+        source=transaction_data.get("source"),
+        category_id=transaction_data.get("category_id"),
+        account_id=transaction_data.get("account_id"),
+        date=datetime.fromisoformat(transaction_data["date"]).date()
+    )
+
+
+class _ChunkBuffer:
+    """Write-only, unseekable sink that hands written bytes back to a generator."""
+    # pyarrow's writers check ``closed`` and ask for the position via ``tell``
+    closed = False
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+# Columns of every export format, in order
+EXPORT_FIELDS = ("id", "user_id", "category_id", "account_id", "amount", "transaction_type", "description", "source", "date")
+
+# File extension and media type of each export format
+EXPORT_FILE_TYPES = {
+    ExportFormat.JSON: ("zip", "application/zip"),
+    ExportFormat.CSV: ("csv", "text/csv"),
+    ExportFormat.ARROW: ("arrow", "application/vnd.apache.arrow.file"),
+    ExportFormat.PARQUET: ("parquet", "application/vnd.apache.parquet"),
+}
+
+
+def _pyarrow():
+    """The pyarrow module, an optional dependency only the Arrow and Parquet exports need."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("Arrow and Parquet exports need the pyarrow package, which is not installed on this server")
+    return pyarrow
+
+
+def _reporting(rows: Iterator[Any], progress: Callable[[int], None]) -> Iterator[Any]:
+    count = 0
+    for count, row in enumerate(rows, 1):
+        yield row
+        if count % settings.EXPORT_CHUNK_SIZE == 0:
+            progress(count)
+    progress(count)
+
+
+def _json_zip_chunks(rows: Iterator[Any], json_filename: str) -> Iterator[bytes]:
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as zipf:
+        with zipf.open(json_filename, "w", force_zip64=True) as entry:
+            entry.write(b"[")
+            for index, row in enumerate(rows):
+                transaction_dict = {
+                    "id": row.id,
+                    "user_id": row.user_id,
+                    "category_id": row.category_id,
+                    "account_id": row.account_id,
+                    "amount": row.amount,
+                    "transaction_type": row.transaction_type,
+                    "description": row.description,
+                    "source": row.source,
+                    "date": row.date.isoformat()
+                }
+                entry.write((",\n" if index else "\n").encode() + json.dumps(transaction_dict).encode())
+                if index % settings.EXPORT_CHUNK_SIZE == 0 and (data := buffer.drain()):
+                    yield data
+            entry.write(b"\n]")
+    yield buffer.drain()
+
+
+def _csv_chunks(rows: Iterator[Any]) -> Iterator[bytes]:
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(EXPORT_FIELDS)
+    for index, row in enumerate(rows, 1):
+        writer.writerow([getattr(row, field) for field in EXPORT_FIELDS])
+        if index % settings.EXPORT_CHUNK_SIZE == 0:
+            yield text.getvalue().encode()
+            text.seek(0)
+            text.truncate()
+    yield text.getvalue().encode()
+
+
+def _columnar_chunks(rows: Iterator[Any], export_format: ExportFormat) -> Iterator[bytes]:
+    """Arrow IPC file or Parquet, one record batch / row group per ``EXPORT_ROW_GROUP_SIZE`` rows."""
+    pa = _pyarrow()
+    schema = pa.schema([
+        ("id", pa.int64()),
+        ("user_id", pa.int64()),
+        ("category_id", pa.int64()),
+        ("account_id", pa.int64()),
+        ("amount", pa.float64()),
+        ("transaction_type", pa.string()),
+        ("description", pa.string()),
+        ("source", pa.string()),
+        ("date", pa.date32()),
+    ])
+    buffer = _ChunkBuffer()
+    if export_format == ExportFormat.PARQUET:
+        writer = pa.parquet.ParquetWriter(buffer, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(buffer, schema)
+    with writer:
+        while group := list(itertools.islice(rows, settings.EXPORT_ROW_GROUP_SIZE)):
+            columns = zip(*([getattr(row, field) for field in EXPORT_FIELDS] for row in group))
+            writer.write_batch(pa.record_batch(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema
+            ))
+            yield buffer.drain()
+    yield buffer.drain()
+
 
 class TransactionService:
     def __init__(self, db: Session):
         self.repository = TransactionRepository(db)
 
     def create_transaction(self, user_id: int, transaction: TransactionCreate) -> Transaction:
+        self.repository.check_references(user_id, transaction.category_id, transaction.account_id)
         return self.repository.create(user_id, transaction)
 
+    def create_transactions_batch(self, user_id: int, batch: TransactionBatchCreate) -> TransactionBatchResult:
+        """Validate a batch as a whole and write its valid items in one multi-row INSERT.
+
+        Category and account references are checked with one query each. In
+        atomic mode any invalid item leaves the database untouched; in partial
+        mode the valid items are still written.
+        """
+        if len(batch.items) > settings.TRANSACTION_BATCH_MAX_ITEMS:
+            raise ValueError(f"A batch may hold at most {settings.TRANSACTION_BATCH_MAX_ITEMS} transactions")
+        categories, accounts = self.repository.owned_references(
+            user_id,
+            {item.category_id for item in batch.items if item.category_id is not None},
+            {item.account_id for item in batch.items if item.account_id is not None},
+        )
+        errors = {}
+        for index, item in enumerate(batch.items):
+            if item.category_id is not None and item.category_id not in categories:
+                errors[index] = f"Category {item.category_id} not found"
+            elif item.account_id is not None and item.account_id not in accounts:
+                errors[index] = f"Account {item.account_id} not found"
+
+        committed = not errors or batch.mode == TransactionBatchMode.PARTIAL
+        valid = [index for index in range(len(batch.items)) if index not in errors]
+        ids = self.repository.create_many(user_id, [batch.items[index] for index in valid]) if committed else []
+        created = dict(zip(valid, ids))
+
+        results = []
+        for index in range(len(batch.items)):
+            if index in errors:
+                results.append(TransactionBatchItemResult(index=index, status=TransactionBatchItemStatus.FAILED, error=errors[index]))
+            elif index in created:
+                results.append(TransactionBatchItemResult(index=index, status=TransactionBatchItemStatus.CREATED, id=created[index]))
+            else:
+                results.append(TransactionBatchItemResult(index=index, status=TransactionBatchItemStatus.SKIPPED))
+        return TransactionBatchResult(committed=committed, created=len(created), failed=len(errors), results=results)
+
     def get_transaction(self, user_id: int, transaction_id: int) -> Optional[Transaction]:
         return self.repository.get(user_id, transaction_id)
 
     def get_transactions(self, user_id: int) -> List[Transaction]:
         return self.repository.get_all(user_id)
 
+    def get_transactions_page(
+        self,
+        user_id: int,
+        filters: TransactionFilter,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> bytes:
+        """A ``TransactionPage`` already encoded as JSON.
+
+        Rows are plain column tuples serialized by orjson, skipping ORM
+        instantiation and per-row pydantic validation.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        # Fetch one extra row to learn whether another page exists
+        rows = self.repository.get_page(user_id, filters, limit + 1, after)
+        next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+        return orjson.dumps({
+            "items": [dict(zip(ROW_FIELDS, row)) for row in rows[:limit]],
+            "next_cursor": next_cursor,
+        })
+
+    def search_transactions(
+        self,
+        user_id: int,
+        query: str,
+        filters: TransactionFilter,
+        limit: int,
+        offset: int = 0,
+    ) -> bytes:
+        """A ``TransactionSearchPage`` already encoded as JSON.
+
+        Every word of ``query`` must match the start of a word in the
+        description or source.
+        """
+        rows = self.repository.search(user_id, search_terms(query), filters, limit + 1, offset)
+        return orjson.dumps({
+            "items": [dict(zip(ROW_FIELDS + ("rank",), row)) for row in rows[:limit]],
+            "next_offset": offset + limit if len(rows) > limit else None,
+        })
+
+    def summarize_transactions(
+        self,
+        user_id: int,
+        filters: TransactionFilter,
+        group_by: Sequence[SummaryGroup] = (),
+        period: Optional[SummaryPeriod] = None,
+        fill_gaps: bool = True,
+    ) -> TransactionSummary:
+        rows = self.repository.summarize(user_id, filters, group_by, period)
+        buckets = []
+        for row in rows:
+            bucket = TransactionSummaryBucket(**row._asdict())
+            if isinstance(row._mapping.get("period"), str):
+                # SQLite hands date expressions back as ISO strings
+                bucket.period = date.fromisoformat(row.period)
+            buckets.append(bucket)
+
+        if period is not None and fill_gaps:
+            buckets = self._fill_period_gaps(buckets, filters, period)
+
+        return TransactionSummary(
+            income=sum(b.income for b in buckets),
+            expense=sum(b.expense for b in buckets),
+            income_count=sum(b.income_count for b in buckets),
+            expense_count=sum(b.expense_count for b in buckets),
+            buckets=buckets,
+        )
+
+    @staticmethod
+    def _fill_period_gaps(
+        buckets: List[TransactionSummaryBucket],
+        filters: TransactionFilter,
+        period: SummaryPeriod,
+    ) -> List[TransactionSummaryBucket]:
+        """Add zero buckets so every group has one entry per period in the requested range."""
+        periods = [b.period for b in buckets]
+        start = filters.date_from or (min(periods) if periods else None)
+        end = filters.date_to or (max(periods) if periods else None)
+        if start is None or end is None:
+            return buckets
+
+        by_key = {(b.period, b.category_id, b.account_id): b for b in buckets}
+        groups = sorted({(b.category_id, b.account_id) for b in buckets}, key=lambda k: (k[0] or 0, k[1] or 0)) or [(None, None)]
+        filled = []
+        current = period_start(start, period)
+        while current <= end:
+            if len(filled) + len(groups) > settings.SUMMARY_MAX_BUCKETS:
+                raise ValueError(
+                    f"Filling gaps would return more than {settings.SUMMARY_MAX_BUCKETS} buckets; "
+                    "narrow the date range, use a longer period or pass fill_gaps=false"
+                )
+            for category_id, account_id in groups:
+                filled.append(by_key.get(
+                    (current, category_id, account_id),
+                    TransactionSummaryBucket(period=current, category_id=category_id, account_id=account_id),
+                ))
+            current = next_period(current, period)
+        return filled
+
     def update_transaction(self, user_id: int, transaction_id: int, transaction: TransactionUpdate) -> Optional[Transaction]:
+        self.repository.check_references(user_id, transaction.category_id, transaction.account_id)
         return self.repository.update(user_id, transaction_id, transaction)
 
     def delete_transaction(self, user_id: int, transaction_id: int) -> bool:
         return self.repository.delete(user_id, transaction_id)
 
-    def export_transactions(self, user_id: int) -> str:
-        transactions = self.get_transactions(user_id)
-        
-        # Convert transactions to JSON-serializable format
-        transactions_data = []
-        for transaction in transactions:
-            transaction_dict = {
-                "id": transaction.id,
-                "user_id": transaction.user_id,
-                "category_id": transaction.category_id,
-                "account_id": transaction.account_id,
-                "amount": transaction.amount,
-                "transaction_type": transaction.transaction_type,
-                "description": transaction.description,
-                "source": transaction.source,
-                "date": transaction.date.isoformat()
-            }
-            transactions_data.append(transaction_dict)
-
-        # Create a temporary directory if it doesn't exist
-        os.makedirs("temp", exist_ok=True)
-        
-        # Generate unique filename with timestamp
-        current_date = datetime.now().strftime("%Y%m%d")
-        json_filename = f"temp/Transactions_{current_date}.json"
-        zip_filename = f"temp/Transactions_{current_date}.zip"
-
-        # Write transactions to JSON file
-        with open(json_filename, 'w') as f:
-            json.dump(transactions_data, f, indent=4)
-
-        # Create zip file
-        with zipfile.ZipFile(zip_filename, 'w') as zipf:
-            zipf.write(json_filename, os.path.basename(json_filename))
-
-        # Remove the JSON file after zipping
-        os.remove(json_filename)
-
-        return zip_filename
-
-    def import_transactions(self, user_id: int, file_path: str) -> List[Transaction]:
-        try:
-            with open(file_path, 'r') as f:
-                transactions_data = json.load(f)
-
-            imported_transactions = []
-            for transaction_data in transactions_data:
-                # Create a TransactionCreate object from the data
-                transaction = TransactionCreate(
-                    amount=transaction_data["amount"],
-                    transaction_type=transaction_data["transaction_type"],
-                    description=transaction_data.get("description"),
-                    source=transaction_data.get("source"),
-                    category_id=transaction_data.get("category_id"),
-                    account_id=transaction_data.get("account_id"),
-                    date=datetime.fromisoformat(transaction_data["date"]).date()
-                )
-                
-                # Create the transaction in the database
-                created_transaction = self.create_transaction(user_id, transaction)
-                imported_transactions.append(created_transaction)
-
-            return imported_transactions
-        except Exception as e:
-            raise Exception(f"Error importing transactions: {str(e)}") 
\ No newline at end of file
+    @staticmethod
+    def _check_bulk_filter(filters: TransactionBulkFilter) -> None:
+        if not filters.dict(exclude_none=True):
+            raise ValueError("A bulk operation needs at least one filter")
+        if filters.ids is not None and len(filters.ids) > settings.TRANSACTION_BATCH_MAX_ITEMS:
+            raise ValueError(f"At most {settings.TRANSACTION_BATCH_MAX_ITEMS} ids may be given")
+
+    def bulk_update_transactions(self, user_id: int, request: TransactionBulkUpdate) -> TransactionBulkResult:
+        """Patch every transaction matching the filter in one statement, or only count them on a dry run."""
+        self._check_bulk_filter(request.filter)
+        values = request.patch.dict(exclude_unset=True)
+        if not values:
+            raise ValueError("The patch must set at least one field")
+        for key in ("transaction_type", "date"):
+            if key in values and values[key] is None:
+                raise ValueError(f"{key} cannot be cleared")
+        self.repository.check_references(user_id, values.get("category_id"), values.get("account_id"))
+        if request.dry_run:
+            return TransactionBulkResult(affected=self.repository.count_matching(user_id, request.filter), dry_run=True)
+        return TransactionBulkResult(affected=self.repository.bulk_update(user_id, request.filter, values), dry_run=False)
+
+    def bulk_delete_transactions(self, user_id: int, request: TransactionBulkDelete) -> TransactionBulkResult:
+        """Delete every transaction matching the filter in one statement, or only count them on a dry run."""
+        self._check_bulk_filter(request.filter)
+        if request.dry_run:
+            return TransactionBulkResult(affected=self.repository.count_matching(user_id, request.filter), dry_run=True)
+        return TransactionBulkResult(affected=self.repository.bulk_delete(user_id, request.filter), dry_run=False)
+
+    def export_filename(self, export_format: ExportFormat = ExportFormat.JSON) -> str:
+        return f"Transactions_{datetime.now().strftime('%Y%m%d')}.{EXPORT_FILE_TYPES[export_format][0]}"
+
+    @staticmethod
+    def export_media_type(export_format: ExportFormat) -> str:
+        return EXPORT_FILE_TYPES[export_format][1]
+
+    @staticmethod
+    def check_export_format(export_format: ExportFormat) -> None:
+        """Raise ``ValueError`` if this server cannot write ``export_format``, before any of the export is sent."""
+        if export_format in (ExportFormat.ARROW, ExportFormat.PARQUET):
+            _pyarrow()
+
+    def export_transactions(
+        self,
+        user_id: int,
+        filters: Optional[TransactionFilter] = None,
+        export_format: ExportFormat = ExportFormat.JSON,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> Iterator[bytes]:
+        """Yield an export of the user's transactions matching ``filters``, oldest first.
+
+        Rows are pulled from the database in chunks and encoded as they arrive,
+        so memory stays flat and nothing is written to disk; Arrow and Parquet
+        hold one row group at a time. ``progress`` is called with the number
+        of rows read so far once per chunk.
+        """
+        rows = self.repository.iter_rows(user_id, settings.EXPORT_CHUNK_SIZE, filters)
+        if progress is not None:
+            rows = _reporting(rows, progress)
+        if export_format == ExportFormat.JSON:
+            yield from _json_zip_chunks(rows, self.export_filename().replace(".zip", ".json"))
+        elif export_format == ExportFormat.CSV:
+            yield from _csv_chunks(rows)
+        else:
+            yield from _columnar_chunks(rows, export_format)
+
+    def import_transactions(
+        self,
+        user_id: int,
+        stream: BinaryIO,
+        chunk_size: Optional[int] = None,
+        progress: Optional[Callable[[int], None]] = None,
+        before_commit: Optional[Callable[[int, int], None]] = None,
+    ) -> TransactionImportSummary:
+        """Bulk-load a JSON array of transactions in a single database transaction.
+
+        The upload is parsed incrementally and validated one chunk at a time,
+        including that its categories and accounts belong to the user; each
+        chunk becomes one multi-row INSERT. Any invalid row aborts the
+        whole import, as does an exception raised by ``progress``, which is
+        called with the number of rows read so far once per chunk, or by
+        ``before_commit(rows, chunks)``, which runs just before the commit.
+        """
+        chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+
+        def check_references(chunk: List[TransactionCreate], first_index: int) -> None:
+            categories, accounts = self.repository.owned_references(
+                user_id,
+                {item.category_id for item in chunk if item.category_id is not None},
+                {item.account_id for item in chunk if item.account_id is not None},
+            )
+            for index, item in enumerate(chunk, first_index):
+                if item.category_id is not None and item.category_id not in categories:
+                    raise ValueError(f"Invalid transaction at index {index}: Category {item.category_id} not found")
+                if item.account_id is not None and item.account_id not in accounts:
+                    raise ValueError(f"Invalid transaction at index {index}: Account {item.account_id} not found")
+
+        def chunks() -> Iterator[List[TransactionCreate]]:
+            chunk = []
+            rows = 0
+            for index, transaction_data in enumerate(_iter_json_array(stream)):
+                try:
+                    chunk.append(_parse_import_row(transaction_data))
+                except Exception as e:
+                    raise ValueError(f"Invalid transaction at index {index}: {e}")
+                rows = index + 1
+                if len(chunk) >= chunk_size:
+                    check_references(chunk, rows - len(chunk))
+                    if progress is not None:
+                        progress(rows)
+                    yield chunk
+                    chunk = []
+            check_references(chunk, rows - len(chunk))
+            if progress is not None:
+                progress(rows)
+            yield chunk
+
+        started = time.perf_counter()
+        imported, chunk_count = self.repository.bulk_create(user_id, chunks(), before_commit)
+        duration = time.perf_counter() - started
+        return TransactionImportSummary(
+            imported=imported,
+            chunks=chunk_count,
+            duration_seconds=round(duration, 3),
+            rows_per_second=round(imported / duration, 1) if duration > 0 else 0.0,
+        )
\ No newline at end of file
@@ -0,0 +1,62 @@
+import itertools
+import os
+import tempfile
+
+# Settings are read when src is first imported, so the test database and
+# secrets have to be in place before any test module imports it
+_database_dir = tempfile.mkdtemp(prefix="flowfinance-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_database_dir, 'test.db')}"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("JOB_WORKERS", "0")
+os.environ.setdefault("JOB_STORAGE_DIR", os.path.join(_database_dir, "jobs"))
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """Migrate the test database once with ``alembic upgrade head``."""
+    from src.core.migrations import upgrade_database
+
+    upgrade_database(os.environ["DATABASE_URL"])
+    yield
+
+
+@pytest.fixture
+def db():
+    from src.core.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture(scope="session")
+def client(database):
+    from fastapi.testclient import TestClient
+    from src.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+_usernames = itertools.count(1)
+
+
+@pytest.fixture
+def register(client):
+    """Register a fresh user and return it (as JSON) with its auth headers."""
+    def register():
+        username = f"user{next(_usernames)}"
+        response = client.post("/register", json={"email": f"{username}@example.com", "username": username, "password": "secret"})
+        assert response.status_code == 200, response.text
+        user = response.json()
+        response = client.post("/token", data={"username": username, "password": "secret"})
+        assert response.status_code == 200, response.text
+        return user, {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    return register
\ No newline at end of file
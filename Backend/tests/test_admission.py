@@ -0,0 +1,20 @@
+from src.core.admission import export_limiter
+from src.services.transaction_service import TransactionService
+
+
+def test_streamed_export_holds_its_slot_until_the_body_is_sent(client, register, monkeypatch):
+    _, headers = register()
+    in_flight_while_streaming = []
+
+    def export_transactions(self, user_id, filters=None, export_format=None, progress=None):
+        # The body is produced after the route has returned, while it is being sent
+        for _ in range(3):
+            in_flight_while_streaming.append(export_limiter.stats()["in_flight"])
+            yield b"chunk"
+
+    monkeypatch.setattr(TransactionService, "export_transactions", export_transactions)
+    response = client.get("/transactions/export", headers=headers)
+
+    assert response.status_code == 200, response.text
+    assert in_flight_while_streaming == [1, 1, 1]
+    assert export_limiter.stats()["in_flight"] == 0
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""Stored account balances and budget spend counters are maintained on every write path.
+
+After each kind of write, the counters must equal what a rebuild from the
+transactions computes.
+"""
+import io
+import json
+from datetime import date
+
+import pytest
+
+from src.models.account import Account
+from src.models.budget import CategorySpend
+from src.repositories.account_repository import AccountRepository
+from src.repositories.budget_repository import BudgetRepository
+from src.services.recurring_transaction_service import RecurringTransactionService
+
+
+def _counters(db, user_id):
+    db.expire_all()
+    balances = {account.id: account.balance for account in db.query(Account).filter_by(user_id=user_id)}
+    spend = {
+        (row.category_id, row.period, row.period_start): row.spent
+        for row in db.query(CategorySpend).filter_by(user_id=user_id)
+        if row.spent
+    }
+    return balances, spend
+
+
+def assert_counters_match_rebuild(db, user_id):
+    assert AccountRepository(db).find_balance_drift(user_id) == []
+    assert BudgetRepository(db).find_spend_drift(user_id) == []
+    maintained = _counters(db, user_id)
+    AccountRepository(db).rebuild_balances(user_id)
+    BudgetRepository(db).rebuild_spend(user_id)
+    assert _counters(db, user_id) == maintained
+
+
+@pytest.fixture
+def ledger(client, register):
+    """A user with two accounts, two categories and a few transactions with fractional amounts."""
+    user, headers = register()
+
+    def post(path, body):
+        response = client.post(path, json=body, headers=headers)
+        assert response.status_code in (200, 201), response.text
+        return response.json()
+
+    accounts = [post("/accounts/", {"name": name, "initial_balance": balance})["id"] for name, balance in (("Main", 100.1), ("Card", 0))]
+    # Category names are unique across all users
+    categories = [post("/categories/", {"name": f"{name} {user['id']}"})["id"] for name in ("Food", "Rent")]
+    transactions = [
+        post("/transactions/", {
+            "amount": amount, "transaction_type": kind, "date": day,
+            "account_id": accounts[0], "category_id": categories[0], "description": f"t{index}",
+        })["id"]
+        for index, (amount, kind, day) in enumerate([
+            (0.1, "expense", "2024-01-05"),
+            (0.2, "expense", "2024-01-31"),
+            (19.99, "revenue", "2024-02-01"),
+            (33.33, "expense", "2024-02-29"),
+        ])
+    ]
+    return {"user": user, "headers": headers, "accounts": accounts, "categories": categories, "transactions": transactions}
+
+
+def test_create(db, ledger):
+    assert_counters_match_rebuild(db, ledger["user"]["id"])
+    balance = db.get(Account, ledger["accounts"][0]).balance
+    assert balance == pytest.approx(100.1 - 0.1 - 0.2 + 19.99 - 33.33)
+
+
+def test_update_amount_category_and_date(client, db, ledger):
+    transaction_id = ledger["transactions"][0]
+    response = client.put(f"/transactions/{transaction_id}", headers=ledger["headers"], json={
+        "amount": 12.34, "transaction_type": "expense", "date": "2024-03-10",
+        "account_id": ledger["accounts"][0], "category_id": ledger["categories"][1],
+    })
+    assert response.status_code == 200, response.text
+    assert_counters_match_rebuild(db, ledger["user"]["id"])
+
+
+def test_move_between_accounts(client, db, ledger):
+    transaction_id = ledger["transactions"][2]
+    response = client.put(f"/transactions/{transaction_id}", headers=ledger["headers"], json={
+        "amount": 19.99, "transaction_type": "revenue", "date": "2024-02-01",
+        "account_id": ledger["accounts"][1], "category_id": ledger["categories"][0],
+    })
+    assert response.status_code == 200, response.text
+    assert_counters_match_rebuild(db, ledger["user"]["id"])
+    assert db.get(Account, ledger["accounts"][1]).balance == pytest.approx(19.99)
+
+
+def test_delete(client, db, ledger):
+    response = client.delete(f"/transactions/{ledger['transactions'][3]}", headers=ledger["headers"])
+    assert response.status_code == 204
+    assert_counters_match_rebuild(db, ledger["user"]["id"])
+
+
+def test_batch_create(client, db, ledger):
+    items = [
+        {"amount": 0.01 * (index + 1), "transaction_type": "expense", "date": f"2024-04-{index + 1:02d}",
+         "account_id": ledger["accounts"][index % 2], "category_id": ledger["categories"][index % 2]}
+        for index in range(20)
+    ]
+    response = client.post("/transactions/batch", headers=ledger["headers"], json={"items": items})
+    assert response.status_code == 201, response.text
+    assert_counters_match_rebuild(db, ledger["user"]["id"])
+
+
+def test_bulk_update(client, db, ledger):
+    response = client.post("/transactions/bulk-update", headers=ledger["headers"], json={
+        "filter": {"category_id": ledger["categories"][0], "transaction_type": "expense"},
+        "patch": {"account_id": ledger["accounts"][1], "category_id": ledger["categories"][1], "date": "2024-05-15"},
+    })
+    assert response.status_code == 200, response.text
+    assert response.json()["affected"] == 3
+    assert_counters_match_rebuild(db, ledger["user"]["id"])
+
+
+def test_bulk_delete(client, db, ledger):
+    response = client.post("/transactions/bulk-delete", headers=ledger["headers"], json={
+        "filter": {"date_from": "2024-01-31", "date_to": "2024-02-29"},
+    })
+    assert response.status_code == 200, response.text
+    assert response.json()["affected"] == 3
+    assert_counters_match_rebuild(db, ledger["user"]["id"])
+
+
+def test_import(client, db, ledger):
+    rows = [
+        {"amount": 1.11 * (index + 1), "transaction_type": "expense" if index % 3 else "revenue",
+         "date": f"2023-12-{index + 1:02d}", "account_id": ledger["accounts"][index % 2],
+         "category_id": ledger["categories"][0]}
+        for index in range(25)
+    ]
+    upload = io.BytesIO(json.dumps(rows).encode())
+    response = client.post("/transactions/import?chunk_size=7", headers=ledger["headers"],
+                           files={"file": ("transactions.json", upload, "application/json")})
+    assert response.status_code == 200, response.text
+    assert response.json()["imported"] == 25
+    assert_counters_match_rebuild(db, ledger["user"]["id"])
+
+
+def test_recurring_materialization(client, db, ledger):
+    response = client.post("/recurring-transactions/", headers=ledger["headers"], json={
+        "amount": 9.99, "transaction_type": "expense", "interval": "week", "anchor_date": "2024-01-01",
+        "account_id": ledger["accounts"][1], "category_id": ledger["categories"][1],
+    })
+    assert response.status_code == 201, response.text
+    summary = RecurringTransactionService(db).materialize_due(as_of=date(2024, 3, 31))
+    assert summary.materialized >= 13
+    assert_counters_match_rebuild(db, ledger["user"]["id"])
+    # A second pass inserts nothing and moves nothing
+    before = _counters(db, ledger["user"]["id"])
+    RecurringTransactionService(db).materialize_due(as_of=date(2024, 3, 31))
+    assert _counters(db, ledger["user"]["id"]) == before
+
+
+def test_cursor_pages_cover_every_transaction_once(client, ledger):
+    items = [
+        {"amount": 1, "transaction_type": "expense", "date": f"2024-06-{index % 5 + 1:02d}"}
+        for index in range(23)
+    ]
+    assert client.post("/transactions/batch", headers=ledger["headers"], json={"items": items}).status_code == 201
+    everything = client.get("/transactions/?limit=1000", headers=ledger["headers"]).json()["items"]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 5, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/transactions/", params=params, headers=ledger["headers"]).json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [item["id"] for item in everything]
+    assert len(seen) == len(set(seen)) == 27
\ No newline at end of file
@@ -0,0 +1,42 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.models.recurring_transaction import RecurringTransaction
+from src.repositories.recurring_transaction_repository import scheduled_date
+from src.services.forecast_service import first_index_from, month_index, recurring_schedule
+
+
+def _rule(interval, anchor, interval_count=1, materialized_count=0, end_date=None, amount=3500):
+    rule = RecurringTransaction(
+        id=1, account_id=1, amount=amount, transaction_type="revenue", interval=interval,
+        interval_count=interval_count, anchor_date=anchor, end_date=end_date, materialized_count=materialized_count,
+    )
+    rule.next_date = scheduled_date(rule, materialized_count)
+    return rule
+
+
+def test_overdue_occurrences_are_not_projected():
+    # Monthly rule anchored three years back and never materialized
+    rule = _rule("month", date(2023, 1, 15))
+    first_month = month_index(date(2026, 1, 1))
+    schedule = recurring_schedule([rule], np.array([1.0]), first_month, 3)
+    assert schedule.tolist() == [[3500, 3500, 3500]]
+
+
+def test_rule_starting_inside_the_window():
+    rule = _rule("week", date(2026, 2, 1), end_date=date(2026, 2, 28))
+    schedule = recurring_schedule([rule], np.array([1.0]), month_index(date(2026, 1, 1)), 3)
+    assert schedule.tolist() == [[0, 4 * 3500, 0]]
+
+
+@pytest.mark.parametrize("interval, interval_count", [("day", 1), ("day", 3), ("week", 2), ("month", 1), ("month", 5), ("year", 1)])
+@pytest.mark.parametrize("anchor", [date(2019, 1, 31), date(2020, 2, 29), date(2021, 7, 4)])
+def test_first_index_from_matches_stepping(interval, interval_count, anchor):
+    rule = _rule(interval, anchor, interval_count=interval_count, materialized_count=2)
+    for start in (anchor - timedelta(days=30), date(2024, 3, 1), date(2025, 12, 31)):
+        index = 2
+        while scheduled_date(rule, index) < start:
+            index += 1
+        assert first_index_from(rule, start) == index
\ No newline at end of file
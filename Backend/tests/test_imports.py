@@ -0,0 +1,52 @@
+import io
+import json
+
+
+def _import(client, headers, rows, chunk_size=2):
+    upload = io.BytesIO(json.dumps(rows).encode())
+    return client.post(f"/transactions/import?chunk_size={chunk_size}", headers=headers,
+                       files={"file": ("transactions.json", upload, "application/json")})
+
+
+def _row(**references):
+    return {"amount": 5, "transaction_type": "expense", "date": "2024-01-01", **references}
+
+
+def test_import_rejects_another_users_account_and_category(client, register):
+    owner, owner_headers = register()
+    account = client.post("/accounts/", json={"name": "Main", "initial_balance": 0}, headers=owner_headers).json()["id"]
+    category = client.post("/categories/", json={"name": f"Food {owner['id']}"}, headers=owner_headers).json()["id"]
+    _, headers = register()
+
+    response = _import(client, headers, [_row(), _row(), _row(), _row(account_id=account)])
+    assert response.status_code == 400
+    assert response.json()["detail"] == f"Invalid transaction at index 3: Account {account} not found"
+
+    response = _import(client, headers, [_row(category_id=category)])
+    assert response.status_code == 400
+    assert response.json()["detail"] == f"Invalid transaction at index 0: Category {category} not found"
+
+    # The whole import is rolled back, including the chunks before the bad row
+    assert client.get("/transactions/", headers=headers).json()["items"] == []
+    assert client.get(f"/accounts/{account}", headers=owner_headers).json()["balance"] == 0
+
+
+def test_import_accepts_own_references(client, register):
+    user, headers = register()
+    account = client.post("/accounts/", json={"name": "Main", "initial_balance": 0}, headers=headers).json()["id"]
+    category = client.post("/categories/", json={"name": f"Food {user['id']}"}, headers=headers).json()["id"]
+    response = _import(client, headers, [_row(account_id=account, category_id=category)] * 3)
+    assert response.status_code == 200, response.text
+    assert client.get(f"/accounts/{account}", headers=headers).json()["balance"] == -15
+
+def test_import_without_a_token_is_unauthorized(client):
+    upload = io.BytesIO(b"[]")
+    response = client.post("/transactions/import", files={"file": ("transactions.json", upload, "application/json")})
+    assert response.status_code == 401
+
+
+def test_import_with_an_invalid_token_is_unauthorized(client):
+    upload = io.BytesIO(b"[]")
+    response = client.post("/transactions/import", headers={"Authorization": "Bearer not-a-token"},
+                           files={"file": ("transactions.json", upload, "application/json")})
+    assert response.status_code == 401
\ No newline at end of file
@@ -0,0 +1,39 @@
+import pytest
+
+from src.core.config import settings
+
+INTERNAL_ENDPOINTS = ["/internal/auth-cache", "/internal/forecast-cache", "/internal/db-pool", "/internal/read-routing", "/internal/admission", "/internal/jobs"]
+
+
+@pytest.mark.parametrize("path", INTERNAL_ENDPOINTS)
+def test_internal_endpoints_require_a_token(client, path):
+    assert client.get(path).status_code == 401
+
+
+@pytest.mark.parametrize("path", INTERNAL_ENDPOINTS)
+def test_internal_endpoints_reject_non_admins(client, register, monkeypatch, path):
+    monkeypatch.setattr(settings, "INTERNAL_ADMIN_USERNAMES", "someone-else")
+    _, headers = register()
+    assert client.get(path, headers=headers).status_code == 403
+
+
+@pytest.mark.parametrize("path", INTERNAL_ENDPOINTS)
+def test_internal_endpoints_serve_admins(client, register, monkeypatch, path):
+    user, headers = register()
+    monkeypatch.setattr(settings, "INTERNAL_ADMIN_USERNAMES", f"ops, {user['username']}")
+    assert client.get(path, headers=headers).status_code == 200
+
+
+def test_job_stats_are_not_served_to_job_owners(client, register, monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_ADMIN_USERNAMES", "")
+    _, headers = register()
+    assert client.post("/jobs/export", headers=headers).status_code == 202
+    response = client.get("/internal/jobs", headers=headers)
+    assert response.status_code == 403
+    assert "running" not in response.text
+
+
+def test_public_metrics_leave_out_the_auth_cache(client):
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert "auth_cache" not in response.text
\ No newline at end of file
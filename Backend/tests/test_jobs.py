@@ -0,0 +1,158 @@
+import io
+import json
+from datetime import timedelta
+
+import pytest
+
+from src.core.database import SessionLocal
+from src.models.job import Job, JobKind, JobStatus
+from src.models.transaction import Transaction
+from src.repositories.job_repository import Claim, JobRepository, utcnow
+from src.services.job_service import JobService, run_import
+from src.services.job_worker import JobContext, JobWorker
+
+
+@pytest.fixture
+def jobs(db):
+    # Workers claim the oldest due job of any user, so start from an empty queue
+    db.query(Job).delete()
+    db.commit()
+    return JobRepository(db)
+
+
+def test_a_job_is_claimed_once(jobs):
+    job = jobs.create(1, JobKind.EXPORT, {}, max_attempts=3)
+    claimed = jobs.claim_next("worker-a")
+    assert (claimed.id, claimed.status, claimed.attempts, claimed.worker) == (job.id, JobStatus.RUNNING.value, 1, "worker-a")
+    assert jobs.claim_next("worker-b") is None
+
+
+def test_claims_follow_run_after(jobs):
+    later = jobs.create(1, JobKind.EXPORT, {}, max_attempts=3)
+    jobs.fail(Claim.of(jobs.claim_next("worker")), "not yet", retry_at=utcnow() + timedelta(hours=1))
+    due = jobs.create(1, JobKind.EXPORT, {}, max_attempts=3)
+    assert jobs.claim_next("worker").id == due.id
+    assert jobs.claim_next("worker") is None
+
+
+def test_failed_attempts_are_retried_until_max_attempts(db, jobs):
+    calls = []
+
+    def flaky(db, job, context):
+        calls.append(job.attempts)
+        raise RuntimeError("boom")
+
+    worker = JobWorker({JobKind.EXPORT.value: flaky}, threads=0, poll_seconds=0)
+    job = jobs.create(1, JobKind.EXPORT, {}, max_attempts=2)
+
+    assert worker.run_once()
+    db.expire_all()
+    retried = db.get(Job, job.id)
+    assert (retried.status, retried.attempts, retried.error) == (JobStatus.QUEUED.value, 1, "RuntimeError: boom")
+    # SQLite hands back naive UTC timestamps
+    assert retried.run_after.replace(tzinfo=None) > utcnow().replace(tzinfo=None)
+
+    # Make the backoff due instead of waiting for it
+    db.query(Job).filter_by(id=job.id).update({"run_after": utcnow() - timedelta(seconds=1)})
+    db.commit()
+    assert worker.run_once()
+    db.expire_all()
+    failed = db.get(Job, job.id)
+    assert (failed.status, failed.attempts) == (JobStatus.FAILED.value, 2)
+    assert calls == [1, 2]
+    assert not worker.run_once()
+
+
+def test_invalid_input_fails_without_retry(db, jobs):
+    def invalid(db, job, context):
+        raise ValueError("bad filter")
+
+    worker = JobWorker({JobKind.EXPORT.value: invalid}, threads=0, poll_seconds=0)
+    job = jobs.create(1, JobKind.EXPORT, {}, max_attempts=3)
+    assert worker.run_once()
+    db.expire_all()
+    assert (db.get(Job, job.id).status, db.get(Job, job.id).error) == (JobStatus.FAILED.value, "bad filter")
+
+
+def test_requeue_starts_a_failed_job_over(db, jobs):
+    job = jobs.create(1, JobKind.EXPORT, {}, max_attempts=1)
+    jobs.fail(Claim.of(jobs.claim_next("worker")), "boom")
+    assert not jobs.requeue(2, job.id), "only the owner may retry"
+    assert jobs.requeue(1, job.id)
+    db.expire_all()
+    requeued = db.get(Job, job.id)
+    assert (requeued.status, requeued.attempts, requeued.error) == (JobStatus.QUEUED.value, 0, None)
+    assert jobs.claim_next("worker").attempts == 1
+
+
+def test_retry_endpoint(client, register, db, jobs):
+    user, headers = register()
+    job = jobs.create(user["id"], JobKind.EXPORT, {"format": "json"}, max_attempts=1)
+    assert client.post(f"/jobs/{job.id}/retry", headers=headers).status_code == 409
+    jobs.fail(Claim.of(jobs.claim_next("worker")), "boom")
+    response = client.post(f"/jobs/{job.id}/retry", headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == JobStatus.QUEUED.value
+    _, other = register()
+    assert client.post(f"/jobs/{job.id}/retry", headers=other).status_code == 404
+
+def _reclaim(jobs, worker):
+    """Requeue every running job as if its worker had died, then claim it again as ``worker``."""
+    assert jobs.reclaim_stale(utcnow() + timedelta(seconds=1))
+    return jobs.claim_next(worker)
+
+
+def test_a_reclaimed_run_cannot_record_its_outcome(db, jobs):
+    job = jobs.create(1, JobKind.EXPORT, {}, max_attempts=3)
+    stale = Claim.of(jobs.claim_next("worker-a"))
+    current = Claim.of(_reclaim(jobs, "worker-b"))
+
+    assert jobs.heartbeat(stale, 5, 10), "a reclaimed run is told to stop"
+    assert not jobs.finish(stale, 10, 10, {"rows": 10}, None)
+    assert not jobs.fail(stale, "boom")
+    assert not jobs.mark_cancelled(stale)
+    assert not jobs.heartbeat(current, 1, 10)
+    assert jobs.finish(current, 10, 10, {"rows": 10}, None)
+    db.expire_all()
+    assert (db.get(Job, job.id).status, db.get(Job, job.id).worker) == (JobStatus.SUCCEEDED.value, "worker-b")
+
+
+def test_heartbeats_are_written_and_skipped_while_sqlite_is_locked(db, jobs):
+    job = jobs.create(1, JobKind.EXPORT, {}, max_attempts=3)
+    claim = Claim.of(jobs.claim_next("worker"))
+    db.query(Job).filter_by(id=job.id).update({"heartbeat_at": utcnow() - timedelta(hours=1)})
+    db.commit()
+    assert not jobs.heartbeat(claim, 3, 10)
+    db.expire_all()
+    beat = db.get(Job, job.id)
+    assert (beat.progress, beat.total) == (3, 10)
+    assert beat.heartbeat_at.replace(tzinfo=None) > (utcnow() - timedelta(minutes=1)).replace(tzinfo=None)
+
+    with SessionLocal() as writer, SessionLocal() as other:
+        # Hold the single SQLite write lock, as a running import does
+        writer.query(Job).filter_by(id=job.id).update({"params": {"locked": True}})
+        assert not JobRepository(other).heartbeat(claim, 4, 10)
+        writer.rollback()
+    db.expire_all()
+    assert db.get(Job, job.id).progress == 3
+
+
+def test_an_import_job_never_imports_twice(db, jobs, register):
+    user, _ = register()
+    rows = [{"amount": 1, "transaction_type": "expense", "date": "2024-01-01"}] * 3
+    JobService(db).enqueue_import(user["id"], io.BytesIO(json.dumps(rows).encode()))
+    count = lambda: db.query(Transaction).filter_by(user_id=user["id"]).count()
+
+    # A run that lost the job cannot commit its rows
+    stale = Claim.of(jobs.claim_next("worker-a"))
+    current = _reclaim(jobs, "worker-b")
+    with pytest.raises(RuntimeError):
+        run_import(db, current, JobContext(stale))
+    assert count() == 0
+
+    # Rows committed by a run that never finished the job are not imported again
+    result, _ = run_import(db, current, JobContext(Claim.of(current)))
+    assert result["imported"] == 3 and count() == 3
+    retried = _reclaim(jobs, "worker-c")
+    assert run_import(db, retried, JobContext(Claim.of(retried)))[0] == {"imported": 3, "chunks": 1}
+    assert count() == 3
\ No newline at end of file
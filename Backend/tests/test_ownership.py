@@ -0,0 +1,68 @@
+from datetime import date
+
+from src.models.account import Account
+from src.repositories.account_repository import AccountRepository
+from src.repositories.transaction_repository import TransactionRepository
+from src.schemas.transaction import TransactionCreate
+
+
+def _owner_with_account(client, register):
+    owner, headers = register()
+    account = client.post("/accounts/", json={"name": "Main", "initial_balance": 10}, headers=headers).json()["id"]
+    category = client.post("/categories/", json={"name": f"Food {owner['id']}"}, headers=headers).json()["id"]
+    return owner, account, category
+
+
+def test_create_rejects_another_users_references(client, register):
+    _, account, category = _owner_with_account(client, register)
+    _, headers = register()
+    body = {"amount": 5, "transaction_type": "expense", "date": "2024-01-01"}
+    response = client.post("/transactions/", headers=headers, json={**body, "account_id": account})
+    assert (response.status_code, response.json()["detail"]) == (400, f"Account {account} not found")
+    response = client.post("/transactions/", headers=headers, json={**body, "category_id": category})
+    assert (response.status_code, response.json()["detail"]) == (400, f"Category {category} not found")
+
+
+def test_update_rejects_another_users_references(client, register):
+    _, account, _ = _owner_with_account(client, register)
+    _, headers = register()
+    body = {"amount": 5, "transaction_type": "expense", "date": "2024-01-01"}
+    transaction = client.post("/transactions/", headers=headers, json=body).json()["id"]
+    response = client.put(f"/transactions/{transaction}", headers=headers, json={**body, "account_id": account})
+    assert (response.status_code, response.json()["detail"]) == (400, f"Account {account} not found")
+
+
+def test_rebuild_ignores_foreign_rows_pointing_at_an_account(client, register, db):
+    owner, account, _ = _owner_with_account(client, register)
+    intruder, _ = register()
+    # A row written before references were checked, bypassing the service
+    TransactionRepository(db).create(intruder["id"], TransactionCreate(
+        amount=1000, transaction_type="revenue", date=date(2024, 1, 1), account_id=account,
+    ))
+    accounts = AccountRepository(db)
+    accounts.rebuild_balances(owner["id"])
+    db.expire_all()
+    assert db.get(Account, account).balance == 10
+    assert accounts.find_balance_drift(owner["id"]) == []
+
+def test_recurring_rules_reject_another_users_references(client, register):
+    _, account, category = _owner_with_account(client, register)
+    _, headers = register()
+    body = {"amount": 5, "transaction_type": "expense", "interval": "month", "anchor_date": "2024-01-01"}
+    response = client.post("/recurring-transactions/", headers=headers, json={**body, "account_id": account})
+    assert (response.status_code, response.json()["detail"]) == (400, f"Account {account} not found")
+
+    rule = client.post("/recurring-transactions/", headers=headers, json=body).json()["id"]
+    response = client.put(f"/recurring-transactions/{rule}", headers=headers, json={"category_id": category})
+    assert (response.status_code, response.json()["detail"]) == (400, f"Category {category} not found")
+
+
+def test_recurring_rule_update_rejects_clearing_required_fields(client, register):
+    _, headers = register()
+    body = {"amount": 5, "transaction_type": "expense", "interval": "month", "anchor_date": "2024-01-01"}
+    rule = client.post("/recurring-transactions/", headers=headers, json=body).json()["id"]
+    for field in ("amount", "transaction_type"):
+        response = client.put(f"/recurring-transactions/{rule}", headers=headers, json={field: None})
+        assert (response.status_code, response.json()["detail"]) == (400, f"{field} cannot be cleared")
+    response = client.put(f"/recurring-transactions/{rule}", headers=headers, json={"amount": 7})
+    assert response.status_code == 200 and response.json()["amount"] == 7
\ No newline at end of file
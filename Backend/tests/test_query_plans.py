@@ -0,0 +1,21 @@
+import pytest
+
+from src.commands.check_query_plans import check_plans, hot_queries
+
+
+@pytest.fixture(scope="module")
+def plans():
+    """Plan violations and lines of every hot query on the freshly migrated, empty database."""
+    return {name: (problems, lines) for name, problems, lines in check_plans(user_id=1)}
+
+
+def test_every_hot_query_is_checked(plans, db):
+    assert set(plans) == {name for name, _ in hot_queries(db, 1)}
+    for name, (_, lines) in plans.items():
+        assert lines, f"{name} issued no SELECT"
+
+
+@pytest.mark.parametrize("name", [name for name, _ in hot_queries(None, 1)])
+def test_hot_query_uses_an_index(plans, name):
+    problems, lines = plans[name]
+    assert not problems, f"{name} scans a hot table: {lines}"
\ No newline at end of file
@@ -0,0 +1,63 @@
+import os
+import sqlite3
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+
+from src.core import database
+from src.core.database import ReadRouting
+from src.models.account import Account
+
+WINDOW_SECONDS = 0.5
+
+
+@pytest.fixture
+def replica(client, register, db, monkeypatch, tmp_path):
+    """Two users, a replica copied from the primary, then one account per user written to the primary only."""
+    users = [register() for _ in range(2)]
+    replica_path = tmp_path / "replica.db"
+    with sqlite3.connect(make_url(os.environ["DATABASE_URL"]).database) as primary, sqlite3.connect(replica_path) as copy:
+        primary.backup(copy)
+    engine = create_engine(f"sqlite:///{replica_path}")
+    routing = ReadRouting([engine], WINDOW_SECONDS)
+    monkeypatch.setattr(database, "read_routing", routing)
+
+    # Written without a client, so nobody is pinned yet
+    db.add_all(Account(user_id=user["id"], name="Not replicated", balance=0) for user, _ in users)
+    db.commit()
+    yield routing, users
+    engine.dispose()
+
+
+def _account_names(client, headers):
+    response = client.get("/accounts/", headers=headers)
+    assert response.status_code == 200, response.text
+    return {account["name"] for account in response.json()}
+
+
+def test_reads_go_to_the_replica(client, replica):
+    routing, [(_, headers), _] = replica
+    assert _account_names(client, headers) == set()
+    assert (routing.replica_reads, routing.pinned_reads) == (1, 0)
+
+
+def test_a_write_pins_its_client_to_the_primary_for_the_window(client, replica):
+    routing, [(_, headers), _] = replica
+    assert client.post("/accounts/", headers=headers, json={"name": "Written", "initial_balance": 0}).status_code == 201
+    assert _account_names(client, headers) == {"Not replicated", "Written"}
+    assert routing.pinned_reads == 1
+
+    time.sleep(WINDOW_SECONDS + 0.1)
+    assert _account_names(client, headers) == set()
+    assert (routing.replica_reads, routing.pinned_reads) == (1, 1)
+
+
+def test_clients_do_not_share_a_pin(client, replica):
+    routing, [(_, writer), (_, reader)] = replica
+    assert writer != reader
+    assert client.post("/accounts/", headers=writer, json={"name": "Written", "initial_balance": 0}).status_code == 201
+    assert _account_names(client, reader) == set()
+    assert _account_names(client, writer) == {"Not replicated", "Written"}
+    assert (routing.replica_reads, routing.pinned_reads) == (1, 1)
\ No newline at end of file
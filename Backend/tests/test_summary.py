@@ -0,0 +1,18 @@
+def test_gap_filling_is_bounded(client, register):
+    _, headers = register()
+    assert client.post("/transactions/", headers=headers, json={
+        "amount": 5, "transaction_type": "expense", "date": "2024-01-15",
+    }).status_code == 201
+
+    params = {"period": "month", "date_from": "2024-01-01", "date_to": "2024-03-31"}
+    response = client.get("/transactions/summary", headers=headers, params=params)
+    assert response.status_code == 200, response.text
+    assert [bucket["period"] for bucket in response.json()["buckets"]] == ["2024-01-01", "2024-02-01", "2024-03-01"]
+
+    params = {"period": "day", "date_from": "0001-01-01", "date_to": "9999-12-31"}
+    response = client.get("/transactions/summary", headers=headers, params=params)
+    assert response.status_code == 400
+    assert "fill_gaps=false" in response.json()["detail"]
+
+    response = client.get("/transactions/summary", headers=headers, params={**params, "fill_gaps": "false"})
+    assert response.status_code == 200 and len(response.json()["buckets"]) == 1
\ No newline at end of file